@@ -0,0 +1,34 @@
+"""
+Shared helpers for CLI commands.
+"""
+
+import functools
+import logging
+
+import click
+
+
+def cli_safe(message: str):
+    """Report unexpected command errors and exit with status 1.
+
+    Click's own exits, aborts and usage errors are passed through untouched.
+
+    Args:
+        message: Prefix for the logged error, e.g. "Sync failed"
+
+    Returns:
+        Decorator for a Click command callback
+    """
+    def decorator(fn):
+        @functools.wraps(fn)
+        def wrapper(*args, **kwargs):
+            try:
+                return fn(*args, **kwargs)
+            except (click.exceptions.Exit, click.Abort, click.ClickException):
+                raise
+            except Exception as e:
+                logging.getLogger(fn.__module__).error(f"{message}: {e}")
+                click.echo(f"Error: {e}")
+                click.get_current_context().exit(1)
+        return wrapper
+    return decorator
@@ -0,0 +1,54 @@
+"""
+Implementation of the sync commands.
+
+Kept separate from ``not_warrior.cli.sync`` so the sync engine and hook
+machinery are only imported when a sync command actually runs.
+"""
+
+import click
+
+
+def do_run(dry_run: bool, direction: str) -> None:
+    """Perform manual synchronization.
+    
+    Args:
+        dry_run: Show what would be synced without making changes
+        direction: Sync direction ('both', 'to-notion', 'to-taskwarrior')
+    """
+    # TODO: Initialize sync engine
+    # TODO: Perform sync based on direction
+    # TODO: Display sync results
+    click.echo(f"Sync {'(dry-run) ' if dry_run else ''}completed: {direction}")
+
+
+def do_status() -> None:
+    """Show sync status and statistics."""
+    # TODO: Display last sync time
+    # TODO: Show sync statistics
+    # TODO: Display any pending changes
+    click.echo("Sync status: Not implemented")
+
+
+def do_install_hook(force: bool) -> None:
+    """Install Taskwarrior hook for automatic sync.
+    
+    Args:
+        force: Force reinstall if hook already exists
+    """
+    # TODO: Install hook script
+    # TODO: Set up hook configuration
+    click.echo("Hook installed successfully!")
+
+
+def do_remove_hook() -> None:
+    """Remove Taskwarrior hook."""
+    # TODO: Remove hook script
+    # TODO: Clean up hook configuration
+    click.echo("Hook removed successfully!")
+
+
+def do_conflicts() -> None:
+    """Show and resolve sync conflicts."""
+    # TODO: Display current conflicts
+    # TODO: Provide resolution options
+    click.echo("Conflicts: Not implemented")
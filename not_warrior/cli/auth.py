@@ -3,11 +3,7 @@ Authentication commands for managing Notion API tokens.
 """
 
 import click
-from not_warrior.core.notion_client import NotionClient
-from not_warrior.utils.config_manager import ConfigManager
-from not_warrior.utils.logger import get_logger
-
-logger = get_logger(__name__)
+from not_warrior.cli._common import cli_safe
 
 
 @click.group()
@@ -18,56 +14,38 @@ def auth():
 
 @auth.command()
 @click.option('--token', prompt=True, hide_input=True, help='Notion API token')
-@click.pass_context
-def setup(ctx, token):
+@cli_safe("Authentication setup failed")
+def setup(token):
     """Setup Notion API authentication."""
-    try:
-        # TODO: Validate token with Notion API
-        # TODO: Save token to config
-        click.echo("Authentication setup successful!")
-    except Exception as e:
-        logger.error(f"Authentication setup failed: {e}")
-        click.echo(f"Error: {e}")
-        ctx.exit(1)
+    # TODO: Validate token with Notion API
+    #       (import NotionClient here, not at module level)
+    # TODO: Save token to config
+    #       (import ConfigManager here, not at module level)
+    click.echo("Authentication setup successful!")
 
 
 @auth.command()
-@click.pass_context
-def validate(ctx):
+@cli_safe("Authentication validation failed")
+def validate():
     """Validate current authentication."""
-    try:
-        # TODO: Check if token exists and is valid
-        # TODO: Test connection to Notion API
-        click.echo("Authentication is valid!")
-    except Exception as e:
-        logger.error(f"Authentication validation failed: {e}")
-        click.echo(f"Error: {e}")
-        ctx.exit(1)
+    # TODO: Check if token exists and is valid
+    # TODO: Test connection to Notion API
+    click.echo("Authentication is valid!")
 
 
 @auth.command()
-@click.pass_context
-def refresh(ctx):
+@cli_safe("Authentication refresh failed")
+def refresh():
     """Refresh authentication tokens."""
-    try:
-        # TODO: Refresh token if needed
-        # TODO: Update config with new token
-        click.echo("Authentication refreshed!")
-    except Exception as e:
-        logger.error(f"Authentication refresh failed: {e}")
-        click.echo(f"Error: {e}")
-        ctx.exit(1)
+    # TODO: Refresh token if needed
+    # TODO: Update config with new token
+    click.echo("Authentication refreshed!")
 
 
 @auth.command()
-@click.pass_context
-def status(ctx):
+@cli_safe("Failed to get auth status")
+def status():
     """Show authentication status."""
-    try:
-        # TODO: Display current auth status
-        # TODO: Show token expiration if applicable
-        click.echo("Authentication status: Not implemented")
-    except Exception as e:
-        logger.error(f"Failed to get auth status: {e}")
-        click.echo(f"Error: {e}")
-        ctx.exit(1)
\ No newline at end of file
+    # TODO: Display current auth status
+    # TODO: Show token expiration if applicable
+    click.echo("Authentication status: Not implemented")
@@ -2,14 +2,59 @@
 Main CLI entry point with Click command groups.
 """
 
+import importlib
+
 import click
-from not_warrior.cli.auth import auth
-from not_warrior.cli.sync import sync
-from not_warrior.cli.config import config
-from not_warrior.utils.logger import setup_logger
+from not_warrior import __version__
+
+
+class LazyGroup(click.Group):
+    """Click group that imports subcommand modules only when invoked."""
+
+    # Command name -> (module path, attribute name, short help)
+    lazy_commands = {
+        "auth": ("not_warrior.cli.auth", "auth", "Manage Notion API authentication."),
+        "sync": ("not_warrior.cli.sync", "sync", "Manage synchronization between Notion and Taskwarrior."),
+        "config": ("not_warrior.cli.config", "config", "Manage configuration settings and field mappings."),
+    }
+
+    def list_commands(self, ctx):
+        """List available commands without importing them."""
+        return list(self.lazy_commands) + sorted(
+            name for name in super().list_commands(ctx) if name not in self.lazy_commands
+        )
+
+    def get_command(self, ctx, cmd_name):
+        """Import and return the requested command."""
+        if cmd_name not in self.lazy_commands:
+            return super().get_command(ctx, cmd_name)
+
+        module_path, attr_name, _ = self.lazy_commands[cmd_name]
+        module = importlib.import_module(module_path)
+        return getattr(module, attr_name)
+
+    def format_commands(self, ctx, formatter):
+        """Write the command listing using static help text.
+
+        Avoids importing every subcommand module just to render ``--help``.
+        """
+        rows = [(name, help_text) for name, (_, _, help_text) in self.lazy_commands.items()]
+
+        for name in super().list_commands(ctx):
+            if name in self.lazy_commands:
+                continue
+            cmd = super().get_command(ctx, name)
+            if cmd is None or cmd.hidden:
+                continue
+            rows.append((name, cmd.get_short_help_str(formatter.width)))
+
+        if rows:
+            with formatter.section("Commands"):
+                formatter.write_dl(rows)
 
 
-@click.group()
+@click.group(cls=LazyGroup)
+@click.version_option(__version__, '-V', '--version', prog_name='not-warrior')
 @click.option('--verbose', '-v', is_flag=True, help='Enable verbose logging')
 @click.option('--config-file', '-c', help='Path to configuration file')
 @click.pass_context
@@ -18,15 +63,22 @@ def cli(ctx, verbose, config_file):
     ctx.ensure_object(dict)
     ctx.obj['verbose'] = verbose
     ctx.obj['config_file'] = config_file
-    
-    setup_logger(verbose)
 
+    if ctx.invoked_subcommand is not None:
+        from not_warrior.utils.config_manager import get_config_manager
+        from not_warrior.utils.logger import configure_file_logging, setup_logger
+        setup_logger(verbose)
 
-# Add command groups
-cli.add_command(auth)
-cli.add_command(sync)
-cli.add_command(config)
+        # File logging comes from the config file's logging section
+        logging_config = get_config_manager(config_file).config.logging
+        if logging_config.log_file:
+            configure_file_logging(
+                logging_config.log_file,
+                max_size=logging_config.max_file_size,
+                backup_count=logging_config.backup_count,
+                rotation_mode=logging_config.rotation
+            )
 
 
 if __name__ == '__main__':
-    cli()
\ No newline at end of file
+    cli()
@@ -3,11 +3,7 @@ Sync commands for managing synchronization between Notion and Taskwarrior.
 """
 
 import click
-from not_warrior.core.sync_engine import SyncEngine
-from not_warrior.core.hooks import HookManager
-from not_warrior.utils.logger import get_logger
-
-logger = get_logger(__name__)
+from not_warrior.cli._common import cli_safe
 
 
 @click.group()
@@ -20,74 +16,42 @@ def sync():
 @click.option('--dry-run', is_flag=True, help='Show what would be synced without making changes')
 @click.option('--direction', type=click.Choice(['both', 'to-notion', 'to-taskwarrior']), 
               default='both', help='Sync direction')
-@click.pass_context
-def run(ctx, dry_run, direction):
+@cli_safe("Sync failed")
+def run(dry_run, direction):
     """Perform manual synchronization."""
-    try:
-        # TODO: Initialize sync engine
-        # TODO: Perform sync based on direction
-        # TODO: Display sync results
-        click.echo(f"Sync {'(dry-run) ' if dry_run else ''}completed: {direction}")
-    except Exception as e:
-        logger.error(f"Sync failed: {e}")
-        click.echo(f"Error: {e}")
-        ctx.exit(1)
+    from not_warrior.cli import _sync
+    _sync.do_run(dry_run, direction)
 
 
 @sync.command()
-@click.pass_context
-def status(ctx):
+@cli_safe("Failed to get sync status")
+def status():
     """Show sync status and statistics."""
-    try:
-        # TODO: Display last sync time
-        # TODO: Show sync statistics
-        # TODO: Display any pending changes
-        click.echo("Sync status: Not implemented")
-    except Exception as e:
-        logger.error(f"Failed to get sync status: {e}")
-        click.echo(f"Error: {e}")
-        ctx.exit(1)
+    from not_warrior.cli import _sync
+    _sync.do_status()
 
 
 @sync.command(name='install-hook')
 @click.option('--force', is_flag=True, help='Force reinstall if hook already exists')
-@click.pass_context
-def install_hook(ctx, force):
+@cli_safe("Hook installation failed")
+def install_hook(force):
     """Install Taskwarrior hook for automatic sync."""
-    try:
-        # TODO: Install hook script
-        # TODO: Set up hook configuration
-        click.echo("Hook installed successfully!")
-    except Exception as e:
-        logger.error(f"Hook installation failed: {e}")
-        click.echo(f"Error: {e}")
-        ctx.exit(1)
+    from not_warrior.cli import _sync
+    _sync.do_install_hook(force)
 
 
 @sync.command(name='remove-hook')
 @click.confirmation_option(prompt='Are you sure you want to remove the sync hook?')
-@click.pass_context
-def remove_hook(ctx):
+@cli_safe("Hook removal failed")
+def remove_hook():
     """Remove Taskwarrior hook."""
-    try:
-        # TODO: Remove hook script
-        # TODO: Clean up hook configuration
-        click.echo("Hook removed successfully!")
-    except Exception as e:
-        logger.error(f"Hook removal failed: {e}")
-        click.echo(f"Error: {e}")
-        ctx.exit(1)
+    from not_warrior.cli import _sync
+    _sync.do_remove_hook()
 
 
 @sync.command()
-@click.pass_context
-def conflicts(ctx):
+@cli_safe("Failed to get conflicts")
+def conflicts():
     """Show and resolve sync conflicts."""
-    try:
-        # TODO: Display current conflicts
-        # TODO: Provide resolution options
-        click.echo("Conflicts: Not implemented")
-    except Exception as e:
-        logger.error(f"Failed to get conflicts: {e}")
-        click.echo(f"Error: {e}")
-        ctx.exit(1)
\ No newline at end of file
+    from not_warrior.cli import _sync
+    _sync.do_conflicts()
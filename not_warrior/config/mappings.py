@@ -2,85 +2,103 @@
 Default field mappings between Notion and Taskwarrior.
 """
 
+import re
+import sys
+from collections import Counter
+from functools import lru_cache
 from typing import Dict, List
 from not_warrior.models.mapping import FieldMapping, FieldType, MappingConfiguration
 
 
-# Default field mappings for a typical task database
-DEFAULT_TASK_MAPPINGS = [
-    FieldMapping(
-        notion_field="Name",
-        taskwarrior_field="description",
-        field_type=FieldType.TITLE,
-        required=True
-    ),
-    FieldMapping(
-        notion_field="Status",
-        taskwarrior_field="status",
-        field_type=FieldType.SELECT,
-        value_mappings={
-            "Not started": "pending",
-            "In progress": "pending",
-            "Done": "completed",
-            "Cancelled": "deleted"
-        }
-    ),
-    FieldMapping(
-        notion_field="Priority",
-        taskwarrior_field="priority",
-        field_type=FieldType.SELECT,
-        value_mappings={
-            "Low": "L",
-            "Medium": "M",
-            "High": "H",
-            "Critical": "H"
-        }
-    ),
-    FieldMapping(
-        notion_field="Due Date",
-        taskwarrior_field="due",
-        field_type=FieldType.DATE
-    ),
-    FieldMapping(
-        notion_field="Tags",
-        taskwarrior_field="tags",
-        field_type=FieldType.MULTI_SELECT
-    ),
-    FieldMapping(
-        notion_field="Project",
-        taskwarrior_field="project",
-        field_type=FieldType.SELECT
-    )
-]
+# Value mappings shared by the templates below. _intern_mappings collapses
+# every template's copy of the same mapping back onto one dict object.
+_STATUS_VALUES_DEFAULT = {
+    "Not started": "pending",
+    "In progress": "pending",
+    "Done": "completed",
+    "Cancelled": "deleted"
+}
 
+_PRIORITY_VALUES_DEFAULT = {
+    "Low": "L",
+    "Medium": "M",
+    "High": "H",
+    "Critical": "H"
+}
 
-# Alternative mappings for different database schemas
-ALTERNATIVE_MAPPINGS = {
-    "simple": [
-        FieldMapping(
-            notion_field="Task",
-            taskwarrior_field="description",
-            field_type=FieldType.TITLE,
-            required=True
-        ),
-        FieldMapping(
-            notion_field="Done",
-            taskwarrior_field="status",
-            field_type=FieldType.CHECKBOX,
-            value_mappings={
-                "true": "completed",
-                "false": "pending"
-            }
-        ),
-        FieldMapping(
-            notion_field="Due",
-            taskwarrior_field="due",
-            field_type=FieldType.DATE
-        )
-    ],
-    "detailed": [
+_STATUS_VALUES_CHECKBOX = {
+    "true": "completed",
+    "false": "pending"
+}
+
+_STATUS_VALUES_DETAILED = {
+    "Backlog": "pending",
+    "Todo": "pending",
+    "In Progress": "pending",
+    "Review": "pending",
+    "Done": "completed",
+    "Cancelled": "deleted"
+}
+
+_PRIORITY_VALUES_PNUM = {
+    "P1": "H",
+    "P2": "M",
+    "P3": "L",
+    "P4": "L"
+}
+
+_STATUS_VALUES_GTD = {
+    "Inbox": "pending",
+    "Next Action": "pending",
+    "Waiting For": "waiting",
+    "Someday/Maybe": "pending",
+    "Done": "completed",
+    "Cancelled": "deleted"
+}
+
+_VALUE_MAPPINGS_POOL: Dict[frozenset, Dict[str, str]] = {}
+
+
+def _intern_mappings(mappings: tuple) -> tuple:
+    """Intern the value mappings of template mappings.
+    
+    The same short values ("pending", "H", ...) repeat across every
+    template, so interning lets them share one string object. Non-empty
+    value mappings with identical contents share a single dict among the
+    templates; create_default_mapping_config() hands callers their own
+    copies. Field names are already interned by FieldMapping's validators.
+    
+    Args:
+        mappings: Tuple of field mappings
+        
+    Returns:
+        Tuple of interned copies of the mappings
+    """
+    interned = []
+    for mapping in mappings:
+        value_mappings = mapping.value_mappings
+        if value_mappings:
+            key = frozenset(value_mappings.items())
+            shared = _VALUE_MAPPINGS_POOL.get(key)
+            if shared is None:
+                shared = _VALUE_MAPPINGS_POOL[key] = {
+                    sys.intern(k): sys.intern(v) for k, v in value_mappings.items()
+                }
+            value_mappings = shared
+        interned.append(mapping.copy(update={"value_mappings": value_mappings}))
+    return tuple(interned)
+
+
+@lru_cache(maxsize=None)
+def _default_task_mappings() -> tuple:
+    """Build the default field mappings for a typical task database.
+    
+    Returns:
+        Tuple of field mappings
+    """
+    return _intern_mappings((
         FieldMapping(
-            notion_field="Title",
+            notion_field="Name",
             taskwarrior_field="description",
             field_type=FieldType.TITLE,
             required=True
@@ -89,25 +107,13 @@ ALTERNATIVE_MAPPINGS = {
             notion_field="Status",
             taskwarrior_field="status",
             field_type=FieldType.SELECT,
-            value_mappings={
-                "Backlog": "pending",
-                "Todo": "pending",
-                "In Progress": "pending",
-                "Review": "pending",
-                "Done": "completed",
-                "Cancelled": "deleted"
-            }
+            value_mappings=_STATUS_VALUES_DEFAULT
         ),
         FieldMapping(
             notion_field="Priority",
             taskwarrior_field="priority",
             field_type=FieldType.SELECT,
-            value_mappings={
-                "P1": "H",
-                "P2": "M",
-                "P3": "L",
-                "P4": "L"
-            }
+            value_mappings=_PRIORITY_VALUES_DEFAULT
         ),
         FieldMapping(
             notion_field="Due Date",
@@ -115,12 +121,7 @@ ALTERNATIVE_MAPPINGS = {
             field_type=FieldType.DATE
         ),
         FieldMapping(
-            notion_field="Start Date",
-            taskwarrior_field="scheduled",
-            field_type=FieldType.DATE
-        ),
-        FieldMapping(
-            notion_field="Labels",
+            notion_field="Tags",
             taskwarrior_field="tags",
             field_type=FieldType.MULTI_SELECT
         ),
@@ -128,57 +129,143 @@ ALTERNATIVE_MAPPINGS = {
             notion_field="Project",
             taskwarrior_field="project",
             field_type=FieldType.SELECT
-        ),
-        FieldMapping(
-            notion_field="Estimate",
-            taskwarrior_field="estimate",
-            field_type=FieldType.NUMBER
         )
-    ],
-    "gtd": [  # Getting Things Done style
-        FieldMapping(
-            notion_field="Task",
-            taskwarrior_field="description",
-            field_type=FieldType.TITLE,
-            required=True
-        ),
-        FieldMapping(
-            notion_field="Status",
-            taskwarrior_field="status",
-            field_type=FieldType.SELECT,
-            value_mappings={
-                "Inbox": "pending",
-                "Next Action": "pending",
-                "Waiting For": "waiting",
-                "Someday/Maybe": "pending",
-                "Done": "completed",
-                "Cancelled": "deleted"
-            }
-        ),
-        FieldMapping(
-            notion_field="Context",
-            taskwarrior_field="tags",
-            field_type=FieldType.MULTI_SELECT
-        ),
-        FieldMapping(
-            notion_field="Area",
-            taskwarrior_field="project",
-            field_type=FieldType.SELECT
+    ))
+
+
+@lru_cache(maxsize=None)
+def _alternative_mappings() -> Dict[str, tuple]:
+    """Build alternative mappings for different database schemas.
+    
+    Returns:
+        Dictionary of mapping type to field mappings
+    """
+    alternatives = {
+        "simple": (
+            FieldMapping(
+                notion_field="Task",
+                taskwarrior_field="description",
+                field_type=FieldType.TITLE,
+                required=True
+            ),
+            FieldMapping(
+                notion_field="Done",
+                taskwarrior_field="status",
+                field_type=FieldType.CHECKBOX,
+                value_mappings=_STATUS_VALUES_CHECKBOX
+            ),
+            FieldMapping(
+                notion_field="Due",
+                taskwarrior_field="due",
+                field_type=FieldType.DATE
+            )
         ),
-        FieldMapping(
-            notion_field="Due Date",
-            taskwarrior_field="due",
-            field_type=FieldType.DATE
+        "detailed": (
+            FieldMapping(
+                notion_field="Title",
+                taskwarrior_field="description",
+                field_type=FieldType.TITLE,
+                required=True
+            ),
+            FieldMapping(
+                notion_field="Status",
+                taskwarrior_field="status",
+                field_type=FieldType.SELECT,
+                value_mappings=_STATUS_VALUES_DETAILED
+            ),
+            FieldMapping(
+                notion_field="Priority",
+                taskwarrior_field="priority",
+                field_type=FieldType.SELECT,
+                value_mappings=_PRIORITY_VALUES_PNUM
+            ),
+            FieldMapping(
+                notion_field="Due Date",
+                taskwarrior_field="due",
+                field_type=FieldType.DATE
+            ),
+            FieldMapping(
+                notion_field="Start Date",
+                taskwarrior_field="scheduled",
+                field_type=FieldType.DATE
+            ),
+            FieldMapping(
+                notion_field="Labels",
+                taskwarrior_field="tags",
+                field_type=FieldType.MULTI_SELECT
+            ),
+            FieldMapping(
+                notion_field="Project",
+                taskwarrior_field="project",
+                field_type=FieldType.SELECT
+            ),
+            FieldMapping(
+                notion_field="Estimate",
+                taskwarrior_field="estimate",
+                field_type=FieldType.NUMBER
+            )
         ),
-        FieldMapping(
-            notion_field="Waiting For",
-            taskwarrior_field="wait",
-            field_type=FieldType.DATE
+        "gtd": (  # Getting Things Done style
+            FieldMapping(
+                notion_field="Task",
+                taskwarrior_field="description",
+                field_type=FieldType.TITLE,
+                required=True
+            ),
+            FieldMapping(
+                notion_field="Status",
+                taskwarrior_field="status",
+                field_type=FieldType.SELECT,
+                value_mappings=_STATUS_VALUES_GTD
+            ),
+            FieldMapping(
+                notion_field="Context",
+                taskwarrior_field="tags",
+                field_type=FieldType.MULTI_SELECT
+            ),
+            FieldMapping(
+                notion_field="Area",
+                taskwarrior_field="project",
+                field_type=FieldType.SELECT
+            ),
+            FieldMapping(
+                notion_field="Due Date",
+                taskwarrior_field="due",
+                field_type=FieldType.DATE
+            ),
+            FieldMapping(
+                notion_field="Waiting For",
+                taskwarrior_field="wait",
+                field_type=FieldType.DATE
+            )
         )
-    ]
+    }
+    return {name: _intern_mappings(mappings) for name, mappings in alternatives.items()}
+
+
+# Template tables built on first access through the module __getattr__,
+# so importing this module does not construct any FieldMapping models
+_LAZY_TABLES = {
+    "DEFAULT_TASK_MAPPINGS": _default_task_mappings,
+    "ALTERNATIVE_MAPPINGS": _alternative_mappings
 }
 
 
+def __getattr__(name: str):
+    """Resolve lazily built template tables (PEP 562)."""
+    builder = _LAZY_TABLES.get(name)
+    if builder is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    
+    value = globals()[name] = builder()
+    return value
+
+
+def __dir__() -> List[str]:
+    """List module attributes, including lazily built tables."""
+    return sorted(set(globals()) | set(_LAZY_TABLES))
+
+
 # Common Notion property names and their typical Taskwarrior equivalents
 COMMON_FIELD_SUGGESTIONS = {
     # Title fields
@@ -254,22 +341,79 @@ TASKWARRIOR_TO_NOTION_SUGGESTIONS = {
 }
 
 
-def create_default_mapping_config(database_id: str, mapping_type: str = "default") -> MappingConfiguration:
-    """Create default mapping configuration.
+# Notion field type to use for each suggested Taskwarrior field
+_TW_TO_TYPE = {
+    "description": FieldType.TITLE,
+    "status": FieldType.SELECT,
+    "priority": FieldType.SELECT,
+    "project": FieldType.SELECT,
+    "due": FieldType.DATE,
+    "scheduled": FieldType.DATE,
+    "tags": FieldType.MULTI_SELECT,
+    "annotations": FieldType.RICH_TEXT,
+    "estimate": FieldType.NUMBER
+}
+
+# COMMON_FIELD_SUGGESTIONS resolved to (taskwarrior_field, field_type)
+_COMMON_SUGGESTIONS_FULL = {
+    notion_field: (tw_field, _TW_TO_TYPE.get(tw_field, FieldType.TEXT))
+    for notion_field, tw_field in COMMON_FIELD_SUGGESTIONS.items()
+}
+
+
+# Keyword patterns for Notion field names not in COMMON_FIELD_SUGGESTIONS.
+# Each alternative is a lookahead anchored at the start of the name, so a
+# single match() tries the keyword groups in priority order and the group
+# name of the first hit selects the suggestion.
+_FALLBACK_RE = re.compile(
+    r"(?=.*?(?P<due>date|due|deadline))"
+    r"|(?=.*?(?P<status>status|state))"
+    r"|(?=.*?(?P<priority>priority|importance))"
+    r"|(?=.*?(?P<project>project|category))"
+    r"|(?=.*?(?P<tags>tag|label))"
+    r"|(?=.*?(?P<annotations>note|comment))"
+    r"|(?=.*?(?P<estimate>estimate|time))",
+    re.DOTALL
+)
+
+_FALLBACK_SUGGESTIONS = {
+    "due": ("due", FieldType.DATE),
+    "status": ("status", FieldType.SELECT),
+    "priority": ("priority", FieldType.SELECT),
+    "project": ("project", FieldType.SELECT),
+    "tags": ("tags", FieldType.MULTI_SELECT),
+    "annotations": ("annotations", FieldType.RICH_TEXT),
+    "estimate": ("estimate", FieldType.NUMBER)
+}
+
+
+# Taskwarrior date fields that must map to DATE or DATETIME properties
+_DATE_FIELDS = frozenset({"due", "scheduled", "start", "end"})
+
+# Raw field type values, as stored on FieldMapping (use_enum_values)
+_DATE_TYPES = (FieldType.DATE.value, FieldType.DATETIME.value)
+_MULTI_SELECT_TYPE = FieldType.MULTI_SELECT.value
+_TITLE_TYPE = FieldType.TITLE.value
+
+
+@lru_cache(maxsize=32)
+def _build_mapping_config(database_id: str, mapping_type: str) -> MappingConfiguration:
+    """Build and validate a template mapping configuration.
     
     Args:
         database_id: Notion database ID
         mapping_type: Type of mapping (default, simple, detailed, gtd)
         
     Returns:
-        Mapping configuration
+        Shared mapping configuration (do not mutate)
     """
+    alternatives = _alternative_mappings()
     if mapping_type == "default":
-        mappings = DEFAULT_TASK_MAPPINGS
-    elif mapping_type in ALTERNATIVE_MAPPINGS:
-        mappings = ALTERNATIVE_MAPPINGS[mapping_type]
+        mappings = _default_task_mappings()
+    elif mapping_type in alternatives:
+        mappings = alternatives[mapping_type]
     else:
-        mappings = DEFAULT_TASK_MAPPINGS
+        mappings = _default_task_mappings()
     
     return MappingConfiguration(
         notion_database_id=database_id,
@@ -278,6 +422,29 @@ def create_default_mapping_config(database_id: str, mapping_type: str = "default
     )
 
 
+def create_default_mapping_config(database_id: str, mapping_type: str = "default") -> MappingConfiguration:
+    """Create default mapping configuration.
+    
+    The validated configuration is memoized per (database_id, mapping_type);
+    each call returns a copy with its own field mappings and value
+    mappings, so editing one configuration never leaks into another.
+    
+    Args:
+        database_id: Notion database ID
+        mapping_type: Type of mapping (default, simple, detailed, gtd)
+        
+    Returns:
+        Mapping configuration
+    """
+    config = _build_mapping_config(database_id, mapping_type)
+    # Fresh value mapping dicts; the interned strings inside stay shared
+    mappings = [
+        mapping.copy(update={"value_mappings": dict(mapping.value_mappings)})
+        for mapping in config.mappings
+    ]
+    return config.copy(update={"mappings": mappings})
+
+
 def suggest_mapping_for_notion_field(notion_field: str) -> tuple[str, FieldType]:
     """Suggest Taskwarrior field and type for Notion field.
     
@@ -288,45 +455,17 @@ def suggest_mapping_for_notion_field(notion_field: str) -> tuple[str, FieldType]
         Tuple of (taskwarrior_field, field_type)
     """
     # Check common suggestions
-    if notion_field in COMMON_FIELD_SUGGESTIONS:
-        tw_field = COMMON_FIELD_SUGGESTIONS[notion_field]
-        
-        # Determine field type based on Taskwarrior field
-        if tw_field == "description":
-            return tw_field, FieldType.TITLE
-        elif tw_field in ["status", "priority", "project"]:
-            return tw_field, FieldType.SELECT
-        elif tw_field in ["due", "scheduled"]:
-            return tw_field, FieldType.DATE
-        elif tw_field == "tags":
-            return tw_field, FieldType.MULTI_SELECT
-        elif tw_field == "annotations":
-            return tw_field, FieldType.RICH_TEXT
-        elif tw_field == "estimate":
-            return tw_field, FieldType.NUMBER
-        else:
-            return tw_field, FieldType.TEXT
+    suggestion = _COMMON_SUGGESTIONS_FULL.get(notion_field)
+    if suggestion is not None:
+        return suggestion
     
     # Default suggestion based on common patterns
-    notion_lower = notion_field.lower()
+    match = _FALLBACK_RE.match(notion_field.lower())
+    if match:
+        return _FALLBACK_SUGGESTIONS[match.lastgroup]
     
-    if "date" in notion_lower or "due" in notion_lower or "deadline" in notion_lower:
-        return "due", FieldType.DATE
-    elif "status" in notion_lower or "state" in notion_lower:
-        return "status", FieldType.SELECT
-    elif "priority" in notion_lower or "importance" in notion_lower:
-        return "priority", FieldType.SELECT
-    elif "project" in notion_lower or "category" in notion_lower:
-        return "project", FieldType.SELECT
-    elif "tag" in notion_lower or "label" in notion_lower:
-        return "tags", FieldType.MULTI_SELECT
-    elif "note" in notion_lower or "comment" in notion_lower:
-        return "annotations", FieldType.RICH_TEXT
-    elif "estimate" in notion_lower or "time" in notion_lower:
-        return "estimate", FieldType.NUMBER
-    else:
-        # Default to description field
-        return "description", FieldType.TITLE
+    # Default to description field
+    return "description", FieldType.TITLE
 
 
 def suggest_notion_field_for_taskwarrior(tw_field: str) -> tuple[str, FieldType]:
@@ -392,39 +531,47 @@ def validate_mapping_compatibility(mappings: List[FieldMapping]) -> List[str]:
     Returns:
         List of validation errors
     """
+    notion_counts = Counter()
+    tw_counts = Counter()
+    has_description = False
+    type_errors = []
+    
+    # Count fields and check field type compatibility in one pass
+    for mapping in mappings:
+        tw_field = mapping.taskwarrior_field
+        notion_counts[mapping.notion_field] += 1
+        tw_counts[tw_field] += 1
+        
+        if tw_field in _DATE_FIELDS:
+            if mapping.field_type not in _DATE_TYPES:
+                type_errors.append(f"Field '{tw_field}' should use DATE or DATETIME type")
+        
+        elif tw_field == "tags":
+            if mapping.field_type != _MULTI_SELECT_TYPE:
+                type_errors.append(f"Field '{tw_field}' should use MULTI_SELECT type")
+        
+        elif tw_field == "description":
+            has_description = True
+            if mapping.field_type != _TITLE_TYPE:
+                type_errors.append(f"Field '{tw_field}' should use TITLE type")
+    
     errors = []
     
     # Check for required fields
-    has_description = any(m.taskwarrior_field == "description" for m in mappings)
     if not has_description:
         errors.append("Missing required mapping for 'description' field")
     
     # Check for duplicate Notion fields
-    notion_fields = [m.notion_field for m in mappings]
-    duplicates = set([f for f in notion_fields if notion_fields.count(f) > 1])
+    duplicates = [f for f, n in notion_counts.items() if n > 1]
     if duplicates:
         errors.append(f"Duplicate Notion fields: {', '.join(duplicates)}")
     
     # Check for duplicate Taskwarrior fields
-    tw_fields = [m.taskwarrior_field for m in mappings]
-    duplicates = set([f for f in tw_fields if tw_fields.count(f) > 1])
+    duplicates = [f for f, n in tw_counts.items() if n > 1]
     if duplicates:
         errors.append(f"Duplicate Taskwarrior fields: {', '.join(duplicates)}")
     
-    # Check field type compatibility
-    for mapping in mappings:
-        if mapping.taskwarrior_field in ["due", "scheduled", "start", "end"]:
-            if mapping.field_type not in [FieldType.DATE, FieldType.DATETIME]:
-                errors.append(f"Field '{mapping.taskwarrior_field}' should use DATE or DATETIME type")
-        
-        elif mapping.taskwarrior_field == "tags":
-            if mapping.field_type != FieldType.MULTI_SELECT:
-                errors.append(f"Field '{mapping.taskwarrior_field}' should use MULTI_SELECT type")
-        
-        elif mapping.taskwarrior_field == "description":
-            if mapping.field_type != FieldType.TITLE:
-                errors.append(f"Field '{mapping.taskwarrior_field}' should use TITLE type")
-    
+    errors.extend(type_errors)
     return errors
 
 
@@ -434,25 +581,26 @@ def get_mapping_templates() -> Dict[str, Dict]:
     Returns:
         Dictionary of mapping templates
     """
+    alternatives = _alternative_mappings()
     return {
         "default": {
             "name": "Default Task Mapping",
             "description": "Standard task mapping with status, priority, due date, and tags",
-            "mappings": DEFAULT_TASK_MAPPINGS
+            "mappings": _default_task_mappings()
         },
         "simple": {
             "name": "Simple Task Mapping",
             "description": "Minimal mapping with just task name, completion status, and due date",
-            "mappings": ALTERNATIVE_MAPPINGS["simple"]
+            "mappings": alternatives["simple"]
         },
         "detailed": {
             "name": "Detailed Task Mapping",
             "description": "Comprehensive mapping with additional fields like estimates and start dates",
-            "mappings": ALTERNATIVE_MAPPINGS["detailed"]
+            "mappings": alternatives["detailed"]
         },
         "gtd": {
             "name": "Getting Things Done (GTD)",
             "description": "GTD-style mapping with contexts, areas, and waiting states",
-            "mappings": ALTERNATIVE_MAPPINGS["gtd"]
+            "mappings": alternatives["gtd"]
         }
     }
\ No newline at end of file
@@ -3,23 +3,75 @@ Default settings, environment variables, and configuration constants.
 """
 
 import os
+import re
+from functools import lru_cache
 from pathlib import Path
-from typing import Dict, Any, List
+from types import MappingProxyType
+from typing import Dict, Any, FrozenSet, List, Optional
 
 # Application information
 APP_NAME = "not-warrior"
 APP_VERSION = "0.1.0"
 APP_DESCRIPTION = "Notion-Taskwarrior Synchronization Service"
 
+
+def _freeze(value: Any) -> Any:
+    """Make a nested constant read-only.
+    
+    Dicts become MappingProxyType views and lists become tuples.
+    
+    Args:
+        value: Constant to freeze
+        
+    Returns:
+        Read-only equivalent of value
+    """
+    if isinstance(value, dict):
+        return MappingProxyType({k: _freeze(v) for k, v in value.items()})
+    if isinstance(value, list):
+        return tuple(_freeze(v) for v in value)
+    return value
+
+
 # Environment variables
 ENV_NOTION_TOKEN = "NOTION_API_TOKEN"
 ENV_CONFIG_FILE = "NOT_WARRIOR_CONFIG"
 ENV_DATA_DIR = "NOT_WARRIOR_DATA_DIR"
 ENV_LOG_LEVEL = "NOT_WARRIOR_LOG_LEVEL"
 ENV_LOG_FILE = "NOT_WARRIOR_LOG_FILE"
+ENV_DEV_MODE = "NOT_WARRIOR_DEV"
+
+# Environment variables read by the getters below
+_ENV_KEYS = (
+    ENV_NOTION_TOKEN,
+    ENV_CONFIG_FILE,
+    ENV_DATA_DIR,
+    ENV_LOG_LEVEL,
+    ENV_LOG_FILE,
+    ENV_DEV_MODE,
+    'XDG_CONFIG_HOME',
+    'XDG_DATA_HOME',
+    'XDG_CACHE_HOME',
+    'TASKDATA'
+)
+
+
+def _snapshot_env() -> Dict[str, Optional[str]]:
+    """Read the environment variables used by settings.
+    
+    Returns:
+        Mapping of variable name to value, or None if unset
+    """
+    return {key: os.environ.get(key) for key in _ENV_KEYS}
+
+
+_ENV = _snapshot_env()
+
+# Home directory, resolved once
+_HOME = Path.home()
 
 # Default configuration values
-DEFAULT_CONFIG = {
+DEFAULT_CONFIG = _freeze({
     "notion": {
         "api_version": "2022-06-28",
         "timeout": 30,
@@ -36,6 +88,7 @@ DEFAULT_CONFIG = {
         "auto_sync": False,
         "conflict_resolution": "manual",
         "sync_interval_minutes": 15,
+        "max_concurrency": 10,
         "backup_before_sync": True,
         "backup_count": 5
     },
@@ -45,7 +98,7 @@ DEFAULT_CONFIG = {
         "backup_count": 5,
         "format": "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
     }
-}
+})
 
 # Notion API settings
 NOTION_API_BASE_URL = "https://api.notion.com/v1"
@@ -57,11 +110,16 @@ NOTION_TIMEOUT = 30  # seconds
 TASKWARRIOR_DEFAULT_COMMAND = "task"
 TASKWARRIOR_NOTION_TAG = "notion"
 TASKWARRIOR_DATE_FORMAT = "%Y%m%dT%H%M%SZ"
+TASKWARRIOR_LAMPORT_UDA = "notion_lamport"
+TASKWARRIOR_HASH_UDA = "notion_hash"
 
 # Sync settings
-SYNC_DIRECTIONS = ["both", "to-notion", "to-taskwarrior"]
-CONFLICT_RESOLUTIONS = ["manual", "notion", "taskwarrior"]
+SYNC_DIRECTIONS = ("both", "to-notion", "to-taskwarrior")
+CONFLICT_RESOLUTIONS = ("manual", "notion", "taskwarrior")
 DEFAULT_SYNC_INTERVAL = 15  # minutes
+NOTION_LAMPORT_PROPERTY = "lamport"  # Number property holding the page's Lamport counter
+NOTION_HASH_PROPERTY = "hash"  # Text property holding the page's content hash
+SYNC_STATE_FILE_NAME = "sync_state.json"
 
 # File and directory settings
 CONFIG_FILE_NAME = "config.yml"
@@ -71,10 +129,11 @@ BACKUP_DIR_NAME = "backups"
 
 # Hook settings
 HOOK_SCRIPT_NAME = "on-modify-notion-sync"
-HOOK_EVENTS = ["on-add", "on-modify", "on-delete"]
+HOOK_EVENTS = ("on-add", "on-modify", "on-delete")
 
 # Logging settings
-LOG_LEVELS = ["DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL"]
+LOG_LEVELS = ("DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL")
+_LOG_LEVELS_SET = frozenset(LOG_LEVELS)
 DEFAULT_LOG_LEVEL = "INFO"
 DEFAULT_LOG_FORMAT = "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
 DEFAULT_LOG_DATE_FORMAT = "%Y-%m-%d %H:%M:%S"
@@ -85,22 +144,25 @@ MAX_BACKUP_COUNT = 5
 MAX_CONFIG_FILE_SIZE = 1024 * 1024  # 1MB
 
 # Validation patterns
-UUID_PATTERN = r'^[0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12}$'
-NOTION_TOKEN_PATTERN = r'^secret_[A-Za-z0-9]+$'
-NOTION_DATABASE_ID_PATTERN = r'^[0-9a-f]{8}[0-9a-f]{4}[0-9a-f]{4}[0-9a-f]{4}[0-9a-f]{12}$'
+UUID_RE = re.compile(r'^[0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12}$')
+NOTION_TOKEN_RE = re.compile(r'^secret_[A-Za-z0-9]+$')
+NOTION_DATABASE_ID_RE = re.compile(r'^[0-9a-f]{8}[0-9a-f]{4}[0-9a-f]{4}[0-9a-f]{4}[0-9a-f]{12}$')
+UUID_PATTERN = UUID_RE.pattern
+NOTION_TOKEN_PATTERN = NOTION_TOKEN_RE.pattern
+NOTION_DATABASE_ID_PATTERN = NOTION_DATABASE_ID_RE.pattern
 
 # Default field mappings
-DEFAULT_FIELD_MAPPINGS = {
+DEFAULT_FIELD_MAPPINGS = _freeze({
     "title": "description",
     "status": "status",
     "priority": "priority",
     "due_date": "due",
     "tags": "tags",
     "project": "project"
-}
+})
 
 # Notion field types
-NOTION_FIELD_TYPES = {
+NOTION_FIELD_TYPES = _freeze({
     "title": "title",
     "rich_text": "rich_text",
     "number": "number",
@@ -117,19 +179,19 @@ NOTION_FIELD_TYPES = {
     "created_by": "created_by",
     "last_edited_time": "last_edited_time",
     "last_edited_by": "last_edited_by"
-}
+})
 
 # Taskwarrior field types
-TASKWARRIOR_FIELD_TYPES = {
+TASKWARRIOR_FIELD_TYPES = _freeze({
     "string": ["description", "project", "status"],
     "date": ["due", "scheduled", "start", "end", "entry", "modified"],
     "duration": ["estimate"],
     "numeric": ["priority", "urgency"],
     "list": ["tags", "depends"]
-}
+})
 
 # Status mappings
-STATUS_MAPPINGS = {
+STATUS_MAPPINGS = _freeze({
     "notion_to_taskwarrior": {
         "Not started": "pending",
         "In progress": "pending",
@@ -142,10 +204,10 @@ STATUS_MAPPINGS = {
         "deleted": "Cancelled",
         "waiting": "In progress"
     }
-}
+})
 
 # Priority mappings
-PRIORITY_MAPPINGS = {
+PRIORITY_MAPPINGS = _freeze({
     "notion_to_taskwarrior": {
         "Low": "L",
         "Medium": "M",
@@ -158,84 +220,103 @@ PRIORITY_MAPPINGS = {
         "H": "High",
         "": "Medium"  # Default for empty priority
     }
+})
+
+
+# XDG base directory kinds: (environment variable, path under home,
+# subdirectory of the legacy ~/.not-warrior directory)
+_XDG_SPEC = {
+    'config': ('XDG_CONFIG_HOME', ('.config',), ()),
+    'data': ('XDG_DATA_HOME', ('.local', 'share'), ('data',)),
+    'cache': ('XDG_CACHE_HOME', ('.cache',), ('cache',))
 }
 
 
-def get_config_dir() -> Path:
-    """Get configuration directory path.
+@lru_cache(maxsize=1)
+def get_home_dotdirs() -> FrozenSet[str]:
+    """Get the names of hidden directories in the home directory.
+    
+    One directory scan answers every "does ~/.something exist" probe made
+    while resolving the default paths.
     
     Returns:
-        Path to configuration directory
+        Set of directory names such as '.config' or '.task'
     """
-    # Check environment variable first
-    if ENV_CONFIG_FILE in os.environ:
-        config_file = Path(os.environ[ENV_CONFIG_FILE])
-        return config_file.parent
+    try:
+        with os.scandir(_HOME) as entries:
+            return frozenset(
+                entry.name for entry in entries
+                if entry.name.startswith('.') and entry.is_dir()
+            )
+    except OSError:
+        return frozenset()
+
+
+@lru_cache(maxsize=None)
+def _xdg(kind: str) -> Path:
+    """Resolve an XDG base directory for the application.
     
-    # Try XDG config directory
-    xdg_config_home = os.environ.get('XDG_CONFIG_HOME')
-    if xdg_config_home:
-        return Path(xdg_config_home) / APP_NAME
+    Uses $XDG_*_HOME if set, otherwise the XDG default under the home
+    directory. Falls back to ~/.not-warrior when the XDG default's top-level
+    directory (e.g. ~/.config) is missing and the legacy directory exists.
     
-    # Default to ~/.config/not-warrior
-    home = Path.home()
-    config_dir = home / '.config' / APP_NAME
+    Args:
+        kind: Directory kind ('config', 'data' or 'cache')
+        
+    Returns:
+        Path to the application directory of that kind
+    """
+    env_var, rel, legacy_rel = _XDG_SPEC[kind]
+    
+    xdg_home = _ENV[env_var]
+    if xdg_home:
+        return Path(xdg_home) / APP_NAME
+    
+    home = _HOME
+    dotdirs = get_home_dotdirs()
+    if rel[0] not in dotdirs and f'.{APP_NAME}' in dotdirs:
+        return home.joinpath(f'.{APP_NAME}', *legacy_rel)
     
-    # Fall back to ~/.not-warrior if .config doesn't exist
-    if not config_dir.parent.exists() and (home / f'.{APP_NAME}').exists():
-        return home / f'.{APP_NAME}'
+    return home.joinpath(*rel, APP_NAME)
+
+
+@lru_cache(maxsize=1)
+def get_config_dir() -> Path:
+    """Get configuration directory path.
     
-    return config_dir
+    Returns:
+        Path to configuration directory
+    """
+    config_file = _ENV[ENV_CONFIG_FILE]
+    if config_file is not None:
+        return Path(config_file).parent
+    return _xdg('config')
 
 
+@lru_cache(maxsize=1)
 def get_data_dir() -> Path:
     """Get data directory path.
     
     Returns:
         Path to data directory
     """
-    # Check environment variable first
-    if ENV_DATA_DIR in os.environ:
-        return Path(os.environ[ENV_DATA_DIR])
-    
-    # Try XDG data directory
-    xdg_data_home = os.environ.get('XDG_DATA_HOME')
-    if xdg_data_home:
-        return Path(xdg_data_home) / APP_NAME
-    
-    # Default to ~/.local/share/not-warrior
-    home = Path.home()
-    data_dir = home / '.local' / 'share' / APP_NAME
-    
-    # Fall back to ~/.not-warrior/data if .local doesn't exist
-    if not data_dir.parent.parent.exists() and (home / f'.{APP_NAME}').exists():
-        return home / f'.{APP_NAME}' / 'data'
-    
-    return data_dir
+    data_dir = _ENV[ENV_DATA_DIR]
+    if data_dir is not None:
+        return Path(data_dir)
+    return _xdg('data')
 
 
+@lru_cache(maxsize=1)
 def get_cache_dir() -> Path:
     """Get cache directory path.
     
     Returns:
         Path to cache directory
     """
-    # Try XDG cache directory
-    xdg_cache_home = os.environ.get('XDG_CACHE_HOME')
-    if xdg_cache_home:
-        return Path(xdg_cache_home) / APP_NAME
-    
-    # Default to ~/.cache/not-warrior
-    home = Path.home()
-    cache_dir = home / '.cache' / APP_NAME
-    
-    # Fall back to ~/.not-warrior/cache if .cache doesn't exist
-    if not cache_dir.parent.exists() and (home / f'.{APP_NAME}').exists():
-        return home / f'.{APP_NAME}' / 'cache'
-    
-    return cache_dir
+    return _xdg('cache')
 
 
+@lru_cache(maxsize=1)
 def get_log_dir() -> Path:
     """Get log directory path.
     
@@ -246,6 +327,7 @@ def get_log_dir() -> Path:
     return get_data_dir() / 'logs'
 
 
+@lru_cache(maxsize=1)
 def get_backup_dir() -> Path:
     """Get backup directory path.
     
@@ -261,7 +343,7 @@ def get_notion_token() -> str:
     Returns:
         Notion API token or empty string
     """
-    return os.environ.get(ENV_NOTION_TOKEN, '')
+    return _ENV[ENV_NOTION_TOKEN] or ''
 
 
 def get_log_level() -> str:
@@ -270,8 +352,11 @@ def get_log_level() -> str:
     Returns:
         Log level string
     """
-    level = os.environ.get(ENV_LOG_LEVEL, DEFAULT_LOG_LEVEL)
-    return level.upper() if level.upper() in LOG_LEVELS else DEFAULT_LOG_LEVEL
+    level = _ENV[ENV_LOG_LEVEL]
+    if level is None:
+        level = DEFAULT_LOG_LEVEL
+    level = level.upper()
+    return level if level in _LOG_LEVELS_SET else DEFAULT_LOG_LEVEL
 
 
 def get_log_file() -> str:
@@ -280,23 +365,40 @@ def get_log_file() -> str:
     Returns:
         Log file path or empty string
     """
-    return os.environ.get(ENV_LOG_FILE, '')
+    return _ENV[ENV_LOG_FILE] or ''
+
+
+_DIRS_CREATED = False
 
 
 def create_directories() -> None:
-    """Create necessary directories."""
-    directories = [
-        get_config_dir(),
-        get_data_dir(),
-        get_cache_dir(),
-        get_log_dir(),
-        get_backup_dir()
-    ]
+    """Create necessary directories.
+    
+    Only runs once per process (until the path cache is invalidated).
+    """
+    global _DIRS_CREATED
+    if _DIRS_CREATED:
+        return
+    
+    directories = {
+        str(get_config_dir()),
+        str(get_data_dir()),
+        str(get_cache_dir()),
+        str(get_log_dir()),
+        str(get_backup_dir())
+    }
     
+    # Parents are created along with their subdirectories, so only the
+    # deepest paths need a makedirs call
     for directory in directories:
-        directory.mkdir(parents=True, exist_ok=True)
+        prefix = directory + os.sep
+        if not any(other.startswith(prefix) for other in directories):
+            os.makedirs(directory, exist_ok=True)
+    
+    _DIRS_CREATED = True
 
 
+@lru_cache(maxsize=1)
 def get_taskwarrior_data_dir() -> Path:
     """Get Taskwarrior data directory.
     
@@ -304,14 +406,15 @@ def get_taskwarrior_data_dir() -> Path:
         Path to Taskwarrior data directory
     """
     # Check TASKDATA environment variable
-    taskdata = os.environ.get('TASKDATA')
+    taskdata = _ENV['TASKDATA']
     if taskdata:
         return Path(taskdata)
     
     # Default to ~/.task
-    return Path.home() / '.task'
+    return _HOME / '.task'
 
 
+@lru_cache(maxsize=1)
 def get_taskwarrior_hooks_dir() -> Path:
     """Get Taskwarrior hooks directory.
     
@@ -321,13 +424,47 @@ def get_taskwarrior_hooks_dir() -> Path:
     return get_taskwarrior_data_dir() / 'hooks'
 
 
+def _invalidate_path_cache() -> None:
+    """Clear cached directory paths.
+    
+    Call after changing the environment variables the directory getters
+    read, e.g. in tests.
+    """
+    global _DIRS_CREATED
+    for getter in (
+        get_home_dotdirs,
+        _xdg,
+        get_config_dir,
+        get_data_dir,
+        get_cache_dir,
+        get_log_dir,
+        get_backup_dir,
+        get_taskwarrior_data_dir,
+        get_taskwarrior_hooks_dir
+    ):
+        getter.cache_clear()
+    _DIRS_CREATED = False
+
+
+def refresh_env() -> None:
+    """Re-read environment variables and clear cached directory paths.
+    
+    Settings snapshot the environment and home directory at import;
+    long-running processes call this to pick up changes.
+    """
+    global _ENV, _HOME
+    _ENV = _snapshot_env()
+    _HOME = Path.home()
+    _invalidate_path_cache()
+
+
 def is_development_mode() -> bool:
     """Check if running in development mode.
     
     Returns:
         True if in development mode
     """
-    return os.environ.get('NOT_WARRIOR_DEV', '').lower() in ('1', 'true', 'yes')
+    return (_ENV[ENV_DEV_MODE] or '').lower() in ('1', 'true', 'yes')
 
 
 def get_user_agent() -> str:
@@ -339,11 +476,29 @@ def get_user_agent() -> str:
     return f"{APP_NAME}/{APP_VERSION}"
 
 
+# Characters dropped when normalizing a Notion database ID
+_DB_ID_STRIP = str.maketrans('', '', '-{}')
+
+
+def canonical_db_id(value: str) -> str:
+    """Normalize a Notion database ID to 32 lowercase hex digits.
+    
+    Accepts dashed UUIDs and brace-wrapped forms.
+    
+    Args:
+        value: Database ID as entered by the user
+        
+    Returns:
+        Database ID without dashes or braces, lowercased
+    """
+    return value.translate(_DB_ID_STRIP).lower()
+
+
 # Configuration validation rules
-VALIDATION_RULES = {
+VALIDATION_RULES = _freeze({
     "notion.api_token": {
         "required": True,
-        "pattern": NOTION_TOKEN_PATTERN,
+        "pattern": NOTION_TOKEN_RE,
         "error": "Notion API token must start with 'secret_'"
     },
     "notion.timeout": {
@@ -370,10 +525,10 @@ VALIDATION_RULES = {
         "choices": LOG_LEVELS,
         "error": f"Log level must be one of: {', '.join(LOG_LEVELS)}"
     }
-}
+})
 
 # Help text for configuration options
-CONFIG_HELP = {
+CONFIG_HELP = _freeze({
     "notion.api_token": "Your Notion API integration token",
     "notion.api_version": "Notion API version to use",
     "notion.timeout": "Timeout for API requests in seconds",
@@ -385,4 +540,4 @@ CONFIG_HELP = {
     "sync.conflict_resolution": "How to handle sync conflicts",
     "logging.level": "Log level (DEBUG, INFO, WARNING, ERROR, CRITICAL)",
     "logging.log_file": "Path to log file (empty for stdout only)"
-}
\ No newline at end of file
+})
\ No newline at end of file
@@ -7,14 +7,69 @@ import shutil
 import stat
 from pathlib import Path
 from typing import Dict, List, Optional
+from not_warrior.config.settings import get_home_dotdirs
 from not_warrior.utils.logger import get_logger
 
 logger = get_logger(__name__)
 
+_HOME = Path.home()
+
+# Script installed as the Taskwarrior hook
+_HOOK_SCRIPT = '''#!/usr/bin/env python3
+"""
+Taskwarrior hook for not-warrior synchronization.
+Generated automatically - do not edit manually.
+"""
+
+import sys
+import json
+import subprocess
+from pathlib import Path
+
+def main():
+    """Hook entry point."""
+    try:
+        # Read task data from stdin
+        old_task = json.loads(sys.stdin.readline())
+        new_task = json.loads(sys.stdin.readline())
+        
+        # Check if task has notion tag
+        if "notion" in new_task.get("tags", []):
+            # Bump the Lamport counter unless the writer (a sync) set it
+            if new_task.get("notion_lamport") == old_task.get("notion_lamport"):
+                new_task["notion_lamport"] = int(old_task.get("notion_lamport") or 0) + 1
+            
+            # Trigger sync
+            subprocess.run(["not-warrior", "sync", "run", "--direction", "to-notion"], 
+                         capture_output=True)
+        
+        # Output modified task
+        print(json.dumps(new_task))
+        
+    except Exception as e:
+        # Log error but don't fail the task operation
+        with open(Path.home() / ".task" / "hook.log", "a") as f:
+            f.write(f"Hook error: {e}\\n")
+        
+        # Pass through the new task
+        if 'new_task' in locals():
+            print(json.dumps(new_task))
+
+if __name__ == "__main__":
+    main()
+'''
+
 
 class HookManager:
     """Manager for Taskwarrior hooks."""
     
+    # Common hook directories as (home dotdir they live in, path)
+    _DEFAULT_HOOK_LOCATIONS = (
+        (".task", _HOME / ".task" / "hooks"),
+        (".taskrc", _HOME / ".taskrc" / "hooks"),
+        (None, Path("/usr/share/task/hooks"))
+    )
+    
     def __init__(self, hook_dir: Optional[str] = None):
         """Initialize hook manager.
         
@@ -33,21 +88,26 @@ class HookManager:
         """
         # TODO: Detect Taskwarrior data directory
         # TODO: Handle different OS configurations
-        home = Path.home()
-        
-        # Try common locations
-        locations = [
-            home / ".task" / "hooks",
-            home / ".taskrc" / "hooks",
-            Path("/usr/share/task/hooks")
-        ]
+        dotdirs = get_home_dotdirs()
         
-        for location in locations:
-            if location.exists():
+        # Try common locations, skipping home dotdirs known to be missing
+        for dotdir, location in self._DEFAULT_HOOK_LOCATIONS:
+            if (dotdir is None or dotdir in dotdirs) and location.exists():
                 return location
         
         # Default to ~/.task/hooks
-        return home / ".task" / "hooks"
+        return self._DEFAULT_HOOK_LOCATIONS[0][1]
+    
+    def _stat(self) -> Optional[os.stat_result]:
+        """Stat the hook script.
+        
+        Returns:
+            Stat result, or None if the hook path does not exist
+        """
+        try:
+            return os.stat(self.hook_path)
+        except (FileNotFoundError, NotADirectoryError):
+            return None
     
     def is_hook_installed(self) -> bool:
         """Check if hook is installed.
@@ -55,7 +115,8 @@ class HookManager:
         Returns:
             True if hook is installed
         """
-        return self.hook_path.exists() and self.hook_path.is_file()
+        st = self._stat()
+        return st is not None and stat.S_ISREG(st.st_mode)
     
     def install_hook(self, force: bool = False) -> bool:
         """Install Taskwarrior hook.
@@ -74,21 +135,22 @@ class HookManager:
             # Create hook directory if it doesn't exist
             self.hook_dir.mkdir(parents=True, exist_ok=True)
             
-            # Generate hook script
-            hook_script = self._generate_hook_script()
-            
-            # Write hook script
-            with open(self.hook_path, 'w') as f:
-                f.write(hook_script)
-            
-            # Make executable
-            self.hook_path.chmod(self.hook_path.stat().st_mode | stat.S_IEXEC)
-            
-            logger.info(f"Hook installed at {self.hook_path}")
+            # Write hook script, creating it executable
+            fd = os.open(self.hook_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o755)
+            try:
+                os.write(fd, self._generate_hook_script().encode())
+                # The mode passed to os.open is masked by the umask and does
+                # not apply to an existing file
+                if hasattr(os, "fchmod"):
+                    os.fchmod(fd, 0o755)
+            finally:
+                os.close(fd)
+            
+            logger.info("Hook installed at %s", self.hook_path)
             return True
             
         except Exception as e:
-            logger.error(f"Failed to install hook: {e}")
+            logger.error("Failed to install hook: %s", e)
             return False
     
     def remove_hook(self) -> bool:
@@ -107,7 +169,7 @@ class HookManager:
             return True
             
         except Exception as e:
-            logger.error(f"Failed to remove hook: {e}")
+            logger.error("Failed to remove hook: %s", e)
             return False
     
     def _generate_hook_script(self) -> str:
@@ -120,46 +182,7 @@ class HookManager:
         # TODO: Handle different hook types (on-add, on-modify, etc.)
         # TODO: Include proper error handling
         
-        script = f'''#!/usr/bin/env python3
-"""
-Taskwarrior hook for not-warrior synchronization.
-Generated automatically - do not edit manually.
-"""
-
-import sys
-import json
-import subprocess
-from pathlib import Path
-
-def main():
-    """Hook entry point."""
-    try:
-        # Read task data from stdin
-        old_task = json.loads(sys.stdin.readline())
-        new_task = json.loads(sys.stdin.readline())
-        
-        # Check if task has notion tag
-        if "notion" in new_task.get("tags", []):
-            # Trigger sync
-            subprocess.run(["not-warrior", "sync", "run", "--direction", "to-notion"], 
-                         capture_output=True)
-        
-        # Output modified task
-        print(json.dumps(new_task))
-        
-    except Exception as e:
-        # Log error but don't fail the task operation
-        with open(Path.home() / ".task" / "hook.log", "a") as f:
-            f.write(f"Hook error: {{e}}\\n")
-        
-        # Pass through the new task
-        if 'new_task' in locals():
-            print(json.dumps(new_task))
-
-if __name__ == "__main__":
-    main()
-'''
-        return script
+        return _HOOK_SCRIPT
     
     def test_hook(self) -> bool:
         """Test hook functionality.
@@ -178,7 +201,7 @@ if __name__ == "__main__":
             return True
             
         except Exception as e:
-            logger.error(f"Hook test failed: {e}")
+            logger.error("Hook test failed: %s", e)
             return False
     
     def get_hook_status(self) -> Dict[str, any]:
@@ -188,15 +211,17 @@ if __name__ == "__main__":
             Hook status details
         """
         try:
+            st = self._stat()
+            installed = st is not None and stat.S_ISREG(st.st_mode)
             return {
-                "installed": self.is_hook_installed(),
+                "installed": installed,
                 "path": str(self.hook_path),
-                "executable": self.hook_path.is_file() and os.access(self.hook_path, os.X_OK) if self.hook_path.exists() else False,
+                "executable": installed and bool(st.st_mode & 0o111),
                 "hook_dir": str(self.hook_dir),
                 "hook_name": self.hook_name
             }
         except Exception as e:
-            logger.error(f"Failed to get hook status: {e}")
+            logger.error("Failed to get hook status: %s", e)
             return {}
     
     def handle_hook_event(self, event_type: str, old_task: Dict, new_task: Dict) -> bool:
@@ -215,7 +240,7 @@ if __name__ == "__main__":
             # TODO: Determine if sync is needed
             # TODO: Trigger appropriate sync operation
             
-            logger.info(f"Hook event: {event_type}")
+            logger.info("Hook event: %s", event_type)
             
             # Check if task has notion tag
             if "notion" in new_task.get("tags", []):
@@ -225,5 +250,5 @@ if __name__ == "__main__":
             return True
             
         except Exception as e:
-            logger.error(f"Hook event handling failed: {e}")
+            logger.error("Hook event handling failed: %s", e)
             return False
\ No newline at end of file
@@ -2,33 +2,209 @@
 Notion API client for handling authentication and CRUD operations.
 """
 
-import requests
-from typing import Dict, List, Optional, Any
-from not_warrior.models.task import Task
+import asyncio
+import atexit
+import importlib.util
+import json
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import TYPE_CHECKING, Awaitable, Dict, Iterator, List, Optional, Any, Tuple
+from not_warrior.config.settings import NOTION_RATE_LIMIT, PRIORITY_MAPPINGS, STATUS_MAPPINGS, canonical_db_id
 from not_warrior.utils.logger import get_logger
 
+if TYPE_CHECKING:
+    from not_warrior.models.task import Task
+
+try:
+    import orjson
+except ImportError:  # Optional: falls back to the stdlib json module
+    orjson = None
+
 logger = get_logger(__name__)
 
+# Seconds a fetched database schema is used without revalidation
+SCHEMA_CACHE_TTL = 300
+
+# Pages requested per database query call (the API maximum)
+QUERY_PAGE_SIZE = 100
+
+# Status/priority value tables used when converting pages and tasks
+_N2T_STATUS = STATUS_MAPPINGS["notion_to_taskwarrior"]
+_T2N_STATUS = STATUS_MAPPINGS["taskwarrior_to_notion"]
+_N2T_PRIORITY = PRIORITY_MAPPINGS["notion_to_taskwarrior"]
+_T2N_PRIORITY = PRIORITY_MAPPINGS["taskwarrior_to_notion"]
+
+
+def _status_to_taskwarrior(status: str) -> str:
+    """Map a Notion status to a Taskwarrior status, defaulting to pending."""
+    return _N2T_STATUS.get(status, "pending")
+
+
+def _status_to_notion(status: str) -> str:
+    """Map a Taskwarrior status to a Notion status, defaulting to Not started."""
+    return _T2N_STATUS.get(status, "Not started")
+
+
+def _priority_to_taskwarrior(priority: str) -> str:
+    """Map a Notion priority to a Taskwarrior priority, defaulting to M."""
+    return _N2T_PRIORITY.get(priority, "M")
+
+
+def _priority_to_notion(priority: str) -> str:
+    """Map a Taskwarrior priority to a Notion priority, defaulting to Medium."""
+    return _T2N_PRIORITY.get(priority, "Medium")
+
+
+class _RateLimiter:
+    """Thread-safe limiter spacing calls evenly at a fixed rate."""
+    
+    def __init__(self, rate: float):
+        """Initialize rate limiter.
+        
+        Args:
+            rate: Maximum calls per second
+        """
+        self._interval = 1.0 / rate
+        self._next = time.monotonic()
+        self._lock = threading.Lock()
+    
+    def reserve(self) -> float:
+        """Claim the next call slot without waiting for it.
+        
+        Returns:
+            Seconds until the claimed slot starts (<= 0 if already open)
+        """
+        with self._lock:
+            now = time.monotonic()
+            wait = self._next - now
+            self._next = max(now, self._next) + self._interval
+        return wait
+    
+    def acquire(self) -> None:
+        """Block until the next call slot is available."""
+        wait = self.reserve()
+        if wait > 0:
+            time.sleep(wait)
+
 
 class NotionClient:
     """Client for interacting with Notion API."""
     
-    def __init__(self, token: str, version: str = "2022-06-28"):
+    # Sessions shared by all clients using the same (token, version)
+    _SESSIONS: Dict[Tuple[str, str], Any] = {}
+    
+    def __init__(self, token: str, version: str = "2022-06-28", session: Optional[Any] = None):
         """Initialize Notion client.
         
         Args:
             token: Notion API token
             version: API version to use
+            session: HTTP session to send requests through instead of the
+                shared one for this token, e.g. an ``httpx.Client``. The
+                caller owns it and must send the Notion auth headers.
         """
         self.token = token
         self.version = version
         self.base_url = "https://api.notion.com/v1"
-        self.session = requests.Session()
-        self.session.headers.update({
+        self.session = session if session is not None else self._get_session(token, version)
+        # httpx takes raw bodies as content= and deprecates data= for them;
+        # requests only understands data=
+        self._body_kwarg = "content" if type(self.session).__module__.split(".")[0] == "httpx" else "data"
+        
+        # Endpoint prefixes for per-object URLs
+        self._pages_url = f"{self.base_url}/pages/"
+        self._db_url = f"{self.base_url}/databases/"
+        
+        # database_id -> (fetched at, ETag, schema)
+        self._schema_cache: Dict[str, Tuple[float, Optional[str], Dict[str, Any]]] = {}
+    
+    @classmethod
+    def _get_session(cls, token: str, version: str) -> Any:
+        """Get the shared HTTP session for a token and API version.
+        
+        Reusing the session keeps its pooled connections to the API warm
+        across client instances. Requests that hit the rate limit or a
+        transient server error are retried with backoff.
+        
+        Args:
+            token: Notion API token
+            version: API version to use
+            
+        Returns:
+            requests.Session configured for the Notion API
+        """
+        key = (token, version)
+        session = cls._SESSIONS.get(key)
+        if session is not None:
+            return session
+        
+        # Imported here so commands that never talk to Notion don't pay for it
+        import requests
+        from requests.adapters import HTTPAdapter
+        from urllib3.util.retry import Retry
+        
+        session = requests.Session()
+        session.headers.update({
             "Authorization": f"Bearer {token}",
             "Notion-Version": version,
             "Content-Type": "application/json"
         })
+        adapter = HTTPAdapter(
+            pool_connections=4,
+            pool_maxsize=16,
+            max_retries=Retry(
+                total=3,
+                backoff_factor=0.5,
+                status_forcelist=[429, 500, 502, 503, 504],
+                # urllib3 leaves POST and PATCH out by default, but database
+                # queries are POSTs and page updates are PATCHes
+                allowed_methods=frozenset({"GET", "POST", "PATCH"}),
+                respect_retry_after_header=True
+            )
+        )
+        session.mount("https://", adapter)
+        
+        cls._SESSIONS[key] = session
+        return session
+    
+    @classmethod
+    def close_sessions(cls) -> None:
+        """Close all shared sessions and their pooled connections."""
+        sessions = list(cls._SESSIONS.values())
+        cls._SESSIONS.clear()
+        for session in sessions:
+            session.close()
+    
+    def _request_json(self, method: str, url: str, payload: Optional[Dict[str, Any]] = None, **kwargs) -> Any:
+        """Send a request with a JSON body.
+        
+        Args:
+            method: HTTP method
+            url: Request URL
+            payload: JSON body, or None to send no body
+            
+        Returns:
+            requests.Response
+        """
+        if payload is not None:
+            kwargs[self._body_kwarg] = orjson.dumps(payload) if orjson is not None else json.dumps(payload)
+            kwargs["headers"] = {**(kwargs.get("headers") or {}), "Content-Type": "application/json"}
+        return self.session.request(method, url, **kwargs)
+    
+    @staticmethod
+    def _parse_json(response: Any) -> Any:
+        """Parse a JSON response body.
+        
+        Args:
+            response: requests.Response
+            
+        Returns:
+            Decoded JSON
+        """
+        if orjson is not None:
+            return orjson.loads(response.content)
+        return response.json()
     
     def test_connection(self) -> bool:
         """Test connection to Notion API.
@@ -38,10 +214,10 @@ class NotionClient:
         """
         try:
             # TODO: Implement API test call
-            response = self.session.get(f"{self.base_url}/users/me")
+            response = self._request_json("GET", f"{self.base_url}/users/me")
             return response.status_code == 200
         except Exception as e:
-            logger.error(f"Connection test failed: {e}")
+            logger.error("Connection test failed: %s", e)
             return False
     
     def get_databases(self) -> List[Dict[str, Any]]:
@@ -52,30 +228,61 @@ class NotionClient:
         """
         try:
             # TODO: Implement database listing
-            response = self.session.post(f"{self.base_url}/search")
+            response = self._request_json("POST", f"{self.base_url}/search")
             # TODO: Filter for databases only
             return []
         except Exception as e:
-            logger.error(f"Failed to get databases: {e}")
+            logger.error("Failed to get databases: %s", e)
             return []
     
     def get_database_schema(self, database_id: str) -> Dict[str, Any]:
         """Get database schema/properties.
         
+        Schemas are cached for SCHEMA_CACHE_TTL seconds; after that the
+        cached copy is revalidated with its ETag.
+        
         Args:
             database_id: Database ID
             
         Returns:
             Database schema information
         """
+        database_id = canonical_db_id(database_id)
+        now = time.monotonic()
+        cached = self._schema_cache.get(database_id)
+        if cached is not None and now - cached[0] < SCHEMA_CACHE_TTL:
+            return cached[2]
+        
         try:
-            # TODO: Implement schema retrieval
-            response = self.session.get(f"{self.base_url}/databases/{database_id}")
-            return {}
+            headers = {}
+            if cached is not None and cached[1]:
+                headers["If-None-Match"] = cached[1]
+            
+            response = self._request_json("GET", self._db_url + database_id, headers=headers)
+            if response.status_code == 304 and cached is not None:
+                self._schema_cache[database_id] = (now, cached[1], cached[2])
+                return cached[2]
+            if response.status_code != 200:
+                return {}
+            
+            schema = self._parse_json(response)
+            self._schema_cache[database_id] = (now, response.headers.get("ETag"), schema)
+            return schema
         except Exception as e:
-            logger.error(f"Failed to get database schema: {e}")
+            logger.error("Failed to get database schema: %s", e)
             return {}
     
+    def invalidate_schema(self, database_id: Optional[str] = None) -> None:
+        """Drop cached database schemas.
+        
+        Args:
+            database_id: Database ID, or None to drop all cached schemas
+        """
+        if database_id is None:
+            self._schema_cache.clear()
+        else:
+            self._schema_cache.pop(canonical_db_id(database_id), None)
+    
     def query_database(self, database_id: str, filter_obj: Optional[Dict] = None) -> List[Dict[str, Any]]:
         """Query database for pages/tasks.
         
@@ -84,20 +291,49 @@ class NotionClient:
             filter_obj: Query filter
             
         Returns:
-            List of pages/tasks
+            List of pages/tasks (empty if any request fails)
         """
         try:
-            # TODO: Implement database query
-            payload = {}
-            if filter_obj:
-                payload["filter"] = filter_obj
-            
-            response = self.session.post(f"{self.base_url}/databases/{database_id}/query", json=payload)
-            return []
+            return list(self.iter_database(database_id, filter_obj))
         except Exception as e:
-            logger.error(f"Failed to query database: {e}")
+            logger.error("Failed to query database: %s", e)
             return []
     
+    def iter_database(self, database_id: str, filter_obj: Optional[Dict] = None) -> Iterator[Dict[str, Any]]:
+        """Iterate over all pages of a database query.
+        
+        Follows the query's pagination cursor, fetching up to
+        QUERY_PAGE_SIZE pages per request. A failed request raises instead
+        of ending the iteration, so callers can tell a truncated sweep from
+        a complete one.
+        
+        Args:
+            database_id: Database ID
+            filter_obj: Query filter
+            
+        Yields:
+            Page objects
+            
+        Raises:
+            RuntimeError: If the API answers with a non-200 status
+        """
+        url = self._db_url + canonical_db_id(database_id) + "/query"
+        payload: Dict[str, Any] = {"page_size": QUERY_PAGE_SIZE}
+        if filter_obj:
+            payload["filter"] = filter_obj
+        
+        while True:
+            response = self._request_json("POST", url, payload)
+            if response.status_code != 200:
+                raise RuntimeError(f"Database query returned HTTP {response.status_code}")
+            data = self._parse_json(response)
+            
+            yield from data.get("results", [])
+            
+            if not data.get("has_more") or not data.get("next_cursor"):
+                return
+            payload["start_cursor"] = data["next_cursor"]
+    
     def create_page(self, database_id: str, properties: Dict[str, Any]) -> Optional[Dict[str, Any]]:
         """Create a new page in database.
         
@@ -114,10 +350,10 @@ class NotionClient:
                 "parent": {"database_id": database_id},
                 "properties": properties
             }
-            response = self.session.post(f"{self.base_url}/pages", json=payload)
+            response = self._request_json("POST", f"{self.base_url}/pages", payload)
             return None
         except Exception as e:
-            logger.error(f"Failed to create page: {e}")
+            logger.error("Failed to create page: %s", e)
             return None
     
     def update_page(self, page_id: str, properties: Dict[str, Any]) -> Optional[Dict[str, Any]]:
@@ -131,12 +367,14 @@ class NotionClient:
             Updated page object or None
         """
         try:
-            # TODO: Implement page update
             payload = {"properties": properties}
-            response = self.session.patch(f"{self.base_url}/pages/{page_id}", json=payload)
-            return None
+            response = self._request_json("PATCH", self._pages_url + page_id, payload)
+            if response.status_code != 200:
+                logger.error("Failed to update page: HTTP %s", response.status_code)
+                return None
+            return self._parse_json(response)
         except Exception as e:
-            logger.error(f"Failed to update page: {e}")
+            logger.error("Failed to update page: %s", e)
             return None
     
     def delete_page(self, page_id: str) -> bool:
@@ -151,13 +389,57 @@ class NotionClient:
         try:
             # TODO: Implement page deletion (archiving)
             payload = {"archived": True}
-            response = self.session.patch(f"{self.base_url}/pages/{page_id}", json=payload)
+            response = self._request_json("PATCH", self._pages_url + page_id, payload)
             return response.status_code == 200
         except Exception as e:
-            logger.error(f"Failed to delete page: {e}")
+            logger.error("Failed to delete page: %s", e)
             return False
     
-    def notion_to_task(self, notion_page: Dict[str, Any]) -> Task:
+    def _map_rate_limited(self, fn, items: List[Tuple]) -> List[Any]:
+        """Call fn for each argument tuple concurrently at the API rate limit.
+        
+        Args:
+            fn: Client method to call
+            items: Argument tuples, one per call
+            
+        Returns:
+            Results in the order of items
+        """
+        if not items:
+            return []
+        
+        limiter = _RateLimiter(NOTION_RATE_LIMIT)
+        
+        def call(args):
+            limiter.acquire()
+            return fn(*args)
+        
+        with ThreadPoolExecutor(max_workers=NOTION_RATE_LIMIT * 2) as executor:
+            return list(executor.map(call, items))
+    
+    def update_pages(self, items: List[Tuple[str, Dict[str, Any]]]) -> List[Optional[Dict[str, Any]]]:
+        """Update many pages, keeping several requests in flight.
+        
+        Args:
+            items: List of (page_id, properties) pairs
+            
+        Returns:
+            Updated page objects (or None) in the order of items
+        """
+        return self._map_rate_limited(self.update_page, list(items))
+    
+    def delete_pages(self, page_ids: List[str]) -> List[bool]:
+        """Delete/archive many pages, keeping several requests in flight.
+        
+        Args:
+            page_ids: Page IDs
+            
+        Returns:
+            Success flags in the order of page_ids
+        """
+        return self._map_rate_limited(self.delete_page, [(page_id,) for page_id in page_ids])
+    
+    def notion_to_task(self, notion_page: Dict[str, Any]) -> "Task":
         """Convert Notion page to Task object.
         
         Args:
@@ -166,10 +448,13 @@ class NotionClient:
         Returns:
             Task object
         """
-        # TODO: Implement conversion logic
+        from not_warrior.models.task import Task
+        
+        # TODO: Implement conversion logic (status and priority values go
+        #       through _status_to_taskwarrior/_priority_to_taskwarrior)
         return Task()
     
-    def task_to_notion(self, task: Task) -> Dict[str, Any]:
+    def task_to_notion(self, task: "Task") -> Dict[str, Any]:
         """Convert Task object to Notion page properties.
         
         Args:
@@ -178,5 +463,218 @@ class NotionClient:
         Returns:
             Notion page properties
         """
-        # TODO: Implement conversion logic
-        return {}
\ No newline at end of file
+        # TODO: Implement conversion logic (status and priority values go
+        #       through _status_to_notion/_priority_to_notion)
+        return {}
+
+# Release pooled keep-alive connections when the process exits
+atexit.register(NotionClient.close_sessions)
+
+
+class AsyncNotionClient:
+    """Asynchronous client for issuing many Notion API calls concurrently.
+    
+    Requests are spaced to NOTION_RATE_LIMIT per second, with at most
+    max_concurrency in flight. The HTTP client and semaphore belong to the
+    event loop that first uses them and are rebuilt for a new loop; run()
+    drives a coroutine from synchronous code and closes the connections
+    afterwards.
+    
+    Requires the optional httpx dependency (``pip install not-warrior[async]``).
+    """
+    
+    def __init__(self, token: str, version: str = "2022-06-28", max_concurrency: int = 3):
+        """Initialize async Notion client.
+        
+        Args:
+            token: Notion API token
+            version: API version to use
+            max_concurrency: Maximum number of requests in flight
+        """
+        # Checked up front so a missing httpx fails here, not on first use
+        if importlib.util.find_spec("httpx") is None:
+            raise ImportError("AsyncNotionClient requires httpx: pip install not-warrior[async]")
+        
+        self.token = token
+        self.version = version
+        self.base_url = "https://api.notion.com/v1"
+        self.max_concurrency = max_concurrency
+        self._limiter = _RateLimiter(NOTION_RATE_LIMIT)
+        
+        # Bound to the event loop in _loop; see _bind_loop()
+        self.client: Optional[Any] = None
+        self._semaphore: Optional[asyncio.Semaphore] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+    
+    def _bind_loop(self) -> None:
+        """Create the HTTP client and semaphore for the running event loop.
+        
+        Both are tied to the loop they are first used in, so they are made
+        inside it rather than in __init__, and replaced when a later
+        asyncio.run() starts a new loop.
+        """
+        loop = asyncio.get_running_loop()
+        if loop is self._loop:
+            return
+        
+        import httpx
+        
+        self.client = httpx.AsyncClient(
+            http2=True,
+            headers={
+                "Authorization": f"Bearer {self.token}",
+                "Notion-Version": self.version,
+                "Content-Type": "application/json"
+            },
+            limits=httpx.Limits(max_connections=10)
+        )
+        self._semaphore = asyncio.Semaphore(self.max_concurrency)
+        self._loop = loop
+    
+    def run(self, coro: Awaitable[Any]) -> Any:
+        """Run a coroutine to completion from synchronous code.
+        
+        The HTTP connections are closed before the event loop shuts down.
+        
+        Args:
+            coro: Coroutine using this client
+            
+        Returns:
+            The coroutine's result
+        """
+        async def runner():
+            try:
+                return await coro
+            finally:
+                await self.aclose()
+        
+        return asyncio.run(runner())
+    
+    async def __aenter__(self) -> "AsyncNotionClient":
+        return self
+    
+    async def __aexit__(self, *exc_info) -> None:
+        await self.aclose()
+    
+    async def aclose(self) -> None:
+        """Close the underlying HTTP connections."""
+        client, self.client = self.client, None
+        self._semaphore = None
+        self._loop = None
+        if client is not None:
+            await client.aclose()
+    
+    async def _request(self, method: str, path: str, **kwargs) -> Any:
+        """Send a request, waiting for a free concurrency slot and rate slot.
+        
+        Args:
+            method: HTTP method
+            path: Path relative to the API base URL
+            
+        Returns:
+            httpx.Response
+        """
+        self._bind_loop()
+        async with self._semaphore:
+            wait = self._limiter.reserve()
+            if wait > 0:
+                await asyncio.sleep(wait)
+            return await self.client.request(method, f"{self.base_url}{path}", **kwargs)
+    
+    async def test_connection(self) -> bool:
+        """Test connection to Notion API.
+        
+        Returns:
+            True if connection is successful
+        """
+        try:
+            response = await self._request("GET", "/users/me")
+            return response.status_code == 200
+        except Exception as e:
+            logger.error("Connection test failed: %s", e)
+            return False
+    
+    async def get_database_schema(self, database_id: str) -> Dict[str, Any]:
+        """Get database schema/properties.
+        
+        Args:
+            database_id: Database ID
+            
+        Returns:
+            Database schema information
+        """
+        try:
+            # TODO: Implement schema retrieval
+            response = await self._request("GET", f"/databases/{canonical_db_id(database_id)}")
+            return {}
+        except Exception as e:
+            logger.error("Failed to get database schema: %s", e)
+            return {}
+    
+    async def query_database(self, database_id: str, filter_obj: Optional[Dict] = None) -> List[Dict[str, Any]]:
+        """Query database for pages/tasks.
+        
+        Args:
+            database_id: Database ID
+            filter_obj: Query filter
+            
+        Returns:
+            List of pages/tasks
+        """
+        try:
+            # TODO: Implement database query
+            payload = {}
+            if filter_obj:
+                payload["filter"] = filter_obj
+            
+            database_id = canonical_db_id(database_id)
+            response = await self._request("POST", f"/databases/{database_id}/query", json=payload)
+            return []
+        except Exception as e:
+            logger.error("Failed to query database: %s", e)
+            return []
+    
+    async def update_page(self, page_id: str, properties: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        """Update existing page.
+        
+        Args:
+            page_id: Page ID
+            properties: Updated properties
+            
+        Returns:
+            Updated page object or None
+        """
+        try:
+            payload = {"properties": properties}
+            response = await self._request("PATCH", f"/pages/{page_id}", json=payload)
+            if response.status_code != 200:
+                logger.error("Failed to update page: HTTP %s", response.status_code)
+                return None
+            return NotionClient._parse_json(response)
+        except Exception as e:
+            logger.error("Failed to update page: %s", e)
+            return None
+    
+    async def bulk_update_pages(self, updates: List[Tuple[str, Dict[str, Any]]]) -> List[Optional[Dict[str, Any]]]:
+        """Update many pages concurrently.
+        
+        Args:
+            updates: List of (page_id, properties) pairs
+            
+        Returns:
+            Updated page objects (or None) in the order of updates
+        """
+        return await asyncio.gather(
+            *(self.update_page(page_id, properties) for page_id, properties in updates)
+        )
+    
+    def update_pages(self, items: List[Tuple[str, Dict[str, Any]]]) -> List[Optional[Dict[str, Any]]]:
+        """Update many pages concurrently from synchronous code.
+        
+        Args:
+            items: List of (page_id, properties) pairs
+            
+        Returns:
+            Updated page objects (or None) in the order of items
+        """
+        return self.run(self.bulk_update_pages(list(items)))
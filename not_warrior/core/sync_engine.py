@@ -2,17 +2,53 @@
 Sync engine for bidirectional synchronization between Notion and Taskwarrior.
 """
 
-from typing import Dict, List, Optional, Tuple, Any
+import asyncio
+import hashlib
+import json
+from typing import Awaitable, Dict, List, Optional, Tuple, Any, Union
 from datetime import datetime
-from not_warrior.core.notion_client import NotionClient
+from not_warrior.config.settings import (
+    NOTION_HASH_PROPERTY, NOTION_LAMPORT_PROPERTY, SYNC_STATE_FILE_NAME,
+    TASKWARRIOR_HASH_UDA, TASKWARRIOR_LAMPORT_UDA, get_data_dir
+)
+from not_warrior.core.notion_client import AsyncNotionClient, NotionClient
 from not_warrior.core.taskwarrior_client import TaskwarriorClient
 from not_warrior.models.task import Task
-from not_warrior.models.mapping import FieldMapping
+from not_warrior.models.mapping import MappingConfiguration
+from not_warrior.utils.helpers import write_file_atomic
 from not_warrior.utils.logger import get_logger
 
+try:
+    import orjson
+except ImportError:  # Optional: falls back to the stdlib json module
+    orjson = None
+
+try:
+    import xxhash
+except ImportError:  # Optional: content hashes fall back to blake2b
+    xxhash = None
+
 logger = get_logger(__name__)
 
 
+def content_hash(fields: Dict[str, Any]) -> str:
+    """Hash mapped task fields independently of key order.
+    
+    Args:
+        fields: Mapped task data
+        
+    Returns:
+        64-bit hash as 16 hex digits
+    """
+    if orjson is not None:
+        blob = orjson.dumps(fields, option=orjson.OPT_SORT_KEYS, default=str)
+    else:
+        blob = json.dumps(fields, sort_keys=True, separators=(",", ":"), default=str).encode()
+    if xxhash is not None:
+        return xxhash.xxh3_64_hexdigest(blob)
+    return hashlib.blake2b(blob, digest_size=8).hexdigest()
+
+
 class SyncConflict:
     """Represents a sync conflict between Notion and Taskwarrior."""
     
@@ -27,26 +63,50 @@ class SyncConflict:
 class SyncEngine:
     """Engine for synchronizing tasks between Notion and Taskwarrior."""
     
-    def __init__(self, notion_client: NotionClient, tw_client: TaskwarriorClient, 
-                 field_mapping: FieldMapping):
+    def __init__(self, notion_client: Union[NotionClient, AsyncNotionClient], tw_client: TaskwarriorClient, 
+                 field_mapping: MappingConfiguration, max_concurrency: int = 10):
         """Initialize sync engine.
         
         Args:
-            notion_client: Notion API client
+            notion_client: Notion API client (sync or async)
             tw_client: Taskwarrior client
-            field_mapping: Field mapping configuration
+            field_mapping: Mapping configuration for the synced database
+            max_concurrency: Maximum concurrent Notion requests (SyncConfig.max_concurrency)
         """
         self.notion = notion_client
         self.taskwarrior = tw_client
         self.field_mapping = field_mapping
-        self.conflicts: List[SyncConflict] = []
+        self.max_concurrency = max_concurrency
+        
+        # Task ID -> conflict. dict.setdefault in _add_conflict is atomic, so
+        # recording a conflict needs no lock (threading or asyncio).
+        self.conflicts: Dict[str, SyncConflict] = {}
+        
+        # Notion page ID -> page, filled by the database sweep of a sync run
+        self._notion_pages: Dict[str, Dict[str, Any]] = {}
+        
+        # Persisted between runs in <data_dir>/sync_state.json
+        self._state: Dict[str, Any] = self._load_sync_state()
+        
+        # Notion page ID -> {"notion": n, "tw": t[, "hash": h]} at the last merge
+        self._merged: Dict[str, Dict[str, Any]] = self._state.setdefault("merged", {})
+        
+        # Direction -> ISO timestamp of the last successful sync in that direction
+        self._last_sync: Dict[str, str] = self._state.setdefault("last_sync", {})
     
-    def sync_all(self, direction: str = "both", dry_run: bool = False) -> Dict[str, Any]:
+    def sync_all(self, direction: str = "both", dry_run: bool = False,
+                 stream: bool = False, full: bool = False) -> Dict[str, Any]:
         """Perform full synchronization.
         
+        Unless full is set, each direction only looks at tasks changed
+        since its last successful sync.
+        
         Args:
             direction: Sync direction ('both', 'to-notion', 'to-taskwarrior')
             dry_run: If True, show what would be synced without making changes
+            stream: If True, stream Taskwarrior tasks instead of loading them
+                all up front
+            full: If True, ignore the last sync times and scan every task
             
         Returns:
             Sync results summary
@@ -61,20 +121,35 @@ class SyncEngine:
             "dry_run": dry_run
         }
         
+        if not self.taskwarrior.available:
+            results["errors"] += 1
+            return results
+        
         try:
+            # Start from fresh Taskwarrior data. The full index is only
+            # exported if a lookup needs it (ensure_snapshot()), so streamed
+            # and modified.after: delta runs stay proportional to the delta
+            self.taskwarrior.invalidate_snapshot()
+            
             if direction in ["both", "to-notion"]:
                 # TODO: Sync from Taskwarrior to Notion
-                tw_results = self._sync_to_notion(dry_run)
+                tw_results = self._sync_to_notion(dry_run, stream, None if full else self._since("to-notion"))
                 results["synced_to_notion"] = tw_results["synced"]
                 results["errors"] += tw_results["errors"]
+                self._advance_last_sync("to-notion", tw_results, dry_run)
             
             if direction in ["both", "to-taskwarrior"]:
                 # TODO: Sync from Notion to Taskwarrior
-                notion_results = self._sync_to_taskwarrior(dry_run)
+                notion_results = self._sync_to_taskwarrior(dry_run, None if full else self._since("to-taskwarrior"))
                 results["synced_to_taskwarrior"] = notion_results["synced"]
                 results["errors"] += notion_results["errors"]
+                self._advance_last_sync("to-taskwarrior", notion_results, dry_run)
             
             results["conflicts"] = len(self.conflicts)
+            
+            if not dry_run:
+                self._save_sync_state()
+            
             logger.info(f"Sync completed: {results}")
             
         except Exception as e:
@@ -83,37 +158,93 @@ class SyncEngine:
         
         return results
     
-    def _sync_to_notion(self, dry_run: bool) -> Dict[str, int]:
+    def _since(self, direction: str) -> Optional[datetime]:
+        """Get the time of the last successful sync in a direction.
+        
+        Args:
+            direction: 'to-notion' or 'to-taskwarrior'
+            
+        Returns:
+            Last sync time or None if that direction never completed
+        """
+        stamp = self._last_sync.get(direction)
+        return datetime.fromisoformat(stamp) if stamp else None
+    
+    def _advance_last_sync(self, direction: str, results: Dict[str, Any], dry_run: bool) -> None:
+        """Move a direction's last sync time up to the newest applied change.
+        
+        Nothing moves after a dry run, a run with errors, or a run that
+        applied no changes, so later runs never skip unapplied tasks.
+        
+        Args:
+            direction: 'to-notion' or 'to-taskwarrior'
+            results: Direction results with "errors" and "watermark"
+            dry_run: Whether the run was a dry run
+        """
+        watermark = results.get("watermark")
+        if watermark is not None and not results["errors"] and not dry_run:
+            self._last_sync[direction] = watermark.isoformat()
+    
+    @staticmethod
+    def _applied_watermark(stamps: List[Optional[datetime]], applied: List[Any]) -> Optional[datetime]:
+        """Get the newest modification time among the changes that were applied.
+        
+        Args:
+            stamps: Modification time of the source item behind each change
+            applied: Truthy result for each change that was applied
+            
+        Returns:
+            Newest applied modification time or None
+        """
+        return max((stamp for stamp, ok in zip(stamps, applied) if ok and stamp is not None), default=None)
+    
+    def _sync_to_notion(self, dry_run: bool, stream: bool = False,
+                        since: Optional[datetime] = None) -> Dict[str, int]:
         """Sync tasks from Taskwarrior to Notion.
         
         Args:
             dry_run: If True, don't make actual changes
+            stream: If True, iterate tasks as they are parsed from the export
+            since: Only consider tasks modified after this time
             
         Returns:
-            Sync results
+            Sync results, with the newest applied task modification time
+            as "watermark"
         """
-        results = {"synced": 0, "errors": 0}
+        results = {"synced": 0, "errors": 0, "watermark": None}
         
         try:
             # TODO: Get Taskwarrior tasks that need syncing
-            tw_tasks = self.taskwarrior.get_notion_tasks()
+            if stream:
+                tw_tasks = self.taskwarrior.iter_notion_tasks(since)
+            else:
+                tw_tasks = self.taskwarrior.get_notion_tasks(since)
+            
+            # (page_id, properties) updates, sent together after the loop,
+            # and the parsed "modified" time of the task behind each one
+            page_updates: List[Tuple[str, Dict[str, Any]]] = []
+            page_stamps: List[Optional[datetime]] = []
             
             for tw_task in tw_tasks:
                 try:
                     # TODO: Check if task exists in Notion
                     # TODO: Determine if sync is needed
                     # TODO: Handle conflicts
-                    # TODO: Perform sync
-                    
-                    if not dry_run:
-                        # TODO: Actually sync the task
-                        pass
+                    # TODO: Stamp both sides with the _record_merge() counter
+                    # TODO: Queue the page update in page_updates and
+                    #       parse_taskwarrior_datetime(tw_task["modified"])
+                    #       in page_stamps
                     
                     results["synced"] += 1
                     
                 except Exception as e:
                     logger.error(f"Failed to sync task to Notion: {e}")
                     results["errors"] += 1
+            
+            if page_updates and not dry_run:
+                updated = self._update_pages(page_updates)
+                results["errors"] += sum(1 for page in updated if page is None)
+                results["watermark"] = self._applied_watermark(page_stamps, updated)
         
         except Exception as e:
             logger.error(f"Failed to sync to Notion: {e}")
@@ -121,38 +252,61 @@ class SyncEngine:
         
         return results
     
-    def _sync_to_taskwarrior(self, dry_run: bool) -> Dict[str, int]:
+    def _sync_to_taskwarrior(self, dry_run: bool, since: Optional[datetime] = None) -> Dict[str, int]:
         """Sync tasks from Notion to Taskwarrior.
         
         Args:
             dry_run: If True, don't make actual changes
+            since: Only consider pages edited after this time
             
         Returns:
-            Sync results
+            Sync results, with the newest applied page edit time as
+            "watermark"
         """
-        results = {"synced": 0, "errors": 0}
+        results = {"synced": 0, "errors": 0, "watermark": None}
         
         try:
             # TODO: Get Notion tasks that need syncing
-            # TODO: Query configured database
-            notion_tasks = []
+            # TODO: Sweep the database with the async client as well
+            if not isinstance(self.notion, NotionClient):
+                raise NotImplementedError("Database sweep is not supported with AsyncNotionClient yet")
+            
+            database_id = self.field_mapping.notion_database_id
+            filter_obj = None
+            if since is not None:
+                filter_obj = {"timestamp": "last_edited_time", "last_edited_time": {"after": since.isoformat()}}
+            # A failed page request raises out of the loop below, so a
+            # truncated sweep counts as an error and keeps the watermark
+            notion_tasks = self.notion.iter_database(database_id, filter_obj)
+            
+            # Taskwarrior task data, imported in one batch after the loop,
+            # and the parsed "last_edited_time" of the page behind each one
+            tw_upserts: List[Dict[str, Any]] = []
+            tw_stamps: List[Optional[datetime]] = []
             
             for notion_task in notion_tasks:
+                self._notion_pages[notion_task["id"]] = notion_task
                 try:
                     # TODO: Check if task exists in Taskwarrior
+                    #       (self.taskwarrior.ensure_snapshot())
                     # TODO: Determine if sync is needed
                     # TODO: Handle conflicts
-                    # TODO: Perform sync
-                    
-                    if not dry_run:
-                        # TODO: Actually sync the task
-                        pass
+                    # TODO: Stamp both sides with the _record_merge() counter
+                    # TODO: Queue the task data in tw_upserts and
+                    #       parse_notion_datetime(notion_task["last_edited_time"])
+                    #       in tw_stamps
                     
                     results["synced"] += 1
                     
                 except Exception as e:
                     logger.error(f"Failed to sync task to Taskwarrior: {e}")
                     results["errors"] += 1
+            
+            if tw_upserts and not dry_run:
+                if self.taskwarrior.bulk_upsert(tw_upserts):
+                    results["watermark"] = self._applied_watermark(tw_stamps, [True] * len(tw_stamps))
+                else:
+                    results["errors"] += 1
         
         except Exception as e:
             logger.error(f"Failed to sync to Taskwarrior: {e}")
@@ -160,6 +314,38 @@ class SyncEngine:
         
         return results
     
+    def _update_pages(self, page_updates: List[Tuple[str, Dict[str, Any]]]) -> List[Optional[Dict[str, Any]]]:
+        """Send queued Notion page updates concurrently.
+        
+        Args:
+            page_updates: List of (page_id, properties) pairs
+            
+        Returns:
+            Updated page objects (or None) in the order of page_updates
+        """
+        if isinstance(self.notion, AsyncNotionClient):
+            return self.notion.run(self._gather_bounded(
+                [self.notion.update_page(page_id, properties) for page_id, properties in page_updates]
+            ))
+        return self.notion.update_pages(page_updates)
+    
+    async def _gather_bounded(self, coros: List[Awaitable[Any]]) -> List[Any]:
+        """Await coroutines concurrently, at most max_concurrency at a time.
+        
+        Args:
+            coros: Coroutines to run
+            
+        Returns:
+            Results in the order of coros
+        """
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+        
+        async def guarded(coro):
+            async with semaphore:
+                return await coro
+        
+        return await asyncio.gather(*(guarded(coro) for coro in coros))
+    
     def detect_conflicts(self) -> List[SyncConflict]:
         """Detect conflicts between Notion and Taskwarrior tasks.
         
@@ -169,15 +355,39 @@ class SyncEngine:
         conflicts = []
         
         try:
-            # TODO: Compare tasks from both systems
-            # TODO: Detect modification conflicts
+            tw_by_page = {
+                tw_task["notion_id"]: tw_task
+                for tw_task in self.taskwarrior.ensure_snapshot().values()
+                if tw_task.get("notion_id")
+            }
+            
+            for page_id, notion_task in self._notion_pages.items():
+                tw_task = tw_by_page.get(page_id)
+                if tw_task is None:
+                    continue
+                
+                if self._is_concurrent(page_id, notion_task, tw_task):
+                    conflict = SyncConflict(page_id, notion_task, tw_task, "modified")
+                    conflicts.append(conflict)
+                    self._add_conflict(conflict)
+            
             # TODO: Detect deletion conflicts
-            pass
         except Exception as e:
             logger.error(f"Failed to detect conflicts: {e}")
         
         return conflicts
     
+    def _add_conflict(self, conflict: SyncConflict) -> bool:
+        """Record a conflict unless one is already recorded for the task.
+        
+        Args:
+            conflict: Conflict to record
+            
+        Returns:
+            True if the conflict was added
+        """
+        return self.conflicts.setdefault(conflict.task_id, conflict) is conflict
+    
     def resolve_conflict(self, conflict: SyncConflict, resolution: str) -> bool:
         """Resolve a sync conflict.
         
@@ -198,8 +408,9 @@ class SyncEngine:
                 pass
             elif resolution == "manual":
                 # Requires manual intervention
-                pass
+                return True
             
+            self.conflicts.pop(conflict.task_id, None)
             return True
         except Exception as e:
             logger.error(f"Failed to resolve conflict: {e}")
@@ -237,10 +448,113 @@ class SyncEngine:
         Returns:
             True if sync is needed
         """
-        # TODO: Compare modification times
-        # TODO: Compare field values
-        # TODO: Check for conflicts
-        return False
+        notion_hash = self._notion_hash(notion_task)
+        tw_hash = tw_task.get(TASKWARRIOR_HASH_UDA)
+        if notion_hash and tw_hash:
+            return notion_hash != tw_hash
+        
+        return self._notion_clock(notion_task) != self._tw_clock(tw_task)
+    
+    @staticmethod
+    def _notion_hash(notion_task: Dict) -> Optional[str]:
+        """Read the content hash stored on a Notion page.
+        
+        Args:
+            notion_task: Notion page data
+            
+        Returns:
+            Hash string or None
+        """
+        prop = notion_task.get("properties", {}).get(NOTION_HASH_PROPERTY) or {}
+        text = prop.get("rich_text") or ()
+        return text[0].get("plain_text") if text else None
+    
+    @staticmethod
+    def _notion_clock(notion_task: Dict) -> int:
+        """Read the Lamport counter of a Notion page.
+        
+        Args:
+            notion_task: Notion page data
+            
+        Returns:
+            Counter value, 0 if the page has none
+        """
+        prop = notion_task.get("properties", {}).get(NOTION_LAMPORT_PROPERTY) or {}
+        return int(prop.get("number") or 0)
+    
+    @staticmethod
+    def _tw_clock(tw_task: Dict) -> int:
+        """Read the Lamport counter of a Taskwarrior task.
+        
+        Args:
+            tw_task: Taskwarrior task data
+            
+        Returns:
+            Counter value, 0 if the task has none
+        """
+        return int(tw_task.get(TASKWARRIOR_LAMPORT_UDA) or 0)
+    
+    def _is_concurrent(self, page_id: str, notion_task: Dict, tw_task: Dict) -> bool:
+        """Check whether both sides changed since the last merge.
+        
+        Args:
+            page_id: Notion page ID
+            notion_task: Notion page data
+            tw_task: Taskwarrior task data
+            
+        Returns:
+            True if neither version descends from the other
+        """
+        merged = self._merged.get(page_id)
+        if merged is None:
+            return False
+        return (self._notion_clock(notion_task) > merged["notion"]
+                and self._tw_clock(tw_task) > merged["tw"])
+    
+    def _record_merge(self, page_id: str, notion_task: Dict, tw_task: Dict,
+                      fields_hash: Optional[str] = None) -> int:
+        """Record that a task pair was merged and return the counter to write.
+        
+        Both sides should be written with the returned value (and
+        fields_hash) so the next run sees them as equal.
+        
+        Args:
+            page_id: Notion page ID
+            notion_task: Notion page data
+            tw_task: Taskwarrior task data
+            fields_hash: content_hash() of the merged fields
+            
+        Returns:
+            Merged Lamport counter
+        """
+        clock = max(self._notion_clock(notion_task), self._tw_clock(tw_task)) + 1
+        self._merged[page_id] = {"notion": clock, "tw": clock}
+        if fields_hash is not None:
+            self._merged[page_id]["hash"] = fields_hash
+        return clock
+    
+    def _load_sync_state(self) -> Dict[str, Any]:
+        """Load the persisted sync state from the data directory.
+        
+        Returns:
+            Sync state with "merged" counters and "last_sync" times
+        """
+        path = get_data_dir() / SYNC_STATE_FILE_NAME
+        try:
+            if path.exists():
+                return json.loads(path.read_text())
+        except Exception as e:
+            logger.error(f"Failed to load sync state: {e}")
+        return {}
+    
+    def _save_sync_state(self) -> None:
+        """Write the sync state to the data directory."""
+        path = get_data_dir() / SYNC_STATE_FILE_NAME
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            write_file_atomic(path, json.dumps(self._state).encode('utf-8'))
+        except Exception as e:
+            logger.error(f"Failed to save sync state: {e}")
     
     def _map_fields(self, source_task: Dict, source_type: str, target_type: str) -> Dict:
         """Map fields between Notion and Taskwarrior formats.
@@ -256,4 +570,5 @@ class SyncEngine:
         # TODO: Use field mapping configuration
         # TODO: Handle type conversions
         # TODO: Handle missing fields
+        # TODO: Stamp the result with content_hash() for _record_merge()
         return {}
\ No newline at end of file
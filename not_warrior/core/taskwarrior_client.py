@@ -3,13 +3,67 @@ Taskwarrior integration for CLI interface and task operations.
 """
 
 import json
+import shutil
 import subprocess
-from typing import Dict, List, Optional, Any
+import tempfile
+from datetime import datetime, timezone
+from functools import cached_property
+from typing import Dict, Iterator, List, Optional, Any, Sequence, Union
+from not_warrior.config.settings import (
+    TASKWARRIOR_DATE_FORMAT, TASKWARRIOR_HASH_UDA, TASKWARRIOR_LAMPORT_UDA
+)
 from not_warrior.models.task import Task
 from not_warrior.utils.logger import get_logger
 
+try:
+    import orjson
+except ImportError:  # Optional: falls back to the stdlib json module
+    orjson = None
+
+try:
+    import ijson
+except ImportError:  # Optional: iter_tasks falls back to a buffered export
+    ijson = None
+
 logger = get_logger(__name__)
 
+# Read-only exports skip garbage collection, which otherwise renumbers
+# tasks and rewrites the data files on every invocation
+_EXPORT_ARGS = ("rc.gc=off", "export")
+
+
+def _export_cmd(cmd: str, filter_expr: Optional[Union[str, Sequence[str]]]) -> List[str]:
+    """Build a ``task export`` command line.
+    
+    Args:
+        cmd: Taskwarrior command
+        filter_expr: Filter expression, or a list of filter arguments
+        
+    Returns:
+        Command line arguments
+    """
+    args = [cmd, *_EXPORT_ARGS]
+    if filter_expr:
+        if isinstance(filter_expr, str):
+            args.append(filter_expr)
+        else:
+            args.extend(filter_expr)
+    return args
+
+
+def _modify_args(updates: Dict[str, Any]) -> List[str]:
+    """Build ``key:value`` modify arguments; None clears the attribute.
+    
+    argv goes straight to exec, so values need no shell quoting.
+    
+    Args:
+        updates: Updates to apply
+        
+    Returns:
+        Command line arguments
+    """
+    return [f"{key}:" if value is None else f"{key}:{value}" for key, value in updates.items()]
+
 
 class TaskwarriorClient:
     """Client for interacting with Taskwarrior."""
@@ -22,6 +76,24 @@ class TaskwarriorClient:
         """
         self.cmd = taskwarrior_cmd
         self.notion_tag = "notion"  # Tag to identify Notion-synced tasks
+        
+        # uuid -> task data from the last snapshot(); dropped on any write
+        self._index: Optional[Dict[str, Dict[str, Any]]] = None
+    
+    @cached_property
+    def available(self) -> bool:
+        """Whether Taskwarrior is usable, checked once per client.
+        
+        A command that is not on PATH fails without spawning anything;
+        otherwise the result of a single test_connection() is kept.
+        
+        Returns:
+            True if Taskwarrior is available
+        """
+        if shutil.which(self.cmd) is None:
+            logger.error(f"Taskwarrior command not found: {self.cmd}")
+            return False
+        return self.test_connection()
     
     def test_connection(self) -> bool:
         """Test if Taskwarrior is available and accessible.
@@ -37,38 +109,175 @@ class TaskwarriorClient:
             logger.error(f"Taskwarrior connection test failed: {e}")
             return False
     
-    def get_tasks(self, filter_expr: Optional[str] = None) -> List[Dict[str, Any]]:
+    def ensure_sync_udas(self) -> bool:
+        """Declare the UDAs holding each task's Lamport counter and content hash.
+        
+        Returns:
+            True if successful
+        """
+        for uda, uda_type in ((TASKWARRIOR_LAMPORT_UDA, "numeric"), (TASKWARRIOR_HASH_UDA, "string")):
+            try:
+                result = subprocess.run(
+                    [self.cmd, "rc.confirmation=no", "config", f"uda.{uda}.type", uda_type],
+                    capture_output=True, text=True
+                )
+                if result.returncode != 0:
+                    logger.error(f"Failed to configure {uda} UDA: {result.stderr}")
+                    return False
+            except Exception as e:
+                logger.error(f"Failed to configure {uda} UDA: {e}")
+                return False
+        return True
+    
+    def get_tasks(self, filter_expr: Optional[Union[str, Sequence[str]]] = None) -> List[Dict[str, Any]]:
         """Get tasks from Taskwarrior.
         
         Args:
-            filter_expr: Taskwarrior filter expression
+            filter_expr: Taskwarrior filter expression, or a list of filter arguments
             
         Returns:
             List of task dictionaries
         """
         try:
             # TODO: Build command with filter
-            cmd = [self.cmd, "export"]
-            if filter_expr:
-                cmd.append(filter_expr)
+            cmd = _export_cmd(self.cmd, filter_expr)
             
-            result = subprocess.run(cmd, capture_output=True, text=True)
+            # Keep stdout as bytes; both JSON parsers accept them directly
+            result = subprocess.run(cmd, capture_output=True)
             if result.returncode == 0:
-                return json.loads(result.stdout) if result.stdout.strip() else []
+                if not result.stdout.strip():
+                    return []
+                return orjson.loads(result.stdout) if orjson is not None else json.loads(result.stdout)
             else:
-                logger.error(f"Failed to get tasks: {result.stderr}")
+                logger.error(f"Failed to get tasks: {result.stderr.decode(errors='replace')}")
                 return []
         except Exception as e:
             logger.error(f"Failed to get tasks: {e}")
             return []
     
-    def get_notion_tasks(self) -> List[Dict[str, Any]]:
+    def iter_tasks(self, filter_expr: Optional[Union[str, Sequence[str]]] = None) -> Iterator[Dict[str, Any]]:
+        """Stream tasks from Taskwarrior one at a time.
+        
+        Parses ``task export`` output incrementally with ijson so the whole
+        export never sits in memory at once. Without ijson installed this
+        falls back to get_tasks().
+        
+        Args:
+            filter_expr: Taskwarrior filter expression, or a list of filter arguments
+            
+        Yields:
+            Task dictionaries
+        """
+        if ijson is None:
+            yield from self.get_tasks(filter_expr)
+            return
+        
+        cmd = _export_cmd(self.cmd, filter_expr)
+        
+        try:
+            # stderr goes to a file so a chatty export cannot fill the pipe
+            # and block while stdout is still being read
+            stderr_file = tempfile.TemporaryFile()
+        except Exception as e:
+            logger.error(f"Failed to get tasks: {e}")
+            return
+        try:
+            proc = subprocess.Popen(cmd, stdout=subprocess.PIPE, stderr=stderr_file)
+        except Exception as e:
+            stderr_file.close()
+            logger.error(f"Failed to get tasks: {e}")
+            return
+        
+        parse_error = None
+        count = 0
+        try:
+            try:
+                # Floats rather than Decimals, matching json.loads so content
+                # hashes and JSON serialization agree with get_tasks()
+                for task in ijson.items(proc.stdout, "item", use_float=True):
+                    count += 1
+                    yield task
+            except ijson.JSONError as e:
+                parse_error = e
+            
+            proc.wait()
+            if proc.returncode != 0:
+                stderr_file.seek(0)
+                logger.error(f"Failed to get tasks: {stderr_file.read().decode(errors='replace')}")
+            elif parse_error is not None and (count or not isinstance(parse_error, ijson.IncompleteJSONError)):
+                # An incomplete document with no items is just empty output
+                logger.error(f"Failed to get tasks: {parse_error}")
+        except Exception as e:
+            logger.error(f"Failed to get tasks: {e}")
+        finally:
+            if proc.poll() is None:
+                proc.kill()
+                proc.wait()
+            proc.stdout.close()
+            stderr_file.close()
+    
+    def snapshot(self) -> Dict[str, Dict[str, Any]]:
+        """Export all tasks once and index them by UUID.
+        
+        Until the next write through this client, get_task_by_uuid answers
+        from the index instead of running ``task export`` again.
+        
+        Returns:
+            Mapping of task UUID to task data
+        """
+        self._index = {task["uuid"]: task for task in self.get_tasks() if "uuid" in task}
+        return self._index
+    
+    def ensure_snapshot(self) -> Dict[str, Dict[str, Any]]:
+        """Get the task index, exporting all tasks only if there is none yet.
+        
+        Returns:
+            Mapping of task UUID to task data
+        """
+        if self._index is None:
+            return self.snapshot()
+        return self._index
+    
+    def invalidate_snapshot(self) -> None:
+        """Drop the task index built by snapshot()."""
+        self._index = None
+    
+    def get_notion_tasks(self, modified_after: Optional[datetime] = None) -> List[Dict[str, Any]]:
         """Get tasks tagged with notion tag.
         
+        Args:
+            modified_after: Only return tasks modified after this time
+            
         Returns:
             List of Notion-synced tasks
         """
-        return self.get_tasks(f"+{self.notion_tag}")
+        return self.get_tasks(self._notion_filter(modified_after))
+    
+    def iter_notion_tasks(self, modified_after: Optional[datetime] = None) -> Iterator[Dict[str, Any]]:
+        """Stream tasks tagged with notion tag.
+        
+        Args:
+            modified_after: Only yield tasks modified after this time
+            
+        Yields:
+            Notion-synced tasks
+        """
+        return self.iter_tasks(self._notion_filter(modified_after))
+    
+    def _notion_filter(self, modified_after: Optional[datetime] = None) -> List[str]:
+        """Build the filter selecting Notion-synced tasks.
+        
+        Args:
+            modified_after: Only match tasks modified after this time
+            
+        Returns:
+            Taskwarrior filter arguments, one per argv element
+        """
+        filter_args = [f"+{self.notion_tag}"]
+        if modified_after is not None:
+            stamp = modified_after.astimezone(timezone.utc).strftime(TASKWARRIOR_DATE_FORMAT)
+            filter_args.append(f"modified.after:{stamp}")
+        return filter_args
     
     def add_task(self, task_data: Dict[str, Any]) -> Optional[str]:
         """Add new task to Taskwarrior.
@@ -79,18 +288,15 @@ class TaskwarriorClient:
         Returns:
             Task UUID if successful
         """
+        self.invalidate_snapshot()
+        
         try:
             # TODO: Build add command from task data
-            cmd = [self.cmd, "add"]
-            
-            # Add description
-            if "description" in task_data:
-                cmd.append(task_data["description"])
-            
-            # Add other attributes
-            for key, value in task_data.items():
-                if key != "description":
-                    cmd.append(f"{key}:{value}")
+            cmd = [
+                self.cmd, "add",
+                *((task_data["description"],) if "description" in task_data else ()),
+                *(f"{key}:{value}" for key, value in task_data.items() if key != "description"),
+            ]
             
             result = subprocess.run(cmd, capture_output=True, text=True)
             if result.returncode == 0:
@@ -113,15 +319,11 @@ class TaskwarriorClient:
         Returns:
             True if successful
         """
+        self.invalidate_snapshot()
+        
         try:
             # TODO: Build modify command
-            cmd = [self.cmd, task_uuid, "modify"]
-            
-            for key, value in updates.items():
-                if value is None:
-                    cmd.append(f"{key}:")
-                else:
-                    cmd.append(f"{key}:{value}")
+            cmd = [self.cmd, task_uuid, "modify", *_modify_args(updates)]
             
             result = subprocess.run(cmd, capture_output=True, text=True)
             return result.returncode == 0
@@ -129,38 +331,130 @@ class TaskwarriorClient:
             logger.error(f"Failed to update task: {e}")
             return False
     
-    def complete_task(self, task_uuid: str) -> bool:
-        """Mark task as completed.
+    def bulk_upsert(self, tasks: List[Dict[str, Any]]) -> bool:
+        """Add or update many tasks with a single ``task import``.
+        
+        Taskwarrior matches imported tasks by UUID, so tasks with a known
+        UUID are modified and the rest are added.
         
         Args:
-            task_uuid: Task UUID
+            tasks: Task data dictionaries in Taskwarrior export format
             
         Returns:
             True if successful
         """
+        if not tasks:
+            return True
+        
+        self.invalidate_snapshot()
+        
         try:
-            result = subprocess.run([self.cmd, task_uuid, "done"], capture_output=True, text=True)
-            return result.returncode == 0
+            payload = orjson.dumps(tasks) if orjson is not None else json.dumps(tasks).encode()
+            result = subprocess.run([self.cmd, "import"], input=payload, capture_output=True)
+            if result.returncode != 0:
+                logger.error(f"Failed to import tasks: {result.stderr.decode(errors='replace')}")
+                return False
+            return True
         except Exception as e:
-            logger.error(f"Failed to complete task: {e}")
+            logger.error(f"Failed to import tasks: {e}")
             return False
     
-    def delete_task(self, task_uuid: str) -> bool:
-        """Delete task.
+    def bulk_modify(self, task_uuids: List[str], updates: Dict[str, Any]) -> bool:
+        """Apply the same updates to many tasks with one command.
         
         Args:
-            task_uuid: Task UUID
+            task_uuids: Task UUIDs
+            updates: Updates to apply
             
         Returns:
             True if successful
         """
+        if not task_uuids:
+            return True
+        
+        self.invalidate_snapshot()
+        
         try:
-            result = subprocess.run([self.cmd, task_uuid, "delete"], capture_output=True, text=True, input="yes\n")
+            cmd = [self.cmd, "rc.bulk=0", "rc.confirmation=no", ",".join(task_uuids), "modify",
+                   *_modify_args(updates)]
+            
+            result = subprocess.run(cmd, capture_output=True, text=True)
             return result.returncode == 0
         except Exception as e:
-            logger.error(f"Failed to delete task: {e}")
+            logger.error(f"Failed to modify tasks: {e}")
             return False
     
+    def bulk_complete(self, task_uuids: List[str]) -> bool:
+        """Mark many tasks as completed with one command.
+        
+        Args:
+            task_uuids: Task UUIDs
+            
+        Returns:
+            True if successful
+        """
+        return self._bulk_command(task_uuids, "done", "complete")
+    
+    def bulk_delete(self, task_uuids: List[str]) -> bool:
+        """Delete many tasks with one command.
+        
+        Args:
+            task_uuids: Task UUIDs
+            
+        Returns:
+            True if successful
+        """
+        return self._bulk_command(task_uuids, "delete", "delete")
+    
+    def _bulk_command(self, task_uuids: List[str], command: str, action: str) -> bool:
+        """Run a command on many tasks without confirmation prompts.
+        
+        Args:
+            task_uuids: Task UUIDs
+            command: Taskwarrior command ('done' or 'delete')
+            action: Verb used in error messages
+            
+        Returns:
+            True if successful
+        """
+        if not task_uuids:
+            return True
+        
+        self.invalidate_snapshot()
+        
+        try:
+            cmd = [self.cmd, "rc.bulk=0", "rc.confirmation=no", ",".join(task_uuids), command]
+            result = subprocess.run(cmd, capture_output=True, text=True, stdin=subprocess.DEVNULL)
+            if result.returncode != 0:
+                logger.error(f"Failed to {action} tasks: {result.stderr}")
+                return False
+            return True
+        except Exception as e:
+            logger.error(f"Failed to {action} tasks: {e}")
+            return False
+    
+    def complete_task(self, task_uuid: str) -> bool:
+        """Mark task as completed.
+        
+        Args:
+            task_uuid: Task UUID
+            
+        Returns:
+            True if successful
+        """
+        return self.bulk_complete([task_uuid])
+    
+    def delete_task(self, task_uuid: str) -> bool:
+        """Delete task.
+        
+        Args:
+            task_uuid: Task UUID
+            
+        Returns:
+            True if successful
+        """
+        return self.bulk_delete([task_uuid])
+    
     def get_task_by_uuid(self, task_uuid: str) -> Optional[Dict[str, Any]]:
         """Get specific task by UUID.
         
@@ -170,6 +464,9 @@ class TaskwarriorClient:
         Returns:
             Task data or None
         """
+        if self._index is not None and task_uuid in self._index:
+            return self._index[task_uuid]
+        
         tasks = self.get_tasks(task_uuid)
         return tasks[0] if tasks else None
     
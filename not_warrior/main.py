@@ -4,10 +4,17 @@ Entry point for the not-warrior CLI application.
 """
 
 import sys
-from not_warrior.cli.main import cli
+from not_warrior import __version__
 
 def main():
     """Main entry point for the CLI."""
+    # Answer --version without importing Click or any command modules
+    if len(sys.argv) == 2 and sys.argv[1] in ('-V', '--version'):
+        print(f"not-warrior, version {__version__}")
+        sys.exit(0)
+    
+    from not_warrior.cli.main import cli
+    
     try:
         cli()
     except KeyboardInterrupt:
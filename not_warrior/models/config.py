@@ -2,12 +2,76 @@
 Configuration model for sync settings, authentication, and user preferences.
 """
 
-from typing import Dict, List, Optional, Any
+import os
+from collections import Counter
+from functools import lru_cache
+from typing import Dict, List, Optional, Any, Tuple
 from pathlib import Path
-from pydantic import BaseModel, Field, validator
+from pydantic import BaseModel, Field, PrivateAttr, validator
 from not_warrior.models.mapping import MappingConfiguration
 
 
+# Directories already created by _ensure_dir in this process
+_CREATED_DIRS = set()
+
+
+def _ensure_dir(path: Path) -> Path:
+    """Create a directory the first time it is requested.
+    
+    Args:
+        path: Directory path
+        
+    Returns:
+        The same path
+    """
+    if path not in _CREATED_DIRS:
+        path.mkdir(parents=True, exist_ok=True)
+        _CREATED_DIRS.add(path)
+    return path
+
+
+@lru_cache(maxsize=1)
+def _default_config_path() -> Path:
+    """Resolve the default config file path once per process.
+    
+    Returns:
+        Path to default config file
+    """
+    # TODO: Handle different OS configurations
+    home = Path.home()
+    
+    # Try XDG config directory first
+    xdg_config = home / ".config" / "not-warrior"
+    if os.path.isdir(xdg_config) or not os.path.isdir(home / ".not-warrior"):
+        xdg_config.mkdir(parents=True, exist_ok=True)
+        return xdg_config / "config.yml"
+    
+    # Fall back to home directory
+    return home / ".not-warrior" / "config.yml"
+
+
+@lru_cache(maxsize=1)
+def _default_data_dir() -> Path:
+    """Resolve and create the default data directory once per process.
+    
+    Returns:
+        Path to default data directory
+    """
+    # TODO: Handle different OS configurations
+    home = Path.home()
+    
+    # Try XDG data directory first
+    xdg_data = home / ".local" / "share" / "not-warrior"
+    if os.path.isdir(xdg_data) or not os.path.isdir(home / ".not-warrior"):
+        xdg_data.mkdir(parents=True, exist_ok=True)
+        return xdg_data
+    
+    # Fall back to home directory
+    data_dir = home / ".not-warrior" / "data"
+    data_dir.mkdir(parents=True, exist_ok=True)
+    return data_dir
+
+
 class NotionConfig(BaseModel):
     """Notion-specific configuration."""
     
@@ -70,6 +134,9 @@ class SyncConfig(BaseModel):
     # Sync intervals
     sync_interval_minutes: int = 15
     
+    # Maximum concurrent Notion requests during a sync
+    max_concurrency: int = Field(default=10, ge=1)
+    
     # Backup settings
     backup_before_sync: bool = True
     backup_count: int = 5
@@ -88,6 +155,8 @@ class LoggingConfig(BaseModel):
     log_file: Optional[str] = None
     max_file_size: int = 10 * 1024 * 1024  # 10MB
     backup_count: int = 5
+    # "external" leaves rotation to logrotate (POSIX only)
+    rotation: str = Field(default="internal", regex="^(internal|external)$")
     
     # Output format
     format: str = "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
@@ -115,9 +184,64 @@ class AppConfig(BaseModel):
     config_file: Optional[str] = None
     data_dir: Optional[str] = None
     
+    # Database ID -> mapping index, kept in step with ``mappings``
+    _mapping_by_db: Dict[str, MappingConfiguration] = PrivateAttr(default_factory=dict)
+    
+    # The ``mappings`` list object and length the index was built from;
+    # checked before each lookup so appends and removals on the list
+    # trigger a rebuild. Replacing an item in place (``mappings[i] = m``)
+    # keeps both, so callers doing that must call ``_reindex_mappings()``.
+    _indexed_list: Optional[List[MappingConfiguration]] = PrivateAttr(default=None)
+    _indexed_len: int = PrivateAttr(default=0)
+    
+    # Bumped on every field assignment and mappings change; validate_config()
+    # results are cached against it. Edits made inside a mapping do not bump
+    # it, so call ``_reindex_mappings()`` after those too.
+    _version: int = PrivateAttr(default=0)
+    
+    # (version, api token, errors) from the last validate_config() call
+    _validation_cache: Optional[Tuple[int, Optional[str], List[str]]] = PrivateAttr(default=None)
+    
     class Config:
         extra = "forbid"
     
+    def __init__(self, **data: Any):
+        super().__init__(**data)
+        self._reindex_mappings()
+    
+    def __setattr__(self, name: str, value: Any) -> None:
+        super().__setattr__(name, value)
+        if name == "mappings":
+            self._reindex_mappings()
+        elif not name.startswith("_"):
+            self._version += 1
+    
+    def copy(self, **kwargs: Any) -> "AppConfig":
+        # copy() shares private attributes; give the copy its own index and
+        # validation cache
+        config = super().copy(**kwargs)
+        config._validation_cache = None
+        config._reindex_mappings()
+        return config
+    
+    def _reindex_mappings(self) -> None:
+        """Rebuild the database ID index from ``mappings``."""
+        mappings = self.mappings
+        index: Dict[str, MappingConfiguration] = {}
+        for mapping in mappings:
+            # First entry wins, matching the order of a linear scan
+            index.setdefault(mapping.notion_database_id, mapping)
+        self._mapping_by_db = index
+        self._indexed_list = mappings
+        self._indexed_len = len(mappings)
+        self._version += 1
+    
+    def _ensure_index(self) -> None:
+        """Rebuild the index if ``mappings`` was replaced or resized."""
+        mappings = self.mappings
+        if mappings is not self._indexed_list or len(mappings) != self._indexed_len:
+            self._reindex_mappings()
+    
     @validator('data_dir')
     def validate_data_dir(cls, v):
         """Validate data directory."""
@@ -134,17 +258,7 @@ class AppConfig(BaseModel):
         Returns:
             Path to default config file
         """
-        # TODO: Handle different OS configurations
-        home = Path.home()
-        
-        # Try XDG config directory first
-        xdg_config = home / ".config" / "not-warrior"
-        if xdg_config.exists() or not (home / ".not-warrior").exists():
-            xdg_config.mkdir(parents=True, exist_ok=True)
-            return xdg_config / "config.yml"
-        
-        # Fall back to home directory
-        return home / ".not-warrior" / "config.yml"
+        return _default_config_path()
     
     def get_default_data_dir(self) -> Path:
         """Get default data directory.
@@ -152,19 +266,7 @@ class AppConfig(BaseModel):
         Returns:
             Path to default data directory
         """
-        # TODO: Handle different OS configurations
-        home = Path.home()
-        
-        # Try XDG data directory first
-        xdg_data = home / ".local" / "share" / "not-warrior"
-        if xdg_data.exists() or not (home / ".not-warrior").exists():
-            xdg_data.mkdir(parents=True, exist_ok=True)
-            return xdg_data
-        
-        # Fall back to home directory
-        data_dir = home / ".not-warrior" / "data"
-        data_dir.mkdir(parents=True, exist_ok=True)
-        return data_dir
+        return _default_data_dir()
     
     def get_mapping_by_database_id(self, database_id: str) -> Optional[MappingConfiguration]:
         """Get mapping configuration by database ID.
@@ -175,10 +277,8 @@ class AppConfig(BaseModel):
         Returns:
             Mapping configuration or None
         """
-        for mapping in self.mappings:
-            if mapping.notion_database_id == database_id:
-                return mapping
-        return None
+        self._ensure_index()
+        return self._mapping_by_db.get(database_id)
     
     def add_mapping(self, mapping: MappingConfiguration) -> None:
         """Add mapping configuration.
@@ -186,12 +286,18 @@ class AppConfig(BaseModel):
         Args:
             mapping: Mapping configuration to add
         """
+        database_id = mapping.notion_database_id
+        
         # Remove existing mapping for the same database
-        self.mappings = [
-            m for m in self.mappings 
-            if m.notion_database_id != mapping.notion_database_id
-        ]
+        self._ensure_index()
+        if database_id in self._mapping_by_db:
+            self.mappings = [m for m in self.mappings if m.notion_database_id != database_id]
+        
+        # Append and index in place rather than rebuilding the index
         self.mappings.append(mapping)
+        self._mapping_by_db[database_id] = mapping
+        self._indexed_len = len(self.mappings)
+        self._version += 1
     
     def remove_mapping(self, database_id: str) -> bool:
         """Remove mapping by database ID.
@@ -202,16 +308,29 @@ class AppConfig(BaseModel):
         Returns:
             True if mapping was removed
         """
-        original_length = len(self.mappings)
+        self._ensure_index()
+        if database_id not in self._mapping_by_db:
+            return False
+        
+        # Reassigning ``mappings`` rebuilds the index
         self.mappings = [m for m in self.mappings if m.notion_database_id != database_id]
-        return len(self.mappings) < original_length
+        return True
     
     def validate_config(self) -> List[str]:
         """Validate entire configuration.
         
+        Results are memoized until the token, a field or the mappings
+        list changes.
+        
         Returns:
             List of validation errors
         """
+        self._ensure_index()
+        token = self.notion.api_token
+        cache = self._validation_cache
+        if cache is not None and cache[0] == self._version and cache[1] == token:
+            return list(cache[2])
+        
         errors = []
         
         # Check authentication
@@ -222,22 +341,22 @@ class AppConfig(BaseModel):
         if not self.mappings:
             errors.append("At least one database mapping is required")
         
-        # Validate each mapping
-        for i, mapping in enumerate(self.mappings):
-            mapping_errors = mapping.validate_mappings()
-            for error in mapping_errors:
-                errors.append(f"Mapping {i+1}: {error}")
+        # Validate each mapping, counting database IDs on the way
+        database_ids = Counter()
+        for i, mapping in enumerate(self.mappings, 1):
+            database_ids[mapping.notion_database_id] += 1
+            errors.extend(f"Mapping {i}: {error}" for error in mapping.validate_mappings())
         
         # Check for duplicate database IDs
-        database_ids = [m.notion_database_id for m in self.mappings]
-        if len(database_ids) != len(set(database_ids)):
+        if any(count > 1 for count in database_ids.values()):
             errors.append("Duplicate database ID mappings found")
         
         # TODO: Add more validation rules
         # TODO: Validate file paths
         # TODO: Test connections
         
-        return errors
+        self._validation_cache = (self._version, token, errors)
+        return list(errors)
     
     def is_configured(self) -> bool:
         """Check if application is properly configured.
@@ -268,6 +387,4 @@ class AppConfig(BaseModel):
             Path to backup directory
         """
         data_dir = Path(self.data_dir) if self.data_dir else self.get_default_data_dir()
-        backup_dir = data_dir / "backups"
-        backup_dir.mkdir(parents=True, exist_ok=True)
-        return backup_dir
\ No newline at end of file
+        return _ensure_dir(data_dir / "backups")
\ No newline at end of file
@@ -2,8 +2,9 @@
 Field mapping model for mapping between Notion properties and Taskwarrior attributes.
 """
 
-from typing import Dict, List, Optional, Any
-from pydantic import BaseModel, Field, validator
+import sys
+from typing import Callable, Dict, Iterable, Iterator, List, Optional, Any, Tuple
+from pydantic import BaseModel, Field, PrivateAttr, constr, validator
 from enum import Enum
 
 
@@ -23,11 +24,146 @@ class FieldType(str, Enum):
     PRIORITY = "priority"
 
 
+# Raw field type values. use_enum_values stores field_type as these plain
+# (interned) strings, so dispatch and comparisons never touch the enum.
+_FT_TEXT = FieldType.TEXT.value
+_FT_NUMBER = FieldType.NUMBER.value
+_FT_DATE = FieldType.DATE.value
+_FT_DATETIME = FieldType.DATETIME.value
+_FT_SELECT = FieldType.SELECT.value
+_FT_MULTI_SELECT = FieldType.MULTI_SELECT.value
+_FT_CHECKBOX = FieldType.CHECKBOX.value
+_FT_RICH_TEXT = FieldType.RICH_TEXT.value
+_FT_TITLE = FieldType.TITLE.value
+
+
+# Converters from Notion values, called with a non-None value
+
+def _text_n2t(mapping: "FieldMapping", value: Any) -> Any:
+    return str(value) if value else mapping.default_value
+
+
+def _rich_text_n2t(mapping: "FieldMapping", value: Any) -> Any:
+    # Extract text from Notion title / rich text object; anything not
+    # shaped like one falls through to the plain-text handling
+    try:
+        return value[0].get("text", {}).get("content", "")
+    except (IndexError, KeyError, TypeError, AttributeError):
+        return str(value) if value else mapping.default_value
+
+
+def _select_n2t(mapping: "FieldMapping", value: Any) -> Any:
+    try:
+        select_value = value.get("name", "")
+    except AttributeError:
+        return str(value) if value else mapping.default_value
+    return mapping.value_mappings.get(select_value, select_value)
+
+
+def _multi_select_n2t(mapping: "FieldMapping", value: Any) -> Any:
+    if isinstance(value, list):
+        values = [item.get("name", "") for item in value]
+        return [mapping.value_mappings.get(v, v) for v in values]
+    return mapping.default_value or []
+
+
+def _checkbox_n2t(mapping: "FieldMapping", value: Any) -> Any:
+    return bool(value)
+
+
+def _date_n2t(mapping: "FieldMapping", value: Any) -> Any:
+    try:
+        date_str = value.get("start")
+    except AttributeError:
+        return mapping.default_value
+    if date_str:
+        # TODO: Parse date/datetime and convert to Taskwarrior format
+        return date_str
+    return mapping.default_value
+
+
+def _number_n2t(mapping: "FieldMapping", value: Any) -> Any:
+    # Notion number properties are already numeric; skip the try block
+    if isinstance(value, (int, float)):
+        return float(value)
+    try:
+        return float(value)
+    except (ValueError, TypeError):
+        return mapping.default_value
+
+
+# Converters to Notion property values, called with a non-None value
+
+def _text_t2n(mapping: "FieldMapping", value: Any) -> Any:
+    return {"rich_text": [{"text": {"content": str(value)}}]}
+
+
+def _title_t2n(mapping: "FieldMapping", value: Any) -> Any:
+    return {"title": [{"text": {"content": str(value)}}]}
+
+
+def _select_t2n(mapping: "FieldMapping", value: Any) -> Any:
+    # Reverse mapping for select fields
+    reverse_mapping = mapping.reverse_value_mappings
+    return {"select": {"name": reverse_mapping.get(str(value), str(value))}}
+
+
+def _multi_select_t2n(mapping: "FieldMapping", value: Any) -> Any:
+    # Handle tags/multi-select
+    if isinstance(value, list):
+        reverse_mapping = mapping.reverse_value_mappings
+        return {"multi_select": [{"name": reverse_mapping.get(str(v), str(v))} for v in value]}
+    return {"multi_select": []}
+
+
+def _checkbox_t2n(mapping: "FieldMapping", value: Any) -> Any:
+    return {"checkbox": bool(value)}
+
+
+def _date_t2n(mapping: "FieldMapping", value: Any) -> Any:
+    # TODO: Convert Taskwarrior date/datetime to Notion format
+    return {"date": {"start": str(value)}}
+
+
+def _number_t2n(mapping: "FieldMapping", value: Any) -> Any:
+    if isinstance(value, (int, float)):
+        return {"number": float(value)}
+    try:
+        return {"number": float(value)}
+    except (ValueError, TypeError):
+        return {"number": None}
+
+
+# Field type -> converter
+_NOTION_TO_TW: Dict[str, Callable[["FieldMapping", Any], Any]] = {
+    _FT_TEXT: _text_n2t,
+    _FT_TITLE: _rich_text_n2t,
+    _FT_RICH_TEXT: _rich_text_n2t,
+    _FT_SELECT: _select_n2t,
+    _FT_MULTI_SELECT: _multi_select_n2t,
+    _FT_CHECKBOX: _checkbox_n2t,
+    _FT_DATE: _date_n2t,
+    _FT_DATETIME: _date_n2t,
+    _FT_NUMBER: _number_n2t,
+}
+
+_TW_TO_NOTION: Dict[str, Callable[["FieldMapping", Any], Any]] = {
+    _FT_TEXT: _text_t2n,
+    _FT_TITLE: _title_t2n,
+    _FT_SELECT: _select_t2n,
+    _FT_MULTI_SELECT: _multi_select_t2n,
+    _FT_CHECKBOX: _checkbox_t2n,
+    _FT_DATE: _date_t2n,
+    _FT_DATETIME: _date_t2n,
+    _FT_NUMBER: _number_t2n,
+}
+
+
 class FieldMapping(BaseModel):
     """Single field mapping between Notion and Taskwarrior."""
     
-    notion_field: str = Field(..., min_length=1)
-    taskwarrior_field: str = Field(..., min_length=1)
+    notion_field: constr(strip_whitespace=True, min_length=1)
+    taskwarrior_field: constr(strip_whitespace=True, min_length=1)
     field_type: FieldType
     
     # Transformation options
@@ -40,22 +176,34 @@ class FieldMapping(BaseModel):
     # Select/multi-select mappings
     value_mappings: Dict[str, str] = Field(default_factory=dict)
     
+    # (copy of the value_mappings it was built from, reversed mapping)
+    _reverse_cache: Optional[Tuple[Dict[str, str], Dict[str, str]]] = PrivateAttr(default=None)
+    
     class Config:
         use_enum_values = True
+        allow_mutation = False
     
-    @validator('notion_field')
-    def validate_notion_field(cls, v):
-        """Validate Notion field name."""
-        if not v or not v.strip():
-            raise ValueError('Notion field name cannot be empty')
-        return v.strip()
+    @validator('notion_field', 'taskwarrior_field')
+    def intern_field_name(cls, v):
+        """Intern field names, already stripped and checked by constr."""
+        # Interned so index lookups by field name can match on identity
+        return sys.intern(v)
     
-    @validator('taskwarrior_field')
-    def validate_taskwarrior_field(cls, v):
-        """Validate Taskwarrior field name."""
-        if not v or not v.strip():
-            raise ValueError('Taskwarrior field name cannot be empty')
-        return v.strip()
+    @property
+    def reverse_value_mappings(self) -> Dict[str, str]:
+        """Taskwarrior value -> Notion value, rebuilt when value_mappings changes.
+        
+        Returns:
+            Reversed value mappings
+        """
+        cache = self._reverse_cache
+        # Compared by content: the dict may be edited in place, and
+        # copy(update=...) carries the cache over to the copy
+        if cache is None or cache[0] != self.value_mappings:
+            value_mappings = dict(self.value_mappings)
+            cache = (value_mappings, {v: k for k, v in value_mappings.items()})
+            self._reverse_cache = cache
+        return cache[1]
     
     def convert_notion_to_taskwarrior(self, notion_value: Any) -> Any:
         """Convert Notion value to Taskwarrior format.
@@ -69,64 +217,8 @@ class FieldMapping(BaseModel):
         if notion_value is None:
             return self.default_value
         
-        # Handle different field types
-        if self.field_type == FieldType.TEXT:
-            return str(notion_value) if notion_value else self.default_value
-        
-        elif self.field_type == FieldType.TITLE:
-            # Extract text from Notion title object
-            if isinstance(notion_value, list) and notion_value:
-                return notion_value[0].get("text", {}).get("content", "")
-            return str(notion_value) if notion_value else self.default_value
-        
-        elif self.field_type == FieldType.RICH_TEXT:
-            # Extract text from Notion rich text object
-            if isinstance(notion_value, list) and notion_value:
-                return notion_value[0].get("text", {}).get("content", "")
-            return str(notion_value) if notion_value else self.default_value
-        
-        elif self.field_type == FieldType.SELECT:
-            # Handle Notion select field
-            if isinstance(notion_value, dict):
-                select_value = notion_value.get("name", "")
-                return self.value_mappings.get(select_value, select_value)
-            return str(notion_value) if notion_value else self.default_value
-        
-        elif self.field_type == FieldType.MULTI_SELECT:
-            # Handle Notion multi-select field
-            if isinstance(notion_value, list):
-                values = [item.get("name", "") for item in notion_value]
-                return [self.value_mappings.get(v, v) for v in values]
-            return self.default_value or []
-        
-        elif self.field_type == FieldType.CHECKBOX:
-            return bool(notion_value)
-        
-        elif self.field_type == FieldType.DATE:
-            # Handle Notion date field
-            if isinstance(notion_value, dict):
-                date_str = notion_value.get("start")
-                if date_str:
-                    # TODO: Parse date and convert to Taskwarrior format
-                    return date_str
-            return self.default_value
-        
-        elif self.field_type == FieldType.DATETIME:
-            # Handle Notion datetime field
-            if isinstance(notion_value, dict):
-                datetime_str = notion_value.get("start")
-                if datetime_str:
-                    # TODO: Parse datetime and convert to Taskwarrior format
-                    return datetime_str
-            return self.default_value
-        
-        elif self.field_type == FieldType.NUMBER:
-            try:
-                return float(notion_value) if notion_value is not None else self.default_value
-            except (ValueError, TypeError):
-                return self.default_value
-        
-        return notion_value
+        handler = _NOTION_TO_TW.get(self.field_type)
+        return handler(self, notion_value) if handler else notion_value
     
     def convert_taskwarrior_to_notion(self, tw_value: Any) -> Any:
         """Convert Taskwarrior value to Notion format.
@@ -140,77 +232,34 @@ class FieldMapping(BaseModel):
         if tw_value is None:
             return None
         
-        # Handle different field types
-        if self.field_type == FieldType.TEXT:
-            return {
-                "rich_text": [
-                    {
-                        "text": {
-                            "content": str(tw_value)
-                        }
-                    }
-                ]
-            }
-        
-        elif self.field_type == FieldType.TITLE:
-            return {
-                "title": [
-                    {
-                        "text": {
-                            "content": str(tw_value)
-                        }
-                    }
-                ]
-            }
-        
-        elif self.field_type == FieldType.SELECT:
-            # Reverse mapping for select fields
-            reverse_mapping = {v: k for k, v in self.value_mappings.items()}
-            mapped_value = reverse_mapping.get(str(tw_value), str(tw_value))
-            return {
-                "select": {
-                    "name": mapped_value
-                }
-            }
-        
-        elif self.field_type == FieldType.MULTI_SELECT:
-            # Handle tags/multi-select
-            if isinstance(tw_value, list):
-                reverse_mapping = {v: k for k, v in self.value_mappings.items()}
-                mapped_values = [reverse_mapping.get(str(v), str(v)) for v in tw_value]
-                return {
-                    "multi_select": [
-                        {"name": value} for value in mapped_values
-                    ]
-                }
-            return {"multi_select": []}
-        
-        elif self.field_type == FieldType.CHECKBOX:
-            return {"checkbox": bool(tw_value)}
-        
-        elif self.field_type == FieldType.DATE:
-            # TODO: Convert Taskwarrior date to Notion format
-            return {
-                "date": {
-                    "start": str(tw_value)
-                }
-            }
+        handler = _TW_TO_NOTION.get(self.field_type)
+        return handler(self, tw_value) if handler else tw_value
+    
+    def notion_to_taskwarrior_converter(self) -> Callable[[Any], Any]:
+        """Specialize convert_notion_to_taskwarrior for this mapping.
         
-        elif self.field_type == FieldType.DATETIME:
-            # TODO: Convert Taskwarrior datetime to Notion format
-            return {
-                "date": {
-                    "start": str(tw_value)
-                }
-            }
+        The handler and default are resolved once, so the returned
+        function does no dispatch per call.
         
-        elif self.field_type == FieldType.NUMBER:
-            try:
-                return {"number": float(tw_value)}
-            except (ValueError, TypeError):
-                return {"number": None}
+        Returns:
+            Function converting a Notion value to Taskwarrior format
+        """
+        handler = _NOTION_TO_TW.get(self.field_type)
+        default = self.default_value
+        if handler is None:
+            return lambda value: default if value is None else value
+        return lambda value: default if value is None else handler(self, value)
+    
+    def taskwarrior_to_notion_converter(self) -> Callable[[Any], Any]:
+        """Specialize convert_taskwarrior_to_notion for this mapping.
         
-        return tw_value
+        Returns:
+            Function converting a Taskwarrior value to Notion format
+        """
+        handler = _TW_TO_NOTION.get(self.field_type)
+        if handler is None:
+            return lambda value: value
+        return lambda value: None if value is None else handler(self, value)
 
 
 class MappingConfiguration(BaseModel):
@@ -231,9 +280,67 @@ class MappingConfiguration(BaseModel):
     notion_filter: Optional[Dict[str, Any]] = None
     taskwarrior_filter: Optional[str] = None
     
+    # The ``mappings`` list object and length the indexes below were built
+    # from; checked before each lookup so appends and removals on the list
+    # trigger a rebuild. Replacing an item in place (``mappings[i] = m``)
+    # keeps both, so callers doing that must call ``_reindex()`` themselves.
+    _indexed_list: Optional[List[FieldMapping]] = PrivateAttr(default=None)
+    _indexed_len: int = PrivateAttr(default=0)
+    
+    # Field name -> first mapping with that name
+    _by_notion: Dict[str, FieldMapping] = PrivateAttr(default_factory=dict)
+    _by_tw: Dict[str, FieldMapping] = PrivateAttr(default_factory=dict)
+    
+    # (source field, target field, specialized converter) for every mapping,
+    # in list order, so duplicate fields apply exactly as a linear scan would
+    _n2t: Tuple[Tuple[str, str, Callable[[Any], Any]], ...] = PrivateAttr(default=())
+    _t2n: Tuple[Tuple[str, str, Callable[[Any], Any]], ...] = PrivateAttr(default=())
+    
     class Config:
         use_enum_values = True
     
+    def __init__(self, **data: Any):
+        super().__init__(**data)
+        self._reindex()
+    
+    def __setattr__(self, name: str, value: Any) -> None:
+        super().__setattr__(name, value)
+        if name == "mappings":
+            self._reindex()
+    
+    def copy(self, **kwargs: Any) -> "MappingConfiguration":
+        # copy() shares private attributes; give the copy its own indexes
+        config = super().copy(**kwargs)
+        config._reindex()
+        return config
+    
+    def _reindex(self) -> None:
+        """Rebuild the field name indexes and conversion plans from ``mappings``."""
+        mappings = self.mappings
+        by_notion: Dict[str, FieldMapping] = {}
+        by_tw: Dict[str, FieldMapping] = {}
+        for mapping in mappings:
+            # First entry wins, matching the order of a linear scan
+            by_notion.setdefault(mapping.notion_field, mapping)
+            by_tw.setdefault(mapping.taskwarrior_field, mapping)
+        
+        self._indexed_list = mappings
+        self._indexed_len = len(mappings)
+        self._by_notion = by_notion
+        self._by_tw = by_tw
+        self._n2t = tuple(
+            (m.notion_field, m.taskwarrior_field, m.notion_to_taskwarrior_converter()) for m in mappings
+        )
+        self._t2n = tuple(
+            (m.taskwarrior_field, m.notion_field, m.taskwarrior_to_notion_converter()) for m in mappings
+        )
+    
+    def _ensure_index(self) -> None:
+        """Rebuild the indexes if ``mappings`` was replaced or resized."""
+        mappings = self.mappings
+        if mappings is not self._indexed_list or len(mappings) != self._indexed_len:
+            self._reindex()
+    
     @validator('notion_database_id')
     def validate_database_id(cls, v):
         """Validate Notion database ID."""
@@ -250,10 +357,8 @@ class MappingConfiguration(BaseModel):
         Returns:
             Field mapping or None
         """
-        for mapping in self.mappings:
-            if mapping.notion_field == notion_field:
-                return mapping
-        return None
+        self._ensure_index()
+        return self._by_notion.get(notion_field)
     
     def get_mapping_by_taskwarrior_field(self, tw_field: str) -> Optional[FieldMapping]:
         """Get mapping by Taskwarrior field name.
@@ -264,10 +369,8 @@ class MappingConfiguration(BaseModel):
         Returns:
             Field mapping or None
         """
-        for mapping in self.mappings:
-            if mapping.taskwarrior_field == tw_field:
-                return mapping
-        return None
+        self._ensure_index()
+        return self._by_tw.get(tw_field)
     
     def add_mapping(self, mapping: FieldMapping) -> None:
         """Add field mapping.
@@ -275,12 +378,18 @@ class MappingConfiguration(BaseModel):
         Args:
             mapping: Field mapping to add
         """
-        # Remove existing mapping for the same fields
-        self.mappings = [
-            m for m in self.mappings 
-            if m.notion_field != mapping.notion_field and m.taskwarrior_field != mapping.taskwarrior_field
-        ]
-        self.mappings.append(mapping)
+        # Remove existing mapping for the same fields; a name missing from
+        # both indexes means there is nothing to remove
+        self._ensure_index()
+        mappings = self.mappings
+        if mapping.notion_field in self._by_notion or mapping.taskwarrior_field in self._by_tw:
+            mappings = [
+                m for m in mappings 
+                if m.notion_field != mapping.notion_field and m.taskwarrior_field != mapping.taskwarrior_field
+            ]
+        
+        # Reassigning reindexes
+        self.mappings = [*mappings, mapping]
     
     def remove_mapping(self, notion_field: str) -> bool:
         """Remove mapping by Notion field name.
@@ -291,9 +400,12 @@ class MappingConfiguration(BaseModel):
         Returns:
             True if mapping was removed
         """
-        original_length = len(self.mappings)
+        self._ensure_index()
+        if notion_field not in self._by_notion:
+            return False
+        
         self.mappings = [m for m in self.mappings if m.notion_field != notion_field]
-        return len(self.mappings) < original_length
+        return True
     
     def convert_notion_to_taskwarrior(self, notion_properties: Dict[str, Any]) -> Dict[str, Any]:
         """Convert Notion properties to Taskwarrior format using mappings.
@@ -304,17 +416,45 @@ class MappingConfiguration(BaseModel):
         Returns:
             Taskwarrior task data
         """
+        self._ensure_index()
         tw_data = {}
         
-        for mapping in self.mappings:
-            if mapping.notion_field in notion_properties:
-                notion_value = notion_properties[mapping.notion_field]
-                tw_value = mapping.convert_notion_to_taskwarrior(notion_value)
+        for name, tw_field, convert in self._n2t:
+            if name in notion_properties:
+                tw_value = convert(notion_properties[name])
                 if tw_value is not None:
-                    tw_data[mapping.taskwarrior_field] = tw_value
+                    tw_data[tw_field] = tw_value
         
         return tw_data
     
+    def convert_many_n2t(self, notion_properties_iter: Iterable[Dict[str, Any]]) -> Iterator[Dict[str, Any]]:
+        """Convert many Notion property dicts to Taskwarrior format.
+        
+        Equivalent to calling convert_notion_to_taskwarrior on each item,
+        with the mapping plan resolved once for the whole batch.
+        
+        Args:
+            notion_properties_iter: Notion page properties, one dict per page
+            
+        Yields:
+            Taskwarrior task data
+        """
+        self._ensure_index()
+        plan = self._n2t
+        missing = object()
+        
+        for notion_properties in notion_properties_iter:
+            get = notion_properties.get
+            tw_data = {}
+            for name, tw_field, convert in plan:
+                notion_value = get(name, missing)
+                if notion_value is missing:
+                    continue
+                tw_value = convert(notion_value)
+                if tw_value is not None:
+                    tw_data[tw_field] = tw_value
+            yield tw_data
+    
     def convert_taskwarrior_to_notion(self, tw_data: Dict[str, Any]) -> Dict[str, Any]:
         """Convert Taskwarrior data to Notion properties using mappings.
         
@@ -324,14 +464,14 @@ class MappingConfiguration(BaseModel):
         Returns:
             Notion page properties
         """
+        self._ensure_index()
         notion_properties = {}
         
-        for mapping in self.mappings:
-            if mapping.taskwarrior_field in tw_data:
-                tw_value = tw_data[mapping.taskwarrior_field]
-                notion_value = mapping.convert_taskwarrior_to_notion(tw_value)
+        for name, notion_field, convert in self._t2n:
+            if name in tw_data:
+                notion_value = convert(tw_data[name])
                 if notion_value is not None:
-                    notion_properties[mapping.notion_field] = notion_value
+                    notion_properties[notion_field] = notion_value
         
         return notion_properties
     
@@ -343,14 +483,24 @@ class MappingConfiguration(BaseModel):
         """
         errors = []
         
-        # Check for duplicate mappings
-        notion_fields = [m.notion_field for m in self.mappings]
-        tw_fields = [m.taskwarrior_field for m in self.mappings]
-        
-        if len(notion_fields) != len(set(notion_fields)):
+        # Check for duplicate mappings in a single pass
+        seen_notion = set()
+        seen_tw = set()
+        duplicate_notion = duplicate_tw = False
+        for mapping in self.mappings:
+            if mapping.notion_field in seen_notion:
+                duplicate_notion = True
+            else:
+                seen_notion.add(mapping.notion_field)
+            if mapping.taskwarrior_field in seen_tw:
+                duplicate_tw = True
+            else:
+                seen_tw.add(mapping.taskwarrior_field)
+        
+        if duplicate_notion:
             errors.append("Duplicate Notion field mappings found")
         
-        if len(tw_fields) != len(set(tw_fields)):
+        if duplicate_tw:
             errors.append("Duplicate Taskwarrior field mappings found")
         
         # TODO: Add more validation rules
@@ -2,9 +2,10 @@
 Unified task model for both Notion and Taskwarrior representations.
 """
 
-from datetime import datetime
-from typing import Dict, List, Optional, Any
-from pydantic import BaseModel, Field, validator
+import calendar
+from datetime import datetime, timezone
+from typing import Dict, List, Optional, Any, Tuple
+from pydantic import BaseModel, Field, PrivateAttr, validator
 from enum import Enum
 
 
@@ -25,6 +26,80 @@ class TaskPriority(str, Enum):
     NONE = ""
 
 
+# from_notion_page and from_taskwarrior_data build tasks from values they
+# have already parsed into the declared types, so they go through
+# Task._from_parsed() and construct() instead of re-running every field
+# validator. The checks that can still fail or normalize (description,
+# tags, urgency) are applied there by hand.
+_DESCRIPTION_MAX_LENGTH = 1000
+
+_TW_TS_FORMAT = "%Y%m%dT%H%M%SZ"
+
+
+def _enum_value(value: Any) -> Any:
+    """Return the value of an enum member, or the value itself."""
+    return value.value if isinstance(value, Enum) else value
+
+
+def _ser_dt(value: Optional[datetime]) -> Optional[str]:
+    """JSON encoder for datetime fields."""
+    return value.isoformat() if value is not None else None
+
+
+def _parse_tw_ts(value: str) -> datetime:
+    """Parse a Taskwarrior ``YYYYMMDDTHHMMSSZ`` timestamp.
+    
+    Slices the fixed-width fields rather than going through strptime;
+    anything else is left to strptime so malformed input still raises.
+    
+    Args:
+        value: Taskwarrior timestamp
+        
+    Returns:
+        Naive datetime (UTC), as strptime would return
+    """
+    if len(value) == 16 and value[8] == "T" and value[15] == "Z" and value[:8].isdigit():
+        return datetime(int(value[0:4]), int(value[4:6]), int(value[6:8]),
+                        int(value[9:11]), int(value[11:13]), int(value[13:15]))
+    return datetime.strptime(value, _TW_TS_FORMAT)
+
+
+def _parse_notion_ts(value: str) -> datetime:
+    """Parse a Notion ISO-8601 date or timestamp.
+    
+    Notion sends ``YYYY-MM-DD`` dates and ``YYYY-MM-DDTHH:MM:SS.fffZ``
+    timestamps; those are sliced directly and any other shape is left to
+    ``datetime.fromisoformat``.
+    
+    Args:
+        value: Notion date or timestamp
+        
+    Returns:
+        Parsed datetime, as fromisoformat would return
+    """
+    n = len(value)
+    if n == 10 and value[4] == "-" and value[7] == "-":
+        return datetime(int(value[0:4]), int(value[5:7]), int(value[8:10]))
+    if ((n == 24 and value[19] == ".") or n == 20) and value[10] == "T" and value[-1] == "Z":
+        return datetime(int(value[0:4]), int(value[5:7]), int(value[8:10]),
+                        int(value[11:13]), int(value[14:16]), int(value[17:19]),
+                        int(value[20:23]) * 1000 if n == 24 else 0, tzinfo=timezone.utc)
+    return datetime.fromisoformat(value)
+
+
+def _format_tw_ts(value: datetime) -> str:
+    """Format a datetime as a Taskwarrior ``YYYYMMDDTHHMMSSZ`` timestamp.
+    
+    Args:
+        value: Datetime to format
+        
+    Returns:
+        Taskwarrior timestamp
+    """
+    return (f"{value.year:04d}{value.month:02d}{value.day:02d}"
+            f"T{value.hour:02d}{value.minute:02d}{value.second:02d}Z")
+
+
 class Task(BaseModel):
     """Unified task model for Notion and Taskwarrior."""
     
@@ -34,7 +109,7 @@ class Task(BaseModel):
     notion_id: Optional[str] = None  # Notion page ID
     
     # Basic task information
-    description: str = Field(..., min_length=1, max_length=1000)
+    description: str = Field(..., min_length=1, max_length=_DESCRIPTION_MAX_LENGTH)
     status: TaskStatus = TaskStatus.PENDING
     priority: TaskPriority = TaskPriority.NONE
     
@@ -61,14 +136,19 @@ class Task(BaseModel):
     last_sync: Optional[datetime] = None
     sync_source: Optional[str] = None  # 'notion' or 'taskwarrior'
     
-    # Raw data for debugging
-    raw_notion_data: Optional[Dict[str, Any]] = None
-    raw_taskwarrior_data: Optional[Dict[str, Any]] = None
+    # Raw data for debugging. Typed Any so validation stores the payload by
+    # reference instead of copying and walking it, and excluded from
+    # dict()/json() so serializing a task does not deep-copy it either.
+    raw_notion_data: Optional[Any] = Field(default=None, exclude=True)
+    raw_taskwarrior_data: Optional[Any] = Field(default=None, exclude=True)
+    
+    # (modified it was computed from, UTC epoch seconds)
+    _modified_epoch: Optional[Tuple[datetime, int]] = PrivateAttr(default=None)
     
     class Config:
         use_enum_values = True
         json_encoders = {
-            datetime: lambda v: v.isoformat() if v else None
+            datetime: _ser_dt
         }
     
     @validator('tags')
@@ -95,49 +175,21 @@ class Task(BaseModel):
         # TODO: Handle field mappings
         # TODO: Convert datetime to Notion format
         
-        properties = {
-            "Name": {
-                "title": [
-                    {
-                        "text": {
-                            "content": self.description
-                        }
-                    }
-                ]
-            }
-        }
+        properties = {"Name": {"title": [{"text": {"content": self.description}}]}}
         
-        # Add status
+        # status and priority are stored as plain strings once validated
+        # (use_enum_values) but stay enum members when left at their default
         if self.status:
-            properties["Status"] = {
-                "select": {
-                    "name": self.status.value
-                }
-            }
+            properties["Status"] = {"select": {"name": _enum_value(self.status)}}
         
-        # Add priority
         if self.priority != TaskPriority.NONE:
-            properties["Priority"] = {
-                "select": {
-                    "name": self.priority.value
-                }
-            }
+            properties["Priority"] = {"select": {"name": _enum_value(self.priority)}}
         
-        # Add due date
         if self.due:
-            properties["Due"] = {
-                "date": {
-                    "start": self.due.isoformat()
-                }
-            }
+            properties["Due"] = {"date": {"start": self.due.isoformat()}}
         
-        # Add tags
         if self.tags:
-            properties["Tags"] = {
-                "multi_select": [
-                    {"name": tag} for tag in self.tags
-                ]
-            }
+            properties["Tags"] = {"multi_select": [{"name": tag} for tag in self.tags]}
         
         return properties
     
@@ -153,20 +205,20 @@ class Task(BaseModel):
         
         data = {
             "description": self.description,
-            "status": self.status.value,
+            "status": _enum_value(self.status),
         }
         
         if self.uuid:
             data["uuid"] = self.uuid
         
         if self.priority != TaskPriority.NONE:
-            data["priority"] = self.priority.value
+            data["priority"] = _enum_value(self.priority)
         
         if self.due:
-            data["due"] = self.due.strftime("%Y%m%dT%H%M%SZ")
+            data["due"] = _format_tw_ts(self.due)
         
         if self.scheduled:
-            data["scheduled"] = self.scheduled.strftime("%Y%m%dT%H%M%SZ")
+            data["scheduled"] = _format_tw_ts(self.scheduled)
         
         if self.project:
             data["project"] = self.project
@@ -175,10 +227,8 @@ class Task(BaseModel):
             data["tags"] = self.tags
         
         if self.annotations:
-            data["annotations"] = [
-                {"description": ann, "entry": datetime.now().strftime("%Y%m%dT%H%M%SZ")}
-                for ann in self.annotations
-            ]
+            entry = _format_tw_ts(datetime.now(timezone.utc))
+            data["annotations"] = [{"description": ann, "entry": entry} for ann in self.annotations]
         
         return data
     
@@ -224,7 +274,7 @@ class Task(BaseModel):
         if "Due" in properties:
             due_data = properties["Due"].get("date")
             if due_data and due_data.get("start"):
-                due = datetime.fromisoformat(due_data["start"])
+                due = _parse_notion_ts(due_data["start"])
         
         # Extract tags
         tags = []
@@ -232,15 +282,15 @@ class Task(BaseModel):
             tags_data = properties["Tags"].get("multi_select", [])
             tags = [tag["name"] for tag in tags_data]
         
-        return cls(
+        return cls._from_parsed(
             notion_id=notion_page.get("id"),
             description=description,
             status=status,
             priority=priority,
             due=due,
             tags=tags,
-            created=datetime.fromisoformat(notion_page.get("created_time", "")) if notion_page.get("created_time") else None,
-            modified=datetime.fromisoformat(notion_page.get("last_edited_time", "")) if notion_page.get("last_edited_time") else None,
+            created=_parse_notion_ts(notion_page["created_time"]) if notion_page.get("created_time") else None,
+            modified=_parse_notion_ts(notion_page["last_edited_time"]) if notion_page.get("last_edited_time") else None,
             sync_source="notion",
             raw_notion_data=notion_page
         )
@@ -262,19 +312,19 @@ class Task(BaseModel):
         # Parse timestamps
         created = None
         if "entry" in tw_data:
-            created = datetime.strptime(tw_data["entry"], "%Y%m%dT%H%M%SZ")
+            created = _parse_tw_ts(tw_data["entry"])
         
         modified = None
         if "modified" in tw_data:
-            modified = datetime.strptime(tw_data["modified"], "%Y%m%dT%H%M%SZ")
+            modified = _parse_tw_ts(tw_data["modified"])
         
         due = None
         if "due" in tw_data:
-            due = datetime.strptime(tw_data["due"], "%Y%m%dT%H%M%SZ")
+            due = _parse_tw_ts(tw_data["due"])
         
         scheduled = None
         if "scheduled" in tw_data:
-            scheduled = datetime.strptime(tw_data["scheduled"], "%Y%m%dT%H%M%SZ")
+            scheduled = _parse_tw_ts(tw_data["scheduled"])
         
         # Parse status
         status = TaskStatus(tw_data.get("status", "pending"))
@@ -292,7 +342,7 @@ class Task(BaseModel):
         if "annotations" in tw_data:
             annotations = [ann.get("description", "") for ann in tw_data["annotations"]]
         
-        return cls(
+        return cls._from_parsed(
             uuid=tw_data.get("uuid"),
             description=tw_data.get("description", ""),
             status=status,
@@ -309,6 +359,37 @@ class Task(BaseModel):
             raw_taskwarrior_data=tw_data
         )
     
+    @classmethod
+    def _from_parsed(cls, **values: Any) -> 'Task':
+        """Create Task from already-parsed values without full validation.
+        
+        Falls back to regular validation, and its errors, when the
+        description would be rejected.
+        
+        Args:
+            **values: Field values of the declared types
+            
+        Returns:
+            Task instance
+        """
+        description = values["description"]
+        if not (isinstance(description, str) and 0 < len(description) <= _DESCRIPTION_MAX_LENGTH
+                and description.strip()):
+            return cls(**values)
+        
+        values["description"] = description.strip()
+        values["tags"] = [tag.strip() for tag in values["tags"] if tag.strip()]
+        
+        # Stored as plain values, as use_enum_values would
+        values["status"] = values["status"].value
+        values["priority"] = values["priority"].value
+        
+        urgency = values.get("urgency")
+        if urgency is not None:
+            values["urgency"] = float(urgency)
+        
+        return cls.construct(**values)
+    
     def is_notion_synced(self) -> bool:
         """Check if task is synced with Notion.
         
@@ -341,4 +422,23 @@ class Task(BaseModel):
         if not self.modified or not other.modified:
             return True
         
-        return self.modified != other.modified
\ No newline at end of file
+        return self.modified_epoch != other.modified_epoch
+    
+    @property
+    def modified_epoch(self) -> Optional[int]:
+        """Modification time as whole UTC epoch seconds.
+        
+        Naive timestamps are taken as UTC, which is how both Taskwarrior
+        and Notion report them. Cached until ``modified`` changes.
+        
+        Returns:
+            Epoch seconds or None
+        """
+        modified = self.modified
+        if modified is None:
+            return None
+        cache = self._modified_epoch
+        if cache is None or cache[0] is not modified:
+            cache = (modified, calendar.timegm(modified.utctimetuple()))
+            self._modified_epoch = cache
+        return cache[1]
\ No newline at end of file
@@ -0,0 +1,42 @@
+"""
+YAML backend used for configuration files.
+
+Loading and dumping both go through PyYAML, using its libyaml bindings
+when available and the pure-Python implementation otherwise, so files
+are always read with the same YAML 1.1 rules they were written with.
+"""
+
+from typing import Any, IO, Optional, Union
+
+import yaml
+
+try:
+    from yaml import CSafeLoader as SafeLoader, CSafeDumper as SafeDumper
+except ImportError:  # PyYAML built without libyaml
+    from yaml import SafeLoader, SafeDumper
+
+
+def safe_load(stream: Union[str, bytes, IO]) -> Any:
+    """Parse a YAML document using only standard tags.
+    
+    Args:
+        stream: YAML text, UTF-8 bytes or a readable file object
+    
+    Returns:
+        Parsed data
+    """
+    return yaml.load(stream, Loader=SafeLoader)
+
+
+def dump(data: Any, stream: Optional[IO] = None, **kwargs: Any) -> Optional[str]:
+    """Serialize data to YAML using only standard tags.
+    
+    Args:
+        data: Data to serialize
+        stream: File object to write to (returns the YAML text if None)
+        **kwargs: PyYAML dump options, e.g. default_flow_style
+    
+    Returns:
+        YAML text if no stream was given, otherwise None
+    """
+    return yaml.dump(data, stream, Dumper=SafeDumper, **kwargs)
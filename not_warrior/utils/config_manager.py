@@ -2,15 +2,151 @@
 Configuration management for loading, saving, and validating configuration.
 """
 
+import copy
+import hashlib
+import json
+import operator
 import os
-import yaml
+import stat
+from functools import lru_cache
 from pathlib import Path
-from typing import Dict, Optional, Any
+from types import MappingProxyType
+from typing import Any, Callable, Dict, Iterable, Mapping, Optional, Tuple, Union
 from not_warrior.models.config import AppConfig
+from not_warrior.utils import _yaml
+from not_warrior.utils.helpers import merge_dicts, write_file_atomic
 from not_warrior.utils.logger import get_logger
 
+try:
+    import orjson
+except ImportError:  # Optional: falls back to the stdlib json module
+    orjson = None
+
 logger = get_logger(__name__)
 
+# Suffix of the JSON sidecar holding the parsed form of a YAML config file
+CONFIG_CACHE_SUFFIX = ".cache.json"
+
+_CACHE_MISS = object()
+
+
+def _read_config_cache(cache_path: Path, digest: str) -> Any:
+    """Read parsed configuration from a JSON sidecar.
+    
+    Args:
+        cache_path: Path to sidecar file
+        digest: Content hash of the YAML file the sidecar must match
+        
+    Returns:
+        Cached data, or _CACHE_MISS if missing, stale or unreadable
+    """
+    try:
+        raw = cache_path.read_bytes()
+        cached = orjson.loads(raw) if orjson else json.loads(raw)
+    except (OSError, ValueError):
+        return _CACHE_MISS
+    
+    if not isinstance(cached, dict) or cached.get("hash") != digest:
+        return _CACHE_MISS
+    return cached.get("data")
+
+
+def _write_config_cache(cache_path: Path, digest: str, config_data: Any, mode: int) -> None:
+    """Write parsed configuration to a JSON sidecar.
+    
+    The sidecar is skipped when the data does not survive a JSON round trip
+    unchanged (e.g. YAML dates or non-string keys). It holds the same
+    secrets as the YAML file, so it gets the same permission bits.
+    
+    Args:
+        cache_path: Path to sidecar file
+        digest: Content hash of the YAML file
+        config_data: Parsed YAML data
+        mode: Permission bits of the YAML file
+    """
+    payload = {"hash": digest, "data": config_data}
+    try:
+        if orjson:
+            blob = orjson.dumps(payload, option=orjson.OPT_PASSTHROUGH_DATETIME)
+            round_trip = orjson.loads(blob)
+        else:
+            blob = json.dumps(payload).encode('utf-8')
+            round_trip = json.loads(blob)
+    except (TypeError, ValueError):
+        return
+    
+    if round_trip != payload:
+        return
+    
+    try:
+        write_file_atomic(cache_path, blob, mode=mode)
+    except OSError as e:
+        logger.debug(f"Could not write config cache {cache_path}: {e}")
+
+
+@lru_cache(maxsize=8)
+def _parse_config_file(path: str, mtime_ns: int, size: int) -> Any:
+    """Parse a YAML configuration file.
+    
+    Cached on the file's modification time and size, so an unchanged file
+    is only parsed once per process. Across processes, the parsed data is
+    reused from a JSON sidecar (``<config>.cache.json``) as long as its
+    content hash matches the YAML file.
+    
+    Args:
+        path: Path to configuration file
+        mtime_ns: File modification time in nanoseconds
+        size: File size in bytes
+        
+    Returns:
+        Parsed data (read-only view if it is a mapping)
+    """
+    config_path = Path(path)
+    raw = config_path.read_bytes()
+    digest = hashlib.blake2b(raw, digest_size=16).hexdigest()
+    cache_path = Path(path + CONFIG_CACHE_SUFFIX)
+    
+    config_data = _read_config_cache(cache_path, digest)
+    if config_data is _CACHE_MISS:
+        config_data = _yaml.safe_load(raw)
+        _write_config_cache(cache_path, digest, config_data, stat.S_IMODE(config_path.stat().st_mode))
+    
+    if isinstance(config_data, dict):
+        return MappingProxyType(config_data)
+    return config_data
+
+
+def _invalidate_parse_cache() -> None:
+    """Forget parsed configuration after this process rewrites a file.
+    
+    The (mtime, size) key alone can miss a rewrite on filesystems with
+    coarse timestamps when the new file happens to have the same size.
+    """
+    _parse_config_file.cache_clear()
+
+
+@lru_cache(maxsize=256)
+def _attrgetter(key: str) -> Callable[[Any], Any]:
+    """Getter for a dot-separated attribute path, built once per key.
+    
+    Args:
+        key: Attribute path, e.g. "notion.api_token"
+        
+    Returns:
+        operator.attrgetter for the path
+    """
+    return operator.attrgetter(key)
+
+
+@lru_cache(maxsize=1)
+def _default_config_path() -> Path:
+    """Default config file path, resolved through AppConfig once per process.
+    
+    Returns:
+        Path to default config file
+    """
+    return AppConfig().get_default_config_path()
+
 
 class ConfigManager:
     """Manager for application configuration."""
@@ -23,6 +159,10 @@ class ConfigManager:
         """
         self.config_path = Path(config_path) if config_path else None
         self._config: Optional[AppConfig] = None
+        # (config it was resolved against, token)
+        self._token_cache: Optional[Tuple[Optional[AppConfig], Optional[str]]] = None
+        # (data_dir setting it was built from, resolved path)
+        self._data_dir_cache: Optional[Tuple[Any, Path]] = None
     
     def load_config(self) -> AppConfig:
         """Load configuration from file.
@@ -37,8 +177,8 @@ class ConfigManager:
         
         if config_path.exists():
             try:
-                with open(config_path, 'r') as f:
-                    config_data = yaml.safe_load(f)
+                st = config_path.stat()
+                config_data = _parse_config_file(str(config_path), st.st_mtime_ns, st.st_size)
                 
                 self._config = AppConfig(**config_data)
                 self._config.config_file = str(config_path)
@@ -56,6 +196,42 @@ class ConfigManager:
         
         return self._config
     
+    def load_configs(self, paths: Iterable[Union[str, Path]]) -> Dict[str, Any]:
+        """Load and merge several configuration files.
+        
+        Later files override earlier ones key by key (e.g. a base config
+        followed by per-profile overrides). Each file goes through the same
+        parse cache as load_config, so unchanged fragments are not re-parsed.
+        Fragments that cannot be read or are not mappings are skipped.
+        
+        Args:
+            paths: Configuration files, lowest precedence first
+            
+        Returns:
+            Merged configuration data
+        """
+        merged: Dict[str, Any] = {}
+        
+        for path in paths:
+            path = str(path)
+            try:
+                st = os.stat(path)
+                fragment = _parse_config_file(path, st.st_mtime_ns, st.st_size)
+            except Exception as e:
+                logger.error(f"Failed to load configuration from {path}: {e}")
+                continue
+            
+            if fragment is None:
+                continue
+            if not isinstance(fragment, Mapping):
+                logger.error(f"Configuration in {path} is not a mapping")
+                continue
+            
+            merged = merge_dicts(merged, fragment)
+        
+        # Nested values are shared with the parse cache
+        return copy.deepcopy(merged)
+    
     def save_config(self, config: Optional[AppConfig] = None) -> bool:
         """Save configuration to file.
         
@@ -81,8 +257,11 @@ class ConfigManager:
             # Convert to dictionary for YAML serialization
             config_dict = config.dict(exclude={'config_file'})
             
-            with open(config_path, 'w') as f:
-                yaml.dump(config_dict, f, default_flow_style=False, sort_keys=False)
+            # Serialize in memory so the document is written in one call
+            payload = _yaml.dump(config_dict, default_flow_style=False, sort_keys=False)
+            write_file_atomic(config_path, payload.encode('utf-8'))
+            
+            _invalidate_parse_cache()
             
             logger.info(f"Configuration saved to {config_path}")
             return True
@@ -97,9 +276,7 @@ class ConfigManager:
         Returns:
             Path to default config file
         """
-        # Use AppConfig method to get default path
-        default_config = AppConfig()
-        return default_config.get_default_config_path()
+        return _default_config_path()
     
     def create_default_config(self, force: bool = False) -> bool:
         """Create default configuration file.
@@ -157,16 +334,10 @@ class ConfigManager:
             config = self.load_config()
             
             # Handle dot-separated keys
-            keys = key.split('.')
-            value = config
-            
-            for k in keys:
-                if hasattr(value, k):
-                    value = getattr(value, k)
-                else:
-                    return default
-            
-            return value
+            try:
+                return _attrgetter(key)(config)
+            except AttributeError:
+                return default
             
         except Exception as e:
             logger.error(f"Failed to get config value '{key}': {e}")
@@ -186,22 +357,20 @@ class ConfigManager:
             config = self.load_config()
             
             # Handle dot-separated keys
-            keys = key.split('.')
-            current = config
+            parent_key, _, final_key = key.rpartition('.')
             
             # Navigate to parent object
-            for k in keys[:-1]:
-                if hasattr(current, k):
-                    current = getattr(current, k)
-                else:
-                    logger.error(f"Invalid config key: {key}")
-                    return False
+            try:
+                current = _attrgetter(parent_key)(config) if parent_key else config
+            except AttributeError:
+                logger.error(f"Invalid config key: {key}")
+                return False
             
             # Set the final value
-            final_key = keys[-1]
             if hasattr(current, final_key):
                 setattr(current, final_key, value)
                 self._config = config
+                self._token_cache = None
                 return True
             else:
                 logger.error(f"Invalid config key: {key}")
@@ -217,13 +386,16 @@ class ConfigManager:
         Returns:
             Notion API token or None
         """
-        # Check environment variable first
-        env_token = os.getenv('NOTION_API_TOKEN')
-        if env_token:
-            return env_token
+        # Reloading or replacing the config invalidates the cached token
+        cache = self._token_cache
+        if cache is not None and cache[0] is self._config:
+            return cache[1]
+        
+        # Check environment variable first, then the configuration file
+        token = os.getenv('NOTION_API_TOKEN') or self.get_config_value('notion.api_token')
         
-        # Check configuration file
-        return self.get_config_value('notion.api_token')
+        self._token_cache = (self._config, token)
+        return token
     
     def set_notion_token(self, token: str) -> bool:
         """Set Notion API token in configuration.
@@ -243,10 +415,22 @@ class ConfigManager:
             Path to data directory
         """
         config = self.load_config()
-        if config.data_dir:
-            return Path(config.data_dir)
+        data_dir = config.data_dir
+        
+        # Rebuilt only when data_dir is changed or the config is reloaded
+        cache = self._data_dir_cache
+        if cache is not None and cache[0] is data_dir:
+            return cache[1]
+        
+        if not data_dir:
+            path = config.get_default_data_dir()
+        elif isinstance(data_dir, Path):
+            path = data_dir
+        else:
+            path = Path(data_dir)
         
-        return config.get_default_data_dir()
+        self._data_dir_cache = (data_dir, path)
+        return path
     
     def backup_config(self) -> bool:
         """Create backup of current configuration.
@@ -298,6 +482,8 @@ class ConfigManager:
             import shutil
             shutil.copy2(backup_file, config_path)
             
+            _invalidate_parse_cache()
+            
             # Reload configuration
             self._config = None
             self.load_config()
@@ -336,4 +522,25 @@ class ConfigManager:
         Returns:
             Current application configuration
         """
-        return self.load_config()
\ No newline at end of file
+        return self.load_config()
+
+def get_config_manager(config_path: Optional[str] = None) -> ConfigManager:
+    """Get the shared configuration manager for a config file.
+    
+    Prefer this over constructing ConfigManager directly, so the file is
+    loaded once per process no matter how many commands ask for it.
+    
+    Args:
+        config_path: Path to configuration file (default location if None)
+        
+    Returns:
+        Configuration manager for the path
+    """
+    # Normalized here so get_config_manager() and get_config_manager(None)
+    # share one cache entry
+    return _shared_config_manager(config_path)
+
+
+@lru_cache(maxsize=None)
+def _shared_config_manager(config_path: Optional[str]) -> ConfigManager:
+    return ConfigManager(config_path)
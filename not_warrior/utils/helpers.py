@@ -2,14 +2,31 @@
 Helper functions for date/time utilities, string formatting, and common operations.
 """
 
+import itertools
+import os
 import re
+import stat
+import tempfile
+import time
 import uuid
 from datetime import datetime, timezone, timedelta
-from typing import Any, Dict, List, Optional, Union
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Union
 from pathlib import Path
 
+_DEFAULT_DATETIME_FORMAT = "%Y-%m-%d %H:%M:%S"
+_TW_DATETIME_FORMAT = "%Y%m%dT%H%M%SZ"
 
-def format_datetime(dt: datetime, format_str: str = "%Y-%m-%d %H:%M:%S") -> str:
+_SIZE_UNITS = ("B", "KB", "MB", "GB", "TB")
+
+_FILENAME_UNSAFE_RE = re.compile(r'[<>:"/\\|?*]')
+_WHITESPACE_RE = re.compile(r'\s+')
+_EMAIL_RE = re.compile(r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$')
+_URL_RE = re.compile(
+    r'^https?://(?:[-\w.])+(?:[:\d]+)?(?:/(?:[\w/_.])*(?:\?(?:[\w&=%.])*)?(?:#(?:[\w.])*)?)?$'
+)
+
+
+def format_datetime(dt: datetime, format_str: str = _DEFAULT_DATETIME_FORMAT) -> str:
     """Format datetime to string.
     
     Args:
@@ -21,10 +38,14 @@ def format_datetime(dt: datetime, format_str: str = "%Y-%m-%d %H:%M:%S") -> str:
     """
     if dt is None:
         return ""
+    # isoformat() only matches the default format for naive datetimes; it
+    # would append the UTC offset otherwise
+    if format_str == _DEFAULT_DATETIME_FORMAT and dt.tzinfo is None:
+        return dt.isoformat(sep=' ', timespec='seconds')
     return dt.strftime(format_str)
 
 
-def parse_datetime(date_str: str, format_str: str = "%Y-%m-%d %H:%M:%S") -> Optional[datetime]:
+def parse_datetime(date_str: str, format_str: str = _DEFAULT_DATETIME_FORMAT) -> Optional[datetime]:
     """Parse datetime from string.
     
     Args:
@@ -38,6 +59,11 @@ def parse_datetime(date_str: str, format_str: str = "%Y-%m-%d %H:%M:%S") -> Opti
         return None
     
     try:
+        # Exactly "YYYY-MM-DD HH:MM:SS" is parsed by fromisoformat; any other
+        # shape keeps strptime's rules
+        if (format_str == _DEFAULT_DATETIME_FORMAT and len(date_str) == 19
+                and date_str[10] == ' ' and date_str[13] == ':' and date_str[16] == ':'):
+            return datetime.fromisoformat(date_str)
         return datetime.strptime(date_str, format_str)
     except ValueError:
         return None
@@ -56,8 +82,14 @@ def parse_taskwarrior_datetime(tw_date: str) -> Optional[datetime]:
         return None
     
     try:
-        # Taskwarrior format: 20230101T120000Z
-        return datetime.strptime(tw_date, "%Y%m%dT%H%M%SZ").replace(tzinfo=timezone.utc)
+        # Taskwarrior format: 20230101T120000Z. Fixed-width fields are sliced
+        # directly; anything else goes through strptime as before
+        if (len(tw_date) == 16 and tw_date[8] == "T" and tw_date[15] == "Z"
+                and tw_date[:8].isdigit() and tw_date[9:15].isdigit()):
+            return datetime(int(tw_date[0:4]), int(tw_date[4:6]), int(tw_date[6:8]),
+                            int(tw_date[9:11]), int(tw_date[11:13]), int(tw_date[13:15]),
+                            tzinfo=timezone.utc)
+        return datetime.strptime(tw_date, _TW_DATETIME_FORMAT).replace(tzinfo=timezone.utc)
     except ValueError:
         return None
 
@@ -78,7 +110,8 @@ def format_taskwarrior_datetime(dt: datetime) -> str:
     if dt.tzinfo is not None:
         dt = dt.astimezone(timezone.utc)
     
-    return dt.strftime("%Y%m%dT%H%M%SZ")
+    return (f"{dt.year:04d}{dt.month:02d}{dt.day:02d}"
+            f"T{dt.hour:02d}{dt.minute:02d}{dt.second:02d}Z")
 
 
 def parse_notion_datetime(notion_date: str) -> Optional[datetime]:
@@ -135,8 +168,8 @@ def sanitize_filename(filename: str) -> str:
         Sanitized filename
     """
     # Remove or replace problematic characters
-    filename = re.sub(r'[<>:"/\\|?*]', '_', filename)
-    filename = re.sub(r'\s+', '_', filename)
+    filename = _FILENAME_UNSAFE_RE.sub('_', filename)
+    filename = _WHITESPACE_RE.sub('_', filename)
     filename = filename.strip('.')
     
     # Ensure filename is not empty
@@ -175,11 +208,9 @@ def clean_whitespace(text: str) -> str:
     if not text:
         return ""
     
-    # Replace multiple whitespace with single space
-    text = re.sub(r'\s+', ' ', text)
-    
-    # Remove leading/trailing whitespace
-    return text.strip()
+    # str.split() drops leading/trailing whitespace and collapses runs of
+    # it, matching the Unicode-aware \s+ regex this replaces
+    return ' '.join(text.split())
 
 
 def generate_uuid() -> str:
@@ -264,19 +295,21 @@ def flatten_dict(data: Dict, separator: str = '.') -> Dict[str, Any]:
     Returns:
         Flattened dictionary
     """
-    def _flatten(obj, parent_key=''):
-        items = []
-        
+    result = {}
+    # Children are pushed in reverse so they pop, and land in the result,
+    # in their original order
+    stack = [('', data)]
+    while stack:
+        parent_key, obj = stack.pop()
         if isinstance(obj, dict):
-            for key, value in obj.items():
-                new_key = f"{parent_key}{separator}{key}" if parent_key else key
-                items.extend(_flatten(value, new_key).items())
+            stack.extend(
+                (f"{parent_key}{separator}{key}" if parent_key else key, value)
+                for key, value in reversed(obj.items())
+            )
         else:
-            return {parent_key: obj}
-        
-        return dict(items)
+            result[parent_key] = obj
     
-    return _flatten(data)
+    return result
 
 
 def unflatten_dict(data: Dict[str, Any], separator: str = '.') -> Dict:
@@ -309,11 +342,18 @@ def merge_dicts(dict1: Dict, dict2: Dict) -> Dict:
     """
     result = dict1.copy()
     
-    for key, value in dict2.items():
-        if key in result and isinstance(result[key], dict) and isinstance(value, dict):
-            result[key] = merge_dicts(result[key], value)
-        else:
-            result[key] = value
+    # Worklist of (merged dict we own, dict to merge into it); nested dicts
+    # from dict1 are only copied when dict2 actually merges into them
+    stack = [(result, dict2)]
+    while stack:
+        dst, src = stack.pop()
+        for key, value in src.items():
+            current = dst.get(key)
+            if isinstance(current, dict) and isinstance(value, dict):
+                dst[key] = current = current.copy()
+                stack.append((current, value))
+            else:
+                dst[key] = value
     
     return result
 
@@ -369,28 +409,28 @@ def deduplicate_list(items: List) -> List:
     Returns:
         List without duplicates
     """
-    seen = set()
-    result = []
-    
-    for item in items:
-        if item not in seen:
-            seen.add(item)
-            result.append(item)
-    
-    return result
+    # dicts keep insertion order, so this keeps the first of each item
+    return list(dict.fromkeys(items))
 
 
-def chunk_list(items: List, chunk_size: int) -> List[List]:
-    """Split list into chunks of specified size.
+def chunk_list(items: Iterable, chunk_size: int) -> Iterator[List]:
+    """Split items into chunks of specified size.
+    
+    Chunks are produced lazily, so only one chunk is held at a time.
     
     Args:
-        items: List to chunk
+        items: Items to chunk (any iterable)
         chunk_size: Size of each chunk
         
-    Returns:
-        List of chunks
+    Yields:
+        Lists of up to chunk_size items
     """
-    return [items[i:i + chunk_size] for i in range(0, len(items), chunk_size)]
+    it = iter(items)
+    while True:
+        chunk = list(itertools.islice(it, chunk_size))
+        if not chunk:
+            return
+        yield chunk
 
 
 def human_readable_size(size_bytes: int) -> str:
@@ -405,14 +445,17 @@ def human_readable_size(size_bytes: int) -> str:
     if size_bytes == 0:
         return "0 B"
     
-    size_names = ["B", "KB", "MB", "GB", "TB"]
-    i = 0
+    if isinstance(size_bytes, int) and size_bytes > 0:
+        # Each unit is 2**10 of the previous one, so the bit length picks it
+        i = min((size_bytes.bit_length() - 1) // 10, len(_SIZE_UNITS) - 1)
+        return f"{size_bytes / (1 << (10 * i)):.1f} {_SIZE_UNITS[i]}"
     
-    while size_bytes >= 1024 and i < len(size_names) - 1:
+    i = 0
+    while size_bytes >= 1024 and i < len(_SIZE_UNITS) - 1:
         size_bytes /= 1024
         i += 1
     
-    return f"{size_bytes:.1f} {size_names[i]}"
+    return f"{size_bytes:.1f} {_SIZE_UNITS[i]}"
 
 
 def create_backup_filename(original_path: Union[str, Path], suffix: str = None) -> Path:
@@ -428,7 +471,9 @@ def create_backup_filename(original_path: Union[str, Path], suffix: str = None)
     path = Path(original_path)
     
     if suffix is None:
-        suffix = datetime.now().strftime("%Y%m%d_%H%M%S")
+        now = datetime.now()
+        suffix = (f"{now.year:04d}{now.month:02d}{now.day:02d}"
+                  f"_{now.hour:02d}{now.minute:02d}{now.second:02d}")
     
     return path.with_suffix(f".{suffix}{path.suffix}")
 
@@ -447,6 +492,45 @@ def ensure_directory(path: Union[str, Path]) -> Path:
     return dir_path
 
 
+def write_file_atomic(path: Path, data: bytes, mode: Optional[int] = None) -> None:
+    """Replace a file's contents without ever leaving it half-written.
+    
+    The data goes to a uniquely named temporary file in the same directory,
+    which is created private (0600), flushed to disk, given the target's
+    permissions and then renamed over the target. A rewrite therefore never
+    widens who can read the file, and concurrent writers never share a
+    temporary file.
+    
+    Args:
+        path: File to write
+        data: Complete new contents
+        mode: Permission bits for the file (default: keep the existing
+            file's, or 0600 for a new file)
+    """
+    path = Path(path)
+    if mode is None:
+        try:
+            mode = stat.S_IMODE(os.stat(path).st_mode)
+        except FileNotFoundError:
+            pass
+    
+    tmp = tempfile.NamedTemporaryFile(dir=path.parent, prefix=f".{path.name}.", suffix=".tmp", delete=False)
+    try:
+        with tmp:
+            tmp.write(data)
+            tmp.flush()
+            os.fsync(tmp.fileno())
+        if mode is not None:
+            os.chmod(tmp.name, mode)
+        os.replace(tmp.name, path)
+    except BaseException:
+        try:
+            os.unlink(tmp.name)
+        except OSError:
+            pass
+        raise
+
+
 def get_file_age(path: Union[str, Path]) -> Optional[timedelta]:
     """Get age of file.
     
@@ -461,8 +545,9 @@ def get_file_age(path: Union[str, Path]) -> Optional[timedelta]:
     if not file_path.exists():
         return None
     
-    modified_time = datetime.fromtimestamp(file_path.stat().st_mtime)
-    return datetime.now() - modified_time
+    # Compared in UTC so the age is not skewed across DST changes
+    modified_time = datetime.fromtimestamp(file_path.stat().st_mtime, tz=timezone.utc)
+    return datetime.now(timezone.utc) - modified_time
 
 
 def validate_email(email: str) -> bool:
@@ -474,8 +559,7 @@ def validate_email(email: str) -> bool:
     Returns:
         True if valid email format
     """
-    pattern = r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$'
-    return bool(re.match(pattern, email))
+    return bool(_EMAIL_RE.match(email))
 
 
 def validate_url(url: str) -> bool:
@@ -487,8 +571,7 @@ def validate_url(url: str) -> bool:
     Returns:
         True if valid URL format
     """
-    pattern = r'^https?://(?:[-\w.])+(?:[:\d]+)?(?:/(?:[\w/_.])*(?:\?(?:[\w&=%.])*)?(?:#(?:[\w.])*)?)?$'
-    return bool(re.match(pattern, url))
+    return bool(_URL_RE.match(url))
 
 
 def retry_with_backoff(max_retries: int = 3, backoff_factor: float = 1.0):
@@ -501,10 +584,11 @@ def retry_with_backoff(max_retries: int = 3, backoff_factor: float = 1.0):
     Returns:
         Decorated function
     """
+    # Wait before each retry, computed once for every decorated call
+    waits = tuple(backoff_factor * (2 ** attempt) for attempt in range(max_retries))
+    
     def decorator(func):
         def wrapper(*args, **kwargs):
-            import time
-            
             for attempt in range(max_retries + 1):
                 try:
                     return func(*args, **kwargs)
@@ -512,8 +596,7 @@ def retry_with_backoff(max_retries: int = 3, backoff_factor: float = 1.0):
                     if attempt == max_retries:
                         raise
                     
-                    wait_time = backoff_factor * (2 ** attempt)
-                    time.sleep(wait_time)
+                    time.sleep(waits[attempt])
             
         return wrapper
     return decorator
\ No newline at end of file
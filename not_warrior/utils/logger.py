@@ -2,24 +2,468 @@
 Logging utilities for structured logging and output formatting.
 """
 
+import atexit
+import collections
 import logging
 import logging.handlers
+import os
+import queue
 import sys
+import threading
+import time
+from functools import lru_cache, partial, wraps
 from pathlib import Path
-from typing import Optional
+from typing import Deque, Iterator, List, Optional
 
 # Global logger instance
 _logger_configured = False
 
+# Records are handed to a background QueueListener, which owns the real
+# console/file handlers, so logging calls never wait on formatting or I/O
+_log_queue: "queue.SimpleQueue[logging.LogRecord]" = queue.SimpleQueue()
+_listener: Optional[logging.handlers.QueueListener] = None
 
-def setup_logger(verbose: bool = False, log_file: Optional[str] = None) -> None:
+# Set by disable_logging(), cleared by enable_logging()
+_logging_disabled = False
+
+# Console handler installed by setup_logger()/setup_colored_logging()
+_console_handler: Optional[logging.StreamHandler] = None
+
+
+def _stop_listener() -> None:
+    """Stop the queue listener, writing out any records still queued."""
+    global _listener
+    
+    if _listener is not None:
+        _listener.stop()
+        # The last records before the stop sentinel may still be buffered
+        for handler in _listener.handlers:
+            handler.flush()
+        _listener = None
+
+
+atexit.register(_stop_listener)
+
+
+def _get_handlers() -> List[logging.Handler]:
+    """Get the handlers that actually write log records.
+    
+    Returns:
+        Handlers behind the queue listener, or the root logger's handlers
+    """
+    if _listener is not None:
+        return list(_listener.handlers)
+    return list(logging.getLogger().handlers)
+
+
+def _install_handlers(handlers: List[logging.Handler]) -> None:
+    """Route root logger records to handlers through the queue listener.
+    
+    Args:
+        handlers: Handlers to run on the listener thread
+    """
+    global _listener
+    
+    _stop_listener()
+    
+    # Swapped in one assignment, so there is no moment where the root logger
+    # has no handlers and records fall through to logging.lastResort
+    logging.getLogger().handlers = [logging.handlers.QueueHandler(_log_queue)]
+    
+    _listener = _DrainingQueueListener(_log_queue, *handlers, respect_handler_level=True)
+    _listener.start()
+
+
+class _BufferedConsoleHandler(logging.StreamHandler):
+    """Console handler that writes each burst of queued records at once.
+    
+    While run by a _DrainingQueueListener, formatted lines are held until
+    the log queue is empty, then written and flushed together, so a burst
+    costs one write instead of one per record. Used anywhere else, it
+    writes every record immediately.
+    """
+    
+    def __init__(self, stream=None):
+        """Initialize handler with an empty line buffer.
+        
+        Args:
+            stream: Stream to write to (sys.stderr if None)
+        """
+        super().__init__(stream)
+        self._pending: List[str] = []
+        # Set while a listener takes care of flushing on queue drain
+        self._deferred = False
+    
+    def emit(self, record):
+        """Buffer the formatted record, writing it out unless flushing is deferred.
+        
+        Args:
+            record: Log record
+        """
+        try:
+            self._pending.append(self.format(record) + self.terminator)
+            if not self._deferred:
+                self.flush()
+        except Exception:
+            self.handleError(record)
+    
+    def drain(self, record: logging.LogRecord) -> None:
+        """Write out buffered lines, reporting failures against a record.
+        
+        Args:
+            record: Record being handled when the queue drained
+        """
+        try:
+            self.flush()
+        except Exception:
+            self.handleError(record)
+    
+    def flush(self):
+        """Write any buffered lines and flush the stream."""
+        self.acquire()
+        try:
+            if self._pending:
+                text = ''.join(self._pending)
+                self._pending = []
+                self.stream.write(text)
+            super().flush()
+        finally:
+            self.release()
+
+
+class _DrainingQueueListener(logging.handlers.QueueListener):
+    """Queue listener that flushes buffered console handlers on queue drain.
+    
+    The flush happens after every record that empties the queue, whether
+    or not the console handler's level let that record through.
+    """
+    
+    def __init__(self, queue, *handlers, respect_handler_level=False):
+        """Initialize listener and find the handlers that buffer output.
+        
+        Args:
+            queue: Queue to read records from
+            *handlers: Handlers to run records through
+            respect_handler_level: Skip handlers whose level is above the record's
+        """
+        super().__init__(queue, *handlers, respect_handler_level=respect_handler_level)
+        self._buffered = [h for h in handlers if isinstance(h, _BufferedConsoleHandler)]
+    
+    def start(self):
+        """Defer buffered handlers' flushing to this listener and start it."""
+        for handler in self._buffered:
+            handler._deferred = True
+        super().start()
+    
+    def stop(self):
+        """Stop the listener and write out anything still buffered."""
+        super().stop()
+        for handler in self._buffered:
+            handler._deferred = False
+            handler.flush()
+    
+    def handle(self, record):
+        """Handle a record, flushing buffered handlers if the queue is now empty.
+        
+        Args:
+            record: Log record
+        """
+        super().handle(record)
+        if self._buffered and self.queue.empty():
+            for handler in self._buffered:
+                handler.drain(record)
+
+
+class _CachedTimeFormatter(logging.Formatter):
+    """Formatter that renders each record timestamp's second only once.
+    
+    Records logged within the same wall-clock second share one
+    localtime()/strftime() result.
+    """
+    
+    def __init__(self, *args, **kwargs):
+        """Initialize formatter with an empty timestamp cache."""
+        super().__init__(*args, **kwargs)
+        # (epoch second, datefmt, formatted time)
+        self._time_cache = (None, None, '')
+    
+    def formatTime(self, record, datefmt=None):
+        """Format the record's creation time, reusing the last second's text.
+        
+        Args:
+            record: Log record
+            datefmt: strftime format (default format with msecs if None)
+            
+        Returns:
+            Formatted time
+        """
+        sec = int(record.created)
+        cache = self._time_cache
+        if cache[0] == sec and cache[1] == datefmt:
+            formatted = cache[2]
+        else:
+            formatted = time.strftime(datefmt or self.default_time_format, self.converter(sec))
+            self._time_cache = (sec, datefmt, formatted)
+        
+        if datefmt or not self.default_msec_format:
+            return formatted
+        return self.default_msec_format % (formatted, record.msecs)
+
+
+# Format used by every console and file handler set up here
+_LOG_FORMAT = '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+
+
+class _FastPctFormatter(_CachedTimeFormatter):
+    """Formatter with the default log line layout compiled to an f-string.
+    
+    Any other format string goes through logging's normal %-style path.
+    """
+    
+    def __init__(self, *args, **kwargs):
+        """Initialize formatter and check whether the fast layout applies."""
+        super().__init__(*args, **kwargs)
+        self._fast = type(self._style) is logging.PercentStyle and self._fmt == _LOG_FORMAT
+    
+    def formatMessage(self, record):
+        """Render the record's attributes into the log line.
+        
+        Args:
+            record: Log record, with message and asctime already set
+            
+        Returns:
+            Formatted log line (without exception text)
+        """
+        if self._fast:
+            return f"{record.asctime} - {record.name} - {record.levelname} - {record.message}"
+        return super().formatMessage(record)
+
+
+# How log files are rotated: by this process, or by an external logrotate
+ROTATION_MODES = ('internal', 'external')
+
+# Records buffered before a file write, and the longest an idle buffer waits
+_FILE_BUFFER_CAPACITY = 512
+_FILE_FLUSH_INTERVAL = 1.0
+
+
+# Headroom for the line prefix and multi-byte characters when deciding from
+# the tracked size alone that a record cannot trigger a rollover
+_ROLLOVER_MARGIN = 1024
+
+
+class _BatchFlushMixin:
+    """Lets a stream handler write a batch of records with one flush."""
+    
+    _batching = False
+    
+    def flush(self):
+        """Flush the stream, unless in the middle of a batch."""
+        if not self._batching:
+            super().flush()
+    
+    def emit_batch(self, records: List[logging.LogRecord]) -> None:
+        """Write records, flushing the stream once at the end.
+        
+        Args:
+            records: Log records to write
+        """
+        self.acquire()
+        try:
+            self._batching = True
+            try:
+                for record in records:
+                    if record.levelno >= self.level and self.filter(record):
+                        self.emit(record)
+            finally:
+                self._batching = False
+            self.flush()
+        finally:
+            self.release()
+
+
+class _FastRotatingFileHandler(_BatchFlushMixin, logging.handlers.RotatingFileHandler):
+    """Rotating file handler that avoids per-record rollover checks.
+    
+    The file size is tracked from what this handler writes, so records that
+    are clearly below maxBytes skip the stat calls and seek in the base
+    shouldRollover().
+    """
+    
+    def __init__(self, *args, **kwargs):
+        """Initialize handler and record the current file size."""
+        super().__init__(*args, **kwargs)
+        try:
+            self._approx_size = os.path.getsize(self.baseFilename)
+        except OSError:
+            self._approx_size = 0
+        self._last_length = 0
+    
+    def format(self, record):
+        """Format record, remembering the size in bytes of the line it produces."""
+        msg = super().format(record)
+        line = msg + self.terminator
+        # maxBytes counts bytes; str.isascii() is O(1), so only non-ASCII
+        # lines pay for encoding
+        if line.isascii():
+            self._last_length = len(line)
+        else:
+            stream = self.stream
+            encoding = stream.encoding if stream is not None else (self.encoding or 'utf-8')
+            self._last_length = len(line.encode(encoding, errors='replace'))
+        return msg
+    
+    def emit(self, record):
+        """Write record and account for it in the tracked size."""
+        super().emit(record)
+        self._approx_size += self._last_length
+    
+    def shouldRollover(self, record):
+        """Check for rollover, using the stat-based check only near maxBytes."""
+        if self.maxBytes <= 0:
+            return False
+        if (not record.exc_info and self._approx_size + 4 * len(record.getMessage())
+                + _ROLLOVER_MARGIN < self.maxBytes):
+            return False
+        
+        should = super().shouldRollover(record)
+        if self.stream is not None:
+            # The base check seeks to the end, so resync with the real size
+            self._approx_size = self.stream.tell()
+        return should
+    
+    def doRollover(self):
+        """Roll over and restart the tracked size."""
+        super().doRollover()
+        self._approx_size = 0
+
+
+class _WatchedFileHandler(_BatchFlushMixin, logging.handlers.WatchedFileHandler):
+    """Watched file handler for logs rotated by an external tool.
+    
+    Reopens the file when logrotate(8) moves or truncates it, instead of
+    checking the file size and rotating in-process. Suits a logrotate entry
+    using either ``copytruncate`` or the default ``create``.
+    """
+
+
+class _BatchingMemoryHandler(logging.handlers.MemoryHandler):
+    """Buffer records for a batch-flushing file handler and write them in batches.
+    
+    The buffer is written when it fills up, on ERROR or above, and at least
+    every _FILE_FLUSH_INTERVAL seconds from a background thread.
+    """
+    
+    def __init__(self, target: _BatchFlushMixin):
+        """Initialize batching handler.
+        
+        Args:
+            target: File handler to write batches to
+        """
+        super().__init__(_FILE_BUFFER_CAPACITY, flushLevel=logging.ERROR, target=target)
+        self._closed = threading.Event()
+        self._flusher = threading.Thread(target=self._flush_periodically, daemon=True)
+        self._flusher.start()
+    
+    def _flush_periodically(self) -> None:
+        """Write out buffered records until the handler is closed."""
+        while not self._closed.wait(_FILE_FLUSH_INTERVAL):
+            self.flush()
+    
+    def flush(self):
+        """Write all buffered records to the target in one batch."""
+        self.acquire()
+        try:
+            if self.target is not None and self.buffer:
+                self.target.emit_batch(self.buffer)
+                self.buffer = []
+        finally:
+            self.release()
+    
+    def close(self):
+        """Stop the flush thread, write out the buffer and close."""
+        self._closed.set()
+        super().close()
+
+
+def _build_file_handler(log_path: Path, max_bytes: int, backup_count: int,
+                        formatter: logging.Formatter,
+                        rotation_mode: str = 'internal') -> logging.Handler:
+    """Create the batching handler chain for a log file.
+    
+    Args:
+        log_path: Path to log file
+        max_bytes: Maximum file size in bytes
+        backup_count: Number of backup files to keep
+        formatter: Formatter for file output
+        rotation_mode: 'internal' to rotate by size in-process, 'external'
+            to leave rotation to logrotate (ignored on Windows)
+        
+    Returns:
+        Handler to attach (buffers in front of the file handler)
+    """
+    if rotation_mode not in ROTATION_MODES:
+        raise ValueError(f"Invalid log rotation mode: {rotation_mode}")
+    
+    if rotation_mode == 'external' and os.name != 'nt':
+        file_handler = _WatchedFileHandler(log_path)
+    else:
+        file_handler = _FastRotatingFileHandler(
+            log_path,
+            maxBytes=max_bytes,
+            backupCount=backup_count
+        )
+    file_handler.setLevel(logging.DEBUG)  # File gets all messages
+    file_handler.setFormatter(formatter)
+    
+    handler = _BatchingMemoryHandler(file_handler)
+    handler.setLevel(logging.DEBUG)
+    return handler
+
+
+def _get_file_handler(handler: logging.Handler) -> Optional[logging.FileHandler]:
+    """Get the file handler a handler writes to, if any.
+    
+    Args:
+        handler: Handler to inspect
+        
+    Returns:
+        The handler itself or its buffered target if a file handler, else None
+    """
+    if isinstance(handler, logging.handlers.MemoryHandler):
+        handler = handler.target
+    return handler if isinstance(handler, logging.FileHandler) else None
+
+
+def _close_handler(handler: logging.Handler) -> None:
+    """Close a handler along with the target it buffers for.
+    
+    Args:
+        handler: Handler to close
+    """
+    target = handler.target if isinstance(handler, logging.handlers.MemoryHandler) else None
+    handler.close()
+    if target is not None:
+        target.close()
+
+
+@lru_cache(maxsize=1)
+def _install_thirdparty_levels() -> None:
+    """Quiet chatty third-party loggers, once per process."""
+    logging.getLogger('requests').setLevel(logging.WARNING)
+    logging.getLogger('urllib3').setLevel(logging.WARNING)
+
+
+def setup_logger(verbose: bool = False, log_file: Optional[str] = None,
+                 rotation_mode: str = 'internal') -> None:
     """Setup application logging.
     
     Args:
         verbose: Enable verbose (DEBUG) logging
         log_file: Path to log file
+        rotation_mode: 'internal' or 'external' log file rotation
     """
-    global _logger_configured
+    global _logger_configured, _console_handler
     
     if _logger_configured:
         return
@@ -31,42 +475,43 @@ def setup_logger(verbose: bool = False, log_file: Optional[str] = None) -> None:
     root_logger = logging.getLogger()
     root_logger.setLevel(log_level)
     
-    # Clear existing handlers
-    root_logger.handlers.clear()
-    
     # Create formatter
-    formatter = logging.Formatter(
-        '%(asctime)s - %(name)s - %(levelname)s - %(message)s',
+    formatter = _FastPctFormatter(
+        _LOG_FORMAT,
         datefmt='%Y-%m-%d %H:%M:%S'
     )
     
     # Console handler
-    console_handler = logging.StreamHandler(sys.stdout)
+    console_handler = _console_handler = _BufferedConsoleHandler(sys.stdout)
     console_handler.setLevel(log_level)
     console_handler.setFormatter(formatter)
-    root_logger.addHandler(console_handler)
+    handlers: List[logging.Handler] = [console_handler]
     
-    # File handler if specified
+    # File handler if specified; a failure is logged once handlers are live
+    file_error = None
     if log_file:
         try:
             log_path = Path(log_file)
             log_path.parent.mkdir(parents=True, exist_ok=True)
             
-            file_handler = logging.handlers.RotatingFileHandler(
+            handlers.append(_build_file_handler(
                 log_path,
-                maxBytes=10 * 1024 * 1024,  # 10MB
-                backupCount=5
-            )
-            file_handler.setLevel(logging.DEBUG)  # File gets all messages
-            file_handler.setFormatter(formatter)
-            root_logger.addHandler(file_handler)
+                10 * 1024 * 1024,  # 10MB
+                5,
+                formatter,
+                rotation_mode
+            ))
             
         except Exception as e:
-            root_logger.error(f"Failed to setup file logging: {e}")
+            file_error = e
     
-    # Set up third-party logger levels
-    logging.getLogger('requests').setLevel(logging.WARNING)
-    logging.getLogger('urllib3').setLevel(logging.WARNING)
+    # Replaces any existing handlers
+    _install_handlers(handlers)
+    
+    if file_error is not None:
+        root_logger.error(f"Failed to setup file logging: {file_error}")
+    
+    _install_thirdparty_levels()
     
     _logger_configured = True
     
@@ -75,9 +520,13 @@ def setup_logger(verbose: bool = False, log_file: Optional[str] = None) -> None:
     logger.info(f"Logging configured (level: {logging.getLevelName(log_level)})")
 
 
+@lru_cache(maxsize=256)
 def get_logger(name: str) -> logging.Logger:
     """Get logger instance for module.
     
+    Loggers live for the whole process, so the lookup is cached to skip
+    the logging module's lock on repeat calls.
+    
     Args:
         name: Logger name (usually __name__)
         
@@ -98,23 +547,24 @@ def set_log_level(level: str) -> None:
         logging.getLogger().setLevel(numeric_level)
         
         # Update console handler level
-        for handler in logging.getLogger().handlers:
-            if isinstance(handler, logging.StreamHandler) and handler.stream == sys.stdout:
-                handler.setLevel(numeric_level)
-                break
-                
+        if _console_handler is not None:
+            _console_handler.setLevel(numeric_level)
+        
     except AttributeError:
         logger = get_logger(__name__)
         logger.error(f"Invalid log level: {level}")
 
 
-def configure_file_logging(log_file: str, max_size: int = 10 * 1024 * 1024, backup_count: int = 5) -> bool:
+def configure_file_logging(log_file: str, max_size: int = 10 * 1024 * 1024, backup_count: int = 5,
+                           rotation_mode: str = 'internal') -> bool:
     """Configure file logging.
     
     Args:
         log_file: Path to log file
-        max_size: Maximum file size in bytes
-        backup_count: Number of backup files to keep
+        max_size: Maximum file size in bytes (internal rotation only)
+        backup_count: Number of backup files to keep (internal rotation only)
+        rotation_mode: 'internal' to rotate by size in-process, 'external'
+            to reopen the file after logrotate moves or truncates it
         
     Returns:
         True if configured successfully
@@ -123,29 +573,26 @@ def configure_file_logging(log_file: str, max_size: int = 10 * 1024 * 1024, back
         log_path = Path(log_file)
         log_path.parent.mkdir(parents=True, exist_ok=True)
         
-        # Remove existing file handlers
-        root_logger = logging.getLogger()
-        for handler in root_logger.handlers[:]:
-            if isinstance(handler, logging.FileHandler):
-                root_logger.removeHandler(handler)
-        
-        # Create new file handler
-        file_handler = logging.handlers.RotatingFileHandler(
-            log_path,
-            maxBytes=max_size,
-            backupCount=backup_count
-        )
-        file_handler.setLevel(logging.DEBUG)
+        # Keep everything except existing file handlers
+        handlers = []
+        old_file_handlers = []
+        for handler in _get_handlers():
+            if _get_file_handler(handler) is not None:
+                old_file_handlers.append(handler)
+            else:
+                handlers.append(handler)
         
         # Set formatter
-        formatter = logging.Formatter(
-            '%(asctime)s - %(name)s - %(levelname)s - %(message)s',
+        formatter = _FastPctFormatter(
+            _LOG_FORMAT,
             datefmt='%Y-%m-%d %H:%M:%S'
         )
-        file_handler.setFormatter(formatter)
         
-        # Add to root logger
-        root_logger.addHandler(file_handler)
+        # Swap the file handler in behind the queue listener
+        handlers.append(_build_file_handler(log_path, max_size, backup_count, formatter, rotation_mode))
+        _install_handlers(handlers)
+        for handler in old_file_handlers:
+            _close_handler(handler)
         
         logger = get_logger(__name__)
         logger.info(f"File logging configured: {log_file}")
@@ -164,45 +611,104 @@ def get_log_file_path() -> Optional[Path]:
     Returns:
         Path to log file or None if not configured
     """
-    root_logger = logging.getLogger()
-    
-    for handler in root_logger.handlers:
-        if isinstance(handler, logging.FileHandler):
-            return Path(handler.baseFilename)
+    for handler in _get_handlers():
+        file_handler = _get_file_handler(handler)
+        if file_handler is not None:
+            return Path(file_handler.baseFilename)
     
     return None
 
 
 def disable_logging() -> None:
     """Disable all logging."""
-    logging.disable(logging.CRITICAL)
+    global _logging_disabled
+    
+    # logging.disable() clears every logger's level cache, so only call it
+    # when the state actually changes
+    if not _logging_disabled:
+        logging.disable(logging.CRITICAL)
+        _logging_disabled = True
 
 
 def enable_logging() -> None:
     """Re-enable logging."""
-    logging.disable(logging.NOTSET)
+    global _logging_disabled
+    
+    if _logging_disabled:
+        logging.disable(logging.NOTSET)
+        _logging_disabled = False
+
+
+def is_enabled() -> bool:
+    """Check whether logging is enabled.
+    
+    Lets hot callers skip building log arguments while disable_logging()
+    is in effect.
+    
+    Returns:
+        False between disable_logging() and enable_logging(), else True
+    """
+    return not _logging_disabled
+
+
+class _CaptureHandler(logging.Handler):
+    """Handler that appends records to a sink without taking the I/O lock."""
+    
+    def __init__(self, sink: Deque[logging.LogRecord], level: int = logging.NOTSET):
+        """Initialize capture handler.
+        
+        Args:
+            sink: Deque that receives captured records
+            level: Minimum log level to capture
+        """
+        super().__init__(level)
+        self._append = sink.append
+    
+    def handle(self, record: logging.LogRecord) -> bool:
+        """Filter and capture a record.
+        
+        Skips the per-record lock, since deque.append is already atomic.
+        
+        Args:
+            record: Log record
+        
+        Returns:
+            Whether the record passed the filters
+        """
+        rv = self.filter(record)
+        if rv:
+            self._append(rv if isinstance(rv, logging.LogRecord) else record)
+        return bool(rv)
+    
+    def emit(self, record: logging.LogRecord) -> None:
+        """Capture a record.
+        
+        Args:
+            record: Log record
+        """
+        self._append(record)
 
 
 class LogCapture:
     """Context manager for capturing log messages."""
     
-    def __init__(self, logger_name: str = '', level: int = logging.INFO):
+    def __init__(self, logger_name: str = '', level: int = logging.INFO, maxlen: Optional[int] = None):
         """Initialize log capture.
         
         Args:
             logger_name: Name of logger to capture (empty for root)
             level: Minimum log level to capture
+            maxlen: Keep only the most recent records (unbounded if None)
         """
         self.logger_name = logger_name
         self.level = level
         self.handler = None
-        self.messages = []
+        self.messages: Deque[logging.LogRecord] = collections.deque(maxlen=maxlen)
+        self._formatter = logging.Formatter('%(levelname)s - %(message)s')
     
     def __enter__(self):
         """Start capturing log messages."""
-        self.handler = logging.Handler()
-        self.handler.setLevel(self.level)
-        self.handler.emit = self._capture_message
+        self.handler = _CaptureHandler(self.messages, self.level)
         
         logger = logging.getLogger(self.logger_name)
         logger.addHandler(self.handler)
@@ -216,34 +722,39 @@ class LogCapture:
             logger.removeHandler(self.handler)
             self.handler = None
     
-    def _capture_message(self, record):
-        """Capture log message.
-        
-        Args:
-            record: Log record
-        """
-        self.messages.append(record)
-    
-    def get_messages(self) -> list:
+    def get_messages(self) -> List[logging.LogRecord]:
         """Get captured messages.
         
         Returns:
             List of log records
         """
-        return self.messages
+        return list(self.messages)
     
-    def get_message_strings(self) -> list:
+    def get_message_strings(self) -> List[str]:
         """Get captured messages as strings.
         
         Returns:
             List of formatted log messages
         """
-        formatter = logging.Formatter('%(levelname)s - %(message)s')
-        return [formatter.format(record) for record in self.messages]
+        return list(self.iter_message_strings())
+    
+    def iter_message_strings(self) -> Iterator[str]:
+        """Format captured messages lazily.
+        
+        Yields:
+            Formatted log messages
+        """
+        formatter = self._formatter
+        for record in self.messages:
+            yield formatter.format(record)
 
 
-class ColoredFormatter(logging.Formatter):
-    """Colored log formatter for terminal output."""
+class ColoredFormatter(_FastPctFormatter):
+    """Colored log formatter for terminal output.
+    
+    Always adds color; setup_colored_logging() only uses it when stdout
+    is a terminal.
+    """
     
     # ANSI color codes
     COLORS = {
@@ -255,27 +766,31 @@ class ColoredFormatter(logging.Formatter):
         'RESET': '\033[0m'       # Reset
     }
     
-    def format(self, record):
-        """Format log record with colors.
+    def __init__(self, *args, **kwargs):
+        """Initialize formatter and build the per-level color prefixes."""
+        super().__init__(*args, **kwargs)
+        
+        self._reset = self.COLORS['RESET']
+        # Unknown levels get no prefix but still the reset suffix
+        self._prefix = {level: color for level, color in self.COLORS.items() if level != 'RESET'}
+    
+    def formatMessage(self, record):
+        """Render the log line wrapped in the record level's color.
+        
+        The default layout is colored inside a single f-string; exception
+        text appended by format() is left uncolored.
         
         Args:
-            record: Log record
+            record: Log record, with message and asctime already set
             
         Returns:
-            Formatted log message
+            Colored log line (without exception text)
         """
-        # Get color for log level
-        color = self.COLORS.get(record.levelname, '')
-        reset = self.COLORS['RESET']
-        
-        # Format message
-        formatted = super().format(record)
-        
-        # Add color if terminal supports it
-        if sys.stdout.isatty():
-            formatted = f"{color}{formatted}{reset}"
-        
-        return formatted
+        prefix = self._prefix.get(record.levelname, '')
+        if self._fast:
+            return (f"{prefix}{record.asctime} - {record.name} - {record.levelname} - "
+                    f"{record.message}{self._reset}")
+        return f"{prefix}{super().formatMessage(record)}{self._reset}"
 
 
 def setup_colored_logging(verbose: bool = False) -> None:
@@ -284,7 +799,7 @@ def setup_colored_logging(verbose: bool = False) -> None:
     Args:
         verbose: Enable verbose logging
     """
-    global _logger_configured
+    global _logger_configured, _console_handler
     
     if _logger_configured:
         return
@@ -296,24 +811,22 @@ def setup_colored_logging(verbose: bool = False) -> None:
     root_logger = logging.getLogger()
     root_logger.setLevel(log_level)
     
-    # Clear existing handlers
-    root_logger.handlers.clear()
-    
-    # Create colored formatter
-    formatter = ColoredFormatter(
-        '%(asctime)s - %(name)s - %(levelname)s - %(message)s',
+    # Create colored formatter if the terminal supports it
+    formatter_class = ColoredFormatter if sys.stdout.isatty() else _FastPctFormatter
+    formatter = formatter_class(
+        _LOG_FORMAT,
         datefmt='%Y-%m-%d %H:%M:%S'
     )
     
     # Console handler with colors
-    console_handler = logging.StreamHandler(sys.stdout)
+    console_handler = _console_handler = _BufferedConsoleHandler(sys.stdout)
     console_handler.setLevel(log_level)
     console_handler.setFormatter(formatter)
-    root_logger.addHandler(console_handler)
     
-    # Set up third-party logger levels
-    logging.getLogger('requests').setLevel(logging.WARNING)
-    logging.getLogger('urllib3').setLevel(logging.WARNING)
+    # Replaces any existing handlers
+    _install_handlers([console_handler])
+    
+    _install_thirdparty_levels()
     
     _logger_configured = True
     
@@ -331,16 +844,28 @@ def log_function_call(func):
     Returns:
         Decorated function
     """
+    logger = get_logger(func.__module__)
+    # Bound once so the DEBUG-off path costs one cached level check per call;
+    # the decision stays per call because levels are usually set after import
+    debug_enabled = partial(logger.isEnabledFor, logging.DEBUG)
+    name = func.__name__
+    
+    @wraps(func)
     def wrapper(*args, **kwargs):
-        logger = get_logger(func.__module__)
-        logger.debug(f"Calling {func.__name__} with args={args}, kwargs={kwargs}")
+        if not debug_enabled():
+            try:
+                return func(*args, **kwargs)
+            except Exception as e:
+                logger.error("%s raised exception: %s", name, e)
+                raise
         
+        logger.debug("Calling %s with args=%s, kwargs=%s", name, args, kwargs)
         try:
             result = func(*args, **kwargs)
-            logger.debug(f"{func.__name__} returned: {result}")
+            logger.debug("%s returned: %s", name, result)
             return result
         except Exception as e:
-            logger.error(f"{func.__name__} raised exception: {e}")
+            logger.error("%s raised exception: %s", name, e)
             raise
     
-    return wrapper
\ No newline at end of file
+    return wrapper
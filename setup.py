@@ -3,13 +3,22 @@
 Package setup and installation configuration for not-warrior.
 """
 
+import ast
+import os
+
 from setuptools import setup, find_packages
 from pathlib import Path
 
-# Read version from __init__.py
-version = {}
-with open(Path(__file__).parent / "not_warrior" / "__init__.py") as f:
-    exec(f.read(), version)
+# Read version from __init__.py without executing it
+init_source = (Path(__file__).parent / "not_warrior" / "__init__.py").read_text(encoding="utf-8")
+for node in ast.parse(init_source).body:
+    if isinstance(node, ast.Assign) and any(
+        isinstance(target, ast.Name) and target.id == "__version__" for target in node.targets
+    ):
+        __version__ = ast.literal_eval(node.value)
+        break
+else:
+    raise RuntimeError("Unable to find __version__ in not_warrior/__init__.py")
 
 # Read README for long description
 readme_path = Path(__file__).parent / "README.md"
@@ -28,15 +37,38 @@ else:
     requirements = [
         "click>=8.0.0",
         "requests>=2.28.0",
+        "urllib3>=1.26.0",
         "python-dateutil>=2.8.0",
-        "pydantic>=1.10.0",
+        "pydantic>=1.10.0,<2",
         "PyYAML>=6.0",
         "python-dotenv>=0.19.0"
     ]
 
+# Optionally compile the per-task hot paths with Cython. Opt-in because the
+# pure-Python modules remain the reference implementation; set
+# NOT_WARRIOR_CYTHONIZE=1 with Cython installed to build the extensions.
+ext_modules = []
+if os.environ.get("NOT_WARRIOR_CYTHONIZE") == "1":
+    from Cython.Build import cythonize
+
+    ext_modules = cythonize(
+        [
+            "not_warrior/models/mapping.py",
+            "not_warrior/models/task.py",
+        ],
+        language_level=3,
+        compiler_directives={
+            # Keep Python-level function objects so pydantic can still
+            # introspect validators and annotations
+            "binding": True,
+            "boundscheck": False,
+            "wraparound": False,
+        },
+    )
+
 setup(
     name="not-warrior",
-    version=version["__version__"],
+    version=__version__,
     author="Your Name",
     author_email="your.email@example.com",
     description="Notion-Taskwarrior Synchronization Service",
@@ -44,6 +76,7 @@ setup(
     long_description_content_type="text/markdown",
     url="https://github.com/your-username/not-warrior",
     packages=find_packages(),
+    ext_modules=ext_modules,
     classifiers=[
         "Development Status :: 3 - Alpha",
         "Intended Audience :: Developers",
@@ -76,6 +109,15 @@ setup(
             "pytest-mock>=3.8.0",
             "responses>=0.21.0",
         ],
+        "async": [
+            "httpx[http2]>=0.23.0",
+        ],
+        "stream": [
+            "ijson>=3.1",
+        ],
+        "hash": [
+            "xxhash>=3.0",
+        ],
     },
     entry_points={
         "console_scripts": [